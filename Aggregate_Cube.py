@@ -0,0 +1,229 @@
+import pandas as pd
+import numpy as np
+from Mergeable_Summary_Statistics import merge_moment_frames
+from Stage_Instrumentation import traced
+
+# Dimensions the dashboards and reports slice ratings by
+CUBE_DIMENSIONS = ['Genre', 'Language', 'Release_Year', 'Content_Type', 'Budget_Category']
+
+# Mergeable moments kept per cell and how each one combines across cells;
+# the mean and m2 (sum of squared deviations) merge with Chan's formulas
+CUBE_MOMENTS = {
+    'rows': 'sum',
+    'count': 'sum',
+    'min': 'min',
+    'max': 'max'
+}
+CUBE_COLUMNS = ['rows', 'count', 'mean', 'm2', 'min', 'max']
+
+
+def combine_cells(cells, levels=None, dropna=False):
+    """Cells rolled up to the index `levels` (one row when None)"""
+    if levels:
+        combined = cells.groupby(level=levels, observed=True, dropna=dropna).agg(CUBE_MOMENTS)
+    else:
+        combined = cells.agg(CUBE_MOMENTS).to_frame().T
+    moments = merge_moment_frames(cells, levels, dropna)
+    combined['mean'] = moments['mean'].to_numpy()
+    combined['m2'] = moments['m2'].to_numpy()
+    return combined[CUBE_COLUMNS]
+
+
+class NetflixAggregateCube:
+    def __init__(self, dimensions=None, measure='IMDb_Rating'):
+        self.dimensions = list(dimensions) if dimensions is not None else list(CUBE_DIMENSIONS)
+        self.measure = measure
+        self.cells = None
+        self._rollup_cache = {}
+
+    @traced()
+    def build(self, df):
+        """Materialize mergeable moments for every combination of the cube dimensions"""
+        self.dimensions = [dim for dim in self.dimensions if dim in df.columns]
+        values = pd.to_numeric(df[self.measure], errors='coerce')
+
+        frame = df[self.dimensions].copy()
+        frame['_value'] = values
+
+        if self.dimensions:
+            grouped = frame.groupby(self.dimensions, observed=True, dropna=False)
+            count = grouped['_value'].count()
+            self.cells = pd.DataFrame({
+                'rows': grouped.size(),
+                'count': count,
+                'mean': grouped['_value'].mean(),
+                # Welford's per-group variance, so m2 is accurate for large offsets
+                'm2': (grouped['_value'].var(ddof=0) * count).fillna(0.0),
+                'min': grouped['_value'].min(),
+                'max': grouped['_value'].max()
+            })
+        else:
+            count = frame['_value'].count()
+            self.cells = pd.DataFrame({
+                'rows': [len(frame)],
+                'count': [count],
+                'mean': [frame['_value'].mean()],
+                'm2': [float(np.nan_to_num(frame['_value'].var(ddof=0) * count))],
+                'min': [frame['_value'].min()],
+                'max': [frame['_value'].max()]
+            })
+
+        self._rollup_cache = {}
+        return self
+
+    def merge(self, other):
+        """Combine another cube built over the same dimensions (e.g. a new partition)"""
+        if self.cells is None:
+            self.dimensions = list(other.dimensions)
+            self.cells = other.cells.copy()
+        else:
+            if list(other.dimensions) != self.dimensions or other.measure != self.measure:
+                raise ValueError("Cannot merge cubes with different dimensions or measures")
+            self.cells = combine_cells(pd.concat([self.cells, other.cells]), self.dimensions or None)
+
+        self._rollup_cache = {}
+        return self
+
+    def update(self, added=None, removed=None, extremes=None):
+        """Add new rows and retract removed (or superseded) rows without a rebuild
+
+        Counts are added and subtracted cell by cell and the mean and m2
+        merged with Chan's formulas (a retraction is a negative count). Min and max
+        cannot be retracted, so the cells that lost rows take theirs from
+        `extremes(cells)`, which returns the current min and max of those
+        cells (e.g. GroupedOrderStatistics.extremes over the cube dimensions).
+        """
+        deltas = []
+        if added is not None and len(added):
+            deltas.append(NetflixAggregateCube(self.dimensions, self.measure).build(added).cells)
+        if removed is not None and len(removed):
+            if extremes is None:
+                raise ValueError("Retracting rows needs the per-cell extremes to refresh min/max")
+            retracted = NetflixAggregateCube(self.dimensions, self.measure).build(removed).cells.copy()
+            retracted[['rows', 'count', 'm2']] = -retracted[['rows', 'count', 'm2']]
+            retracted[['min', 'max']] = np.nan
+            deltas.append(retracted)
+        if not deltas:
+            return self
+
+        combined = combine_cells(pd.concat([self.cells] + deltas), self.dimensions or None)
+        self.cells = combined[combined['rows'] > 0] if self.dimensions else combined
+
+        if removed is not None and len(removed):
+            touched = self.cells.index.intersection(retracted.index)
+            self.cells.loc[touched, ['min', 'max']] = extremes(touched)[['min', 'max']].to_numpy()
+
+        self._rollup_cache = {}
+        return self
+
+    def _finalize(self, moments):
+        """Derive variance and standard deviation from the merged moments"""
+        result = moments.copy()
+        count = result['count'].astype(float)
+
+        # Sample variance (ddof=1) to match pandas .std()/.var()
+        result['var'] = result['m2'] / (count - 1).where(count > 1)
+        result['std'] = np.sqrt(result['var'])
+        return result
+
+    def rollup(self, by=None):
+        """Aggregate cells up to the requested dimensions (None for the grand total)"""
+        if isinstance(by, str):
+            by = [by]
+        by = tuple(by or ())
+
+        if by not in self._rollup_cache:
+            missing = [dim for dim in by if dim not in self.dimensions]
+            if missing:
+                raise KeyError(f"Dimensions not in cube: {missing}")
+
+            if by:
+                moments = combine_cells(self.cells, list(by), dropna=True)
+            else:
+                moments = combine_cells(self.cells).set_axis(['All'])
+                moments = moments.astype({'rows': 'int64', 'count': 'int64'})
+            self._rollup_cache[by] = self._finalize(moments)
+
+        return self._rollup_cache[by]
+
+    def slice(self, **filters):
+        """Return a sub-cube restricted to the given dimension values
+
+        Each filter is a single value, a list of values, or an inclusive
+        (low, high) tuple for ordered dimensions such as Release_Year.
+        """
+        mask = np.ones(len(self.cells), dtype=bool)
+
+        for dim, value in filters.items():
+            if dim not in self.dimensions:
+                raise KeyError(f"Dimension not in cube: {dim}")
+            level = self.cells.index.get_level_values(dim)
+
+            if isinstance(value, tuple):
+                low, high = value
+                mask &= np.asarray((level >= low) & (level <= high))
+            elif isinstance(value, (list, set)):
+                mask &= np.asarray(level.isin(list(value)))
+            else:
+                mask &= np.asarray(level == value)
+
+        sub_cube = NetflixAggregateCube(self.dimensions, self.measure)
+        sub_cube.cells = self.cells[mask]
+        return sub_cube
+
+    def query(self, by=None, **filters):
+        """Slice the cube and roll the result up in one call"""
+        return self.slice(**filters).rollup(by) if filters else self.rollup(by)
+
+    def save(self, path):
+        """Persist the materialized cells to disk"""
+        pd.to_pickle({
+            'dimensions': self.dimensions,
+            'measure': self.measure,
+            'cells': self.cells
+        }, path)
+        print(f"💾 Cube saved to {path} ({len(self.cells)} cells)")
+
+    @classmethod
+    def load(cls, path):
+        """Load a cube previously written with save()"""
+        state = pd.read_pickle(path)
+        cube = cls(state['dimensions'], state['measure'])
+        cube.cells = state['cells']
+        return cube
+
+    def summary(self):
+        """Print a short description of the materialized cube"""
+        print("🧊 AGGREGATE CUBE SUMMARY")
+        print("=" * 50)
+        print(f"Measure: {self.measure}")
+        print(f"Dimensions: {self.dimensions}")
+        print(f"Materialized cells: {len(self.cells)}")
+        print(f"Rows covered: {int(self.cells['rows'].sum())}")
+
+
+# Example usage
+if __name__ == "__main__":
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    df = NetflixCatalogueGenerator(n_rows=500, seed=42).to_frame()
+    df['Budget_Category'] = pd.qcut(df['Budget_Million_USD'], 3, labels=['Low', 'Medium', 'High']).astype(str)
+
+    cube = NetflixAggregateCube().build(df)
+    cube.summary()
+
+    print("\n🎭 Rating by Genre (from cube):")
+    print(cube.rollup('Genre')[['count', 'mean', 'std']].round(2))
+
+    print("\n🇰🇷 Korean Dramas 2020-2023 (from cube):")
+    print(cube.query(Genre='Drama', Language='Korean', Release_Year=(2020, 2023))[['count', 'mean', 'std']].round(2))
+
+    # Moments stay exact when the values are large next to their spread
+    rng = np.random.default_rng(0)
+    offset = pd.DataFrame({'Genre': rng.choice(['Drama', 'Comedy'], 1_000_000),
+                           'Score': 1e6 + rng.normal(0, 0.01, 1_000_000)})
+    halves = [NetflixAggregateCube(['Genre'], 'Score').build(part) for part in (offset[:500_000], offset[500_000:])]
+    merged = halves[0].merge(halves[1]).rollup('Genre')['std']
+    expected = offset.groupby('Genre')['Score'].std()
+    print(f"\n✅ std of 1e6 + N(0, 0.01) from two merged cubes: {merged.round(5).to_dict()} "
+          f"(pandas {expected.round(5).to_dict()}), match: {np.allclose(merged, expected, rtol=1e-6)}")
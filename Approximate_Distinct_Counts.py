@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+from Stage_Instrumentation import traced
+
+# 2^14 registers (16 KB per column) give a ~0.8% standard error
+HLL_PRECISION = 14
+
+# Columns with at most this many distinct values are counted and listed exactly
+EXACT_DISTINCT_LIMIT = 1_000
+
+# Rows hashed per chunk; memory for a column never grows past one chunk
+DISTINCT_CHUNK_ROWS = 1_000_000
+
+
+def _distinct_hashes(values):
+    """Distinct non-missing values of a chunk and their 64-bit hashes
+
+    Hashing only the distinct values is enough for the registers, and
+    categorize=False skips pandas' own factorize pass (4x faster on titles).
+    """
+    uniques = np.asarray(pd.unique(pd.Series(values).dropna()))
+    return uniques, pd.util.hash_array(uniques, categorize=False)
+
+
+class DistinctCountSketch:
+    """Mergeable HyperLogLog distinct counter
+
+    Distinct values are also kept exactly while there are at most
+    `exact_limit` of them, so low-cardinality columns (genres, languages)
+    get exact counts and listings; past that only the fixed-size register
+    array is kept.
+    """
+
+    def __init__(self, precision=HLL_PRECISION, exact_limit=EXACT_DISTINCT_LIMIT):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+        self.exact = set()
+        self.is_exact = True
+
+    @classmethod
+    def from_values(cls, values, precision=HLL_PRECISION, exact_limit=EXACT_DISTINCT_LIMIT):
+        """Build a sketch from one chunk of a column"""
+        sketch = cls(precision, exact_limit)
+        sketch.update(values)
+        return sketch
+
+    def update(self, values):
+        """Add one chunk of values"""
+        uniques, hashes = _distinct_hashes(values)
+        if len(hashes) == 0:
+            return self
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        # Rank = position of the first 1-bit in the remaining 64-p bits, from
+        # the bit length frexp reports (the float conversion is exact for p >= 11)
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (64 - p - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+        if self.is_exact:
+            if len(uniques) > self.exact_limit:
+                self.exact = set()
+                self.is_exact = False
+            else:
+                self.exact.update(uniques.tolist())
+                self._check_exact()
+        return self
+
+    def _check_exact(self):
+        if len(self.exact) > self.exact_limit:
+            self.exact = set()
+            self.is_exact = False
+
+    def merge(self, other):
+        """Combine two sketches of the same column (e.g. from two chunks)"""
+        if other.precision != self.precision:
+            raise ValueError("Only sketches with the same precision can be merged")
+        merged = DistinctCountSketch(self.precision, self.exact_limit)
+        merged.registers = np.maximum(self.registers, other.registers)
+        merged.is_exact = self.is_exact and other.is_exact
+        if merged.is_exact:
+            merged.exact = self.exact | other.exact
+            merged._check_exact()
+        return merged
+
+    @property
+    def relative_error(self):
+        """Standard error of the HyperLogLog estimate"""
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def estimate(self):
+        """HyperLogLog estimate with the small-range (linear counting) correction"""
+        m = len(self.registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * m and zeros:
+            return m * np.log(m / zeros)
+        return raw
+
+    def count(self):
+        """Exact distinct count while exact, HyperLogLog estimate otherwise"""
+        return len(self.exact) if self.is_exact else int(round(self.estimate()))
+
+    def values(self):
+        """Sorted distinct values (only available while the sketch is exact)"""
+        if not self.is_exact:
+            raise ValueError(f"More than {self.exact_limit} distinct values; only the count is kept")
+        return sorted(self.exact)
+
+
+@traced()
+def categorical_cardinality(df, columns=None, chunk_rows=DISTINCT_CHUNK_ROWS,
+                            precision=HLL_PRECISION, exact_limit=EXACT_DISTINCT_LIMIT):
+    """One DistinctCountSketch per column, built chunk by chunk and merged"""
+    columns = list(df.columns) if columns is None else list(columns)
+    sketches = {col: DistinctCountSketch(precision, exact_limit) for col in columns}
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        for col in columns:
+            sketches[col] = sketches[col].merge(DistinctCountSketch.from_values(chunk[col], precision, exact_limit))
+    return sketches
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    df = NetflixCatalogueGenerator(n_rows=2_000_000, seed=42).to_frame()
+    columns = ['Title', 'Genre', 'Language', 'Content_Type']
+
+    start = time.perf_counter()
+    sketches = categorical_cardinality(df, columns, chunk_rows=500_000)
+    sketch_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    exact = {col: df[col].nunique() for col in columns}
+    exact_ms = (time.perf_counter() - start) * 1000
+
+    print("🔢 DISTINCT COUNTS")
+    for col, sketch in sketches.items():
+        kind = 'exact' if sketch.is_exact else f'HLL ±{sketch.relative_error:.1%}'
+        error = abs(sketch.count() - exact[col]) / exact[col]
+        print(f"   {col:<14} {sketch.count():>10,} ({kind})  nunique: {exact[col]:>10,}  error: {error:.2%}")
+    print(f"\n⏱️  Sketches (4 chunks, merged): {sketch_ms:.0f} ms, nunique(): {exact_ms:.0f} ms")
+    print(f"✅ Genre listing matches: {sketches['Genre'].values() == sorted(df['Genre'].unique())}")
@@ -0,0 +1,256 @@
+import json
+import os
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from Stage_Instrumentation import peak_rss_mb
+
+PIPELINE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(PIPELINE_DIR, 'benchmark_results.json')
+
+DEFAULT_SCALES = [1_000, 100_000, 1_000_000, 10_000_000]
+STAGE_TIMEOUT_S = 1800
+
+OUTLIER_RENAMES = {'IMDb_Rating': 'IMDB Score', 'Runtime_Minutes': 'Runtime', 'Release_Year': 'Year'}
+PATTERN_RENAMES = {'IMDb_Rating': 'IMDB Score', 'Runtime_Minutes': 'Runtime', 'Release_Date': 'Premiere'}
+
+
+def _catalogue(n_rows, with_defects=True):
+    """Benchmark input: the shared synthetic catalogue, optionally with nulls and outliers"""
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+    rates = {'null_rate': 0.03, 'outlier_rate': 0.01} if with_defects else {}
+    return NetflixCatalogueGenerator(n_rows=n_rows, seed=42, **rates).to_frame()
+
+
+# Each stage is a (setup, run) pair: setup builds the inputs and is not timed,
+# run does the work being measured
+def _setup_cleaning(n_rows):
+    return {'df_raw': _catalogue(n_rows)}
+
+
+def _run_cleaning(inputs):
+    runpy.run_path(os.path.join(PIPELINE_DIR, 'Cleaning_and_handling_missing_values.py'),
+                   init_globals=inputs, run_name='__main__')
+
+
+def _setup_integrity(n_rows):
+    from Data_Integrity_and_Consistency import check_data_integrity
+    from Pipeline_Orchestrator import prepare_netflix_df
+    return check_data_integrity, prepare_netflix_df(_catalogue(n_rows))['netflix_df']
+
+
+def _run_integrity(inputs):
+    check_data_integrity, netflix_df = inputs
+    check_data_integrity(netflix_df)
+
+
+def _setup_features(n_rows):
+    return {'df_clean': _catalogue(n_rows, with_defects=False)}
+
+
+def _run_features(inputs):
+    runpy.run_path(os.path.join(PIPELINE_DIR, 'Feature_selection_and_engineering.py'),
+                   init_globals=inputs, run_name='__main__')
+
+
+def _setup_outliers(n_rows):
+    from Handling_Outliers_and_Data_Transformations import NetflixOutlierHandler
+    return NetflixOutlierHandler, _catalogue(n_rows).rename(columns=OUTLIER_RENAMES)
+
+
+def _run_outliers(inputs):
+    handler_class, df = inputs
+    handler = handler_class(df)
+    handler.analyze_outliers(['IMDB Score', 'Runtime'], methods=['iqr', 'zscore', 'modified_zscore'])
+    handler.handle_outliers('IMDB Score', method='cap', detection_method='iqr')
+    handler.handle_outliers('Runtime', method='winsorize')
+    handler.apply_transformations(['IMDB Score', 'Runtime'],
+                                  transformations=['standard', 'minmax', 'robust', 'power'])
+    handler.distribution_analysis(['IMDB Score', 'Runtime'])
+
+
+def _setup_patterns(n_rows):
+    from Patterns_Trends_and_Anomalies import NetflixPatternAnalyzer
+    return NetflixPatternAnalyzer, _catalogue(n_rows).rename(columns=PATTERN_RENAMES)
+
+
+def _run_patterns(inputs):
+    analyzer_class, df = inputs
+    analyzer_class(df).run_full_analysis()
+
+
+def _setup_summary(n_rows):
+    from Pipeline_Orchestrator import prepare_netflix_df
+    namespace = runpy.run_path(os.path.join(PIPELINE_DIR, 'Summary_Statistics_and_Insights'), run_name='summary')
+    return namespace['generate_summary_statistics'], prepare_netflix_df(_catalogue(n_rows))['netflix_df']
+
+
+def _run_summary(inputs):
+    generate_summary_statistics, netflix_df = inputs
+    generate_summary_statistics(netflix_df)
+
+
+def _setup_dashboard(n_rows):
+    from Initial_Visual_Representation_of_Key_Findings import NetflixVisualization
+    analyzer = NetflixVisualization()
+    analyzer.df = analyzer.create_sample_data(n_rows)
+    return analyzer
+
+
+def _run_dashboard(analyzer):
+    analyzer.create_overview_dashboard()
+    import matplotlib.pyplot as plt
+    plt.close('all')
+
+
+STAGES = {
+    'cleaning': (_setup_cleaning, _run_cleaning),
+    'integrity': (_setup_integrity, _run_integrity),
+    'features': (_setup_features, _run_features),
+    'outliers': (_setup_outliers, _run_outliers),
+    'patterns': (_setup_patterns, _run_patterns),
+    'summary': (_setup_summary, _run_summary),
+    'dashboard': (_setup_dashboard, _run_dashboard)
+}
+
+
+def run_stage(stage, n_rows):
+    """Time one stage at one scale inside the current process"""
+    setup, run = STAGES[stage]
+    inputs = setup(n_rows)
+    setup_rss_mb = peak_rss_mb()
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        run(inputs)
+        cpu_s = time.process_time() - cpu_start
+        wall_s = time.perf_counter() - wall_start
+
+    return {
+        'wall_s': round(wall_s, 4),
+        'cpu_s': round(cpu_s, 4),
+        'peak_rss_mb': peak_rss_mb(),
+        'setup_peak_rss_mb': setup_rss_mb
+    }
+
+
+def _run_stage_subprocess(stage, n_rows, timeout):
+    """Run one stage/scale in a fresh interpreter so peak RSS is not shared between cells"""
+    fd, result_path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    # Figures are drawn live so every run measures the rendering, not the figure cache
+    env = dict(os.environ, MPLBACKEND='Agg', NETFLIX_FIGURE_CACHE='0')
+    try:
+        completed = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', stage,
+                                    str(n_rows), result_path],
+                                   cwd=PIPELINE_DIR, env=env, capture_output=True, text=True, timeout=timeout)
+        if completed.returncode != 0:
+            return {'status': 'failed', 'error': completed.stderr.strip().splitlines()[-1:]}
+        with open(result_path) as f:
+            return dict(json.load(f), status='ok')
+    except subprocess.TimeoutExpired:
+        return {'status': 'timeout', 'timeout_s': timeout}
+    finally:
+        os.remove(result_path)
+
+
+def _git_revision():
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PIPELINE_DIR,
+                                   capture_output=True, text=True)
+        return completed.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def load_history(path=DEFAULT_OUTPUT):
+    """All previously recorded benchmark runs (oldest first)"""
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_runs(previous, current):
+    """Print the wall-time ratio of `current` over `previous` for every shared stage/scale"""
+    before = {(r['stage'], r['n_rows']): r for r in previous['results'] if r['status'] == 'ok'}
+
+    print(f"\n📊 COMPARISON WITH {previous['revision'] or 'previous run'} ({previous['timestamp']})")
+    print("-" * 60)
+    for result in current['results']:
+        old = before.get((result['stage'], result['n_rows']))
+        if result['status'] != 'ok' or old is None:
+            continue
+        ratio = result['wall_s'] / old['wall_s'] if old['wall_s'] > 0 else float('nan')
+        flag = '⚠️ ' if ratio > 1.2 else '   '
+        print(f"{flag}{result['stage']:<10} {result['n_rows']:>12,} rows: "
+              f"{old['wall_s']:>9.3f}s -> {result['wall_s']:>9.3f}s ({ratio:.2f}x)")
+
+
+def run_benchmarks(stages=None, scales=None, timeout=STAGE_TIMEOUT_S, output_path=DEFAULT_OUTPUT):
+    """Run every stage at every scale and append the results to the JSON history"""
+    stages = stages or list(STAGES)
+    scales = scales or DEFAULT_SCALES
+
+    print("🏁 PIPELINE BENCHMARK SUITE")
+    print("=" * 70)
+    print("| {:<10} | {:>12} | {:>10} | {:>10} | {:>12} |".format("Stage", "Rows", "Wall (s)", "CPU (s)", "Peak RSS MB"))
+    print("+" + "-" * 68 + "+")
+
+    results = []
+    for stage in stages:
+        blocked = None
+        for n_rows in sorted(scales):
+            if blocked is not None:
+                # A stage that failed or timed out at a smaller scale will not do better at a larger one
+                result = {'status': 'skipped', 'reason': f"{blocked} at a smaller scale"}
+            else:
+                result = _run_stage_subprocess(stage, n_rows, timeout)
+                if result['status'] != 'ok':
+                    blocked = result['status']
+            results.append(dict(result, stage=stage, n_rows=n_rows))
+
+            if result['status'] == 'ok':
+                print("| {:<10} | {:>12,} | {:>10.3f} | {:>10.3f} | {:>12} |".format(
+                    stage, n_rows, result['wall_s'], result['cpu_s'], result['peak_rss_mb']))
+            else:
+                print("| {:<10} | {:>12,} | {:>36} |".format(stage, n_rows, result['status'].upper()))
+    print("+" + "-" * 68 + "+")
+
+    run = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'revision': _git_revision(),
+        'python': sys.version.split()[0],
+        'cpu_count': os.cpu_count(),
+        'results': results
+    }
+    history = load_history(output_path)
+    if history:
+        compare_runs(history[-1], run)
+    history.append(run)
+    with open(output_path, 'w') as f:
+        json.dump(history, f, indent=2)
+    print(f"\n💾 Results appended to {output_path} ({len(history)} runs recorded)")
+
+    return run
+
+
+# Example usage: python Benchmark_Suite.py [--stages cleaning,summary] [--scales 1e3,1e5] [--timeout 600]
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args[0] == '--worker':
+        stage, n_rows, result_path = args[1], int(args[2]), args[3]
+        with open(result_path, 'w') as f:
+            json.dump(run_stage(stage, n_rows), f)
+        sys.exit(0)
+
+    options = dict(zip(args[::2], args[1::2]))
+    run_benchmarks(
+        stages=options['--stages'].split(',') if '--stages' in options else None,
+        scales=[int(float(s)) for s in options['--scales'].split(',')] if '--scales' in options else None,
+        timeout=float(options.get('--timeout', STAGE_TIMEOUT_S))
+    )
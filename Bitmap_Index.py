@@ -0,0 +1,223 @@
+import pandas as pd
+import numpy as np
+from functools import reduce
+from Stage_Instrumentation import traced
+from Histogram_Kernel import RATING_TIER_BINS
+
+# Roaring layout: row ids are split into 2^16-row chunks; each chunk holds its
+# low 16 bits either as a sorted uint16 array (sparse) or as a 1024-word
+# uint64 bitmap (dense), switching at 4096 values where both take 8 KB
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+ARRAY_LIMIT = 4096
+BITMAP_WORDS = (1 << CHUNK_BITS) // 64
+
+# IMDb rating tiers used by the findings report (lower bound inclusive)
+RATING_TIERS = RATING_TIER_BINS.labels
+
+INDEX_DIMENSIONS = ['Genre', 'Language', 'Release_Year', 'Budget_Category', 'Rating_Tier']
+
+_BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(words):
+    """Number of set bits in a uint64 array"""
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(words).sum())
+    return int(_BYTE_POPCOUNT[words.view(np.uint8)].sum())
+
+
+def _to_bitmap(values):
+    bits = np.zeros(1 << CHUNK_BITS, dtype=bool)
+    bits[values] = True
+    return np.packbits(bits, bitorder='little').view('<u8')
+
+
+def _to_array(words):
+    return np.flatnonzero(np.unpackbits(words.view(np.uint8), bitorder='little')).astype(np.uint16)
+
+
+def _is_bitmap(container):
+    return container.dtype != np.uint16
+
+
+def _cardinality(container):
+    return _popcount(container) if _is_bitmap(container) else len(container)
+
+
+def _and(a, b):
+    if not _is_bitmap(a) and not _is_bitmap(b):
+        return np.intersect1d(a, b, assume_unique=True)
+    if _is_bitmap(a) and _is_bitmap(b):
+        words = a & b
+        return _to_array(words) if _popcount(words) <= ARRAY_LIMIT else words
+    array, words = (a, b) if _is_bitmap(b) else (b, a)
+    keep = (words[array >> 6] >> (array & 63).astype(np.uint64)) & np.uint64(1)
+    return array[keep.astype(bool)]
+
+
+def _or(a, b):
+    if not _is_bitmap(a) and not _is_bitmap(b):
+        union = np.union1d(a, b)
+        return _to_bitmap(union) if len(union) > ARRAY_LIMIT else union
+    a = a if _is_bitmap(a) else _to_bitmap(a)
+    b = b if _is_bitmap(b) else _to_bitmap(b)
+    return a | b
+
+
+class RoaringBitmap:
+    """Compressed set of row ids with chunked array/bitmap containers"""
+
+    def __init__(self, containers=None):
+        self.containers = containers or {}
+
+    @classmethod
+    def from_indices(cls, indices):
+        """Build from sorted, unique row ids"""
+        indices = np.asarray(indices, dtype=np.int64)
+        keys = indices >> CHUNK_BITS
+        chunk_keys, starts = np.unique(keys, return_index=True)
+        ends = np.append(starts[1:], len(indices))
+
+        containers = {}
+        for key, start, end in zip(chunk_keys, starts, ends):
+            low = (indices[start:end] & CHUNK_MASK).astype(np.uint16)
+            containers[int(key)] = _to_bitmap(low) if len(low) > ARRAY_LIMIT else low
+        return cls(containers)
+
+    def __and__(self, other):
+        containers = {}
+        for key in self.containers.keys() & other.containers.keys():
+            container = _and(self.containers[key], other.containers[key])
+            if _cardinality(container):
+                containers[key] = container
+        return RoaringBitmap(containers)
+
+    def __or__(self, other):
+        containers = dict(self.containers)
+        for key, container in other.containers.items():
+            containers[key] = _or(containers[key], container) if key in containers else container
+        return RoaringBitmap(containers)
+
+    def __len__(self):
+        return sum(_cardinality(container) for container in self.containers.values())
+
+    def to_indices(self):
+        """Sorted row ids"""
+        if not self.containers:
+            return np.empty(0, dtype=np.int64)
+        parts = []
+        for key in sorted(self.containers):
+            container = self.containers[key]
+            low = _to_array(container) if _is_bitmap(container) else container
+            parts.append((key << CHUNK_BITS) + low.astype(np.int64))
+        return np.concatenate(parts)
+
+    def to_mask(self, n_rows):
+        mask = np.zeros(n_rows, dtype=bool)
+        mask[self.to_indices()] = True
+        return mask
+
+    def memory_bytes(self):
+        return sum(container.nbytes for container in self.containers.values())
+
+
+def rating_tier(ratings):
+    """Map IMDb ratings to RATING_TIERS (missing ratings get no tier)"""
+    ratings = pd.Series(ratings)
+    return pd.Series(RATING_TIER_BINS.label(ratings), index=ratings.index)
+
+
+class NetflixBitmapIndex:
+    def __init__(self, dimensions=None):
+        self.dimensions = dimensions or INDEX_DIMENSIONS
+        self.bitmaps = {}
+        self.n_rows = 0
+
+    @traced()
+    def build(self, df):
+        """Build one bitmap per value of every indexed dimension present in the frame"""
+        self.n_rows = len(df)
+        self.bitmaps = {}
+        for dim in self.dimensions:
+            if dim == 'Rating_Tier' and dim not in df.columns and 'IMDb_Rating' in df.columns:
+                column = rating_tier(df['IMDb_Rating'])
+            elif dim in df.columns:
+                column = df[dim]
+            else:
+                continue
+
+            codes, uniques = pd.factorize(column, sort=True)
+            # Stable sort keeps row ids ascending inside each value's run
+            order = np.argsort(codes, kind='stable')
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            start = int((codes < 0).sum())
+            values = {}
+            for value, count in zip(uniques, counts):
+                values[value] = RoaringBitmap.from_indices(order[start:start + count])
+                start += count
+            self.bitmaps[dim] = values
+        return self
+
+    def _dimension_bitmap(self, dim, value):
+        """OR of the bitmaps matching one filter (value, list/set of values, or inclusive range)"""
+        if dim not in self.bitmaps:
+            raise KeyError(f"Dimension not indexed: {dim}")
+        values = self.bitmaps[dim]
+        if isinstance(value, tuple):
+            low, high = value
+            matched = [bitmap for key, bitmap in values.items() if low <= key <= high]
+        elif isinstance(value, (list, set)):
+            matched = [values[key] for key in value if key in values]
+        else:
+            matched = [values[value]] if value in values else []
+        return reduce(lambda a, b: a | b, matched, RoaringBitmap())
+
+    def select(self, **filters):
+        """Rows matching every filter, as a bitmap (filters follow NetflixAggregateCube.slice)"""
+        if not filters:
+            return RoaringBitmap.from_indices(np.arange(self.n_rows))
+        bitmaps = [self._dimension_bitmap(dim, value) for dim, value in filters.items()]
+        # AND the smallest bitmaps first so intermediates stay small
+        bitmaps.sort(key=len)
+        return reduce(lambda a, b: a & b, bitmaps)
+
+    def count(self, **filters):
+        return len(self.select(**filters))
+
+    def rows(self, **filters):
+        """Sorted positional row ids matching the filters"""
+        return self.select(**filters).to_indices()
+
+    def value_counts(self, dim):
+        """Rows per value of one dimension, most frequent first"""
+        counts = pd.Series({value: len(bitmap) for value, bitmap in self.bitmaps[dim].items()}, dtype='int64')
+        return counts.sort_values(ascending=False, kind='stable')
+
+    def summary(self):
+        print("🗂️  BITMAP INDEX SUMMARY")
+        print(f"Rows indexed: {self.n_rows:,}")
+        for dim, values in self.bitmaps.items():
+            size_kb = sum(bitmap.memory_bytes() for bitmap in values.values()) / 1024
+            print(f"   {dim:<16} {len(values):>4} values  {size_kb:>10.1f} KB")
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    df = NetflixCatalogueGenerator(n_rows=1_000_000, seed=42).to_frame()
+    df['Budget_Category'] = pd.qcut(df['Budget_Million_USD'], 3, labels=['Low', 'Medium', 'High']).astype(str)
+
+    index = NetflixBitmapIndex().build(df)
+    index.summary()
+
+    start = time.perf_counter()
+    selected = index.select(Genre='Drama', Language='Korean', Release_Year=(2020, 2023), Rating_Tier=['Good', 'Excellent'])
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\n🇰🇷 Korean Dramas 2020-2023 rated 7+: {len(selected):,} titles ({elapsed_ms:.2f} ms, no column scans)")
+
+    mask = ((df['Genre'] == 'Drama') & (df['Language'] == 'Korean') &
+            df['Release_Year'].between(2020, 2023) & (df['IMDb_Rating'] >= 7.0))
+    print(f"✅ Matches column scan: {int(mask.sum()) == len(selected)}")
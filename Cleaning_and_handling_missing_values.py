@@ -1,13 +1,22 @@
+import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import warnings
 from datetime import datetime
+from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+from Figure_Cache import default_figure_cache, show_figure
+from Stratified_Sampling import stratified_sample
+from Netflix_Imputer import NetflixImputer
+from KNN_Imputation import NetflixKNNImputer, KNN_NEIGHBORS, IMPUTATION_ENV_VAR, IMPUTATION_STRATEGIES
 
 warnings.filterwarnings('ignore')
 plt.style.use('seaborn-v0_8')
 
+# Figures are only redrawn when the data behind them changes
+figure_cache = default_figure_cache()
+
 print("=" * 60)
 print("STEP 1: DATA CLEANING AND HANDLING MISSING VALUES")
 print("=" * 60)
@@ -18,42 +27,13 @@ print("=" * 60)
 
 print("\n📊 Creating Netflix Originals Dataset...")
 
-# Set random seed for reproducibility
-np.random.seed(42)
-
-# Create synthetic Netflix Originals dataset
-n_samples = 500
-
-# Generate realistic Netflix data
-titles = [f"Netflix Original {i}" for i in range(1, n_samples + 1)]
-genres = ['Drama', 'Comedy', 'Action', 'Thriller', 'Horror', 'Romance', 'Sci-Fi', 
-          'Documentary', 'Animation', 'Crime']
-languages = ['English', 'Spanish', 'French', 'German', 'Italian', 'Portuguese', 
-             'Japanese', 'Korean', 'Hindi', 'Mandarin']
-content_types = ['Movie', 'TV Series', 'Limited Series', 'Documentary']
-
-# Generate synthetic data with realistic patterns
-data = {
-    'Title': titles,
-    'Genre': np.random.choice(genres, n_samples),
-    'Release_Date': pd.date_range(start='2015-01-01', end='2024-12-31', periods=n_samples),
-    'Runtime_Minutes': np.random.normal(120, 30, n_samples).astype(int),
-    'Language': np.random.choice(languages, n_samples),
-    'Content_Type': np.random.choice(content_types, n_samples),
-    'Budget_Million_USD': np.random.lognormal(mean=2.5, sigma=0.8, size=n_samples),
-    'IMDb_Rating': np.random.normal(6.8, 1.2, n_samples),
-    'IMDb_Votes': np.random.lognormal(mean=8, sigma=1.5, size=n_samples).astype(int),
-    'Netflix_Views_Million': np.random.lognormal(mean=2, sigma=1, size=n_samples),
-    'Director_Experience_Years': np.random.exponential(scale=8, size=n_samples).astype(int),
-    'Cast_Rating': np.random.normal(7.2, 1.5, n_samples)
-}
-
-# Create DataFrame
-df = pd.DataFrame(data)
-
-# Ensure ratings are within valid range
-df['IMDb_Rating'] = df['IMDb_Rating'].clip(1, 10)
-df['Cast_Rating'] = df['Cast_Rating'].clip(1, 10)
+if 'df_raw' in globals():
+    # Raw catalogue handed over by the caller (e.g. the benchmark suite)
+    df = df_raw.copy()
+else:
+    # Create synthetic Netflix Originals dataset (same generator as every other step)
+    n_samples = 500
+    df = NetflixCatalogueGenerator(n_rows=n_samples, seed=42).to_frame()
 
 print(f"✅ Dataset created with {len(df)} Netflix Originals")
 print(f"📋 Columns: {list(df.columns)}")
@@ -65,6 +45,7 @@ print(f"📋 Columns: {list(df.columns)}")
 print("\n🔍 Introducing realistic missing values...")
 
 # Introduce realistic missing values
+np.random.seed(42)
 missing_indices = np.random.choice(df.index, size=int(0.15 * len(df)), replace=False)
 
 # IMDb Rating missing (some titles might not be rated yet)
@@ -106,41 +87,48 @@ for col in df.columns:
 print("+" + "-" * 40 + "+")
 
 # Visualize missing data patterns
-plt.figure(figsize=(14, 8))
-
-# Missing data heatmap
-plt.subplot(2, 2, 1)
-sns.heatmap(df.isnull(), yticklabels=False, cbar=True, cmap='viridis')
-plt.title('Missing Data Pattern Heatmap')
-
-# Missing data bar chart
-plt.subplot(2, 2, 2)
-missing_cols = missing_summary[missing_summary > 0]
-plt.bar(range(len(missing_cols)), missing_cols.values, color='coral')
-plt.xticks(range(len(missing_cols)), missing_cols.index, rotation=45)
-plt.title('Missing Values by Column')
-plt.ylabel('Count of Missing Values')
-
-# Missing data correlation
-plt.subplot(2, 2, 3)
-missing_matrix = df.isnull().astype(int)
-missing_corr = missing_matrix.corr()
-sns.heatmap(missing_corr, annot=True, cmap='coolwarm', center=0)
-plt.title('Missing Data Correlation')
-
-# Data completeness over time
-plt.subplot(2, 2, 4)
+def draw_missing_value_panels(data):
+    missing_summary = data['missing_summary']
+
+    # Missing data heatmap (one row per sampled title)
+    plt.subplot(2, 2, 1)
+    sns.heatmap(data['missing_sample'], yticklabels=False, cbar=True, cmap='viridis')
+    plt.title('Missing Data Pattern Heatmap')
+
+    # Missing data bar chart
+    plt.subplot(2, 2, 2)
+    missing_cols = missing_summary[missing_summary > 0]
+    plt.bar(range(len(missing_cols)), missing_cols.values, color='coral')
+    plt.xticks(range(len(missing_cols)), missing_cols.index, rotation=45)
+    plt.title('Missing Values by Column')
+    plt.ylabel('Count of Missing Values')
+
+    # Missing data correlation
+    plt.subplot(2, 2, 3)
+    missing_corr = data['missing_corr']
+    sns.heatmap(missing_corr, annot=True, cmap='coolwarm', center=0)
+    plt.title('Missing Data Correlation')
+
+    # Data completeness over time
+    plt.subplot(2, 2, 4)
+    yearly_completeness = data['yearly_completeness']
+    plt.plot(yearly_completeness.index, yearly_completeness.values, marker='o')
+    plt.title('Data Completeness by Release Year')
+    plt.xlabel('Release Year')
+    plt.ylabel('Completeness (%)')
+
+missing_matrix = df.isnull()
 df['Release_Year'] = df['Release_Date'].dt.year
 yearly_completeness = df.groupby('Release_Year').apply(
     lambda x: (1 - x.isnull().sum().sum() / (len(x) * len(x.columns))) * 100
 )
-plt.plot(yearly_completeness.index, yearly_completeness.values, marker='o')
-plt.title('Data Completeness by Release Year')
-plt.xlabel('Release Year')
-plt.ylabel('Completeness (%)')
-
-plt.tight_layout()
-plt.show()
+# The heatmap draws one row per title, so it gets a sample stratified by genre
+# and release year; the counts and correlations come from every title
+sample_rows = stratified_sample(df.reset_index(drop=True), columns=[]).index
+show_figure(figure_cache, 'missing_value_patterns',
+            {'missing_sample': missing_matrix.iloc[sample_rows], 'missing_summary': missing_matrix.sum(),
+             'missing_corr': missing_matrix.astype(int).corr(), 'yearly_completeness': yearly_completeness},
+            draw_missing_value_panels, figsize=(14, 8))
 
 # ============================================================================
 # MISSING VALUE HANDLING STRATEGIES
@@ -152,80 +140,50 @@ print("-" * 40)
 # Create a copy for cleaning
 df_clean = df.copy()
 
+# Group medians by default; NETFLIX_IMPUTATION=knn infers ratings, budgets
+# and views from the most similar titles instead
+imputation_strategy = os.environ.get(IMPUTATION_ENV_VAR, 'median')
+if imputation_strategy not in IMPUTATION_STRATEGIES:
+    raise ValueError(f"Unknown {IMPUTATION_ENV_VAR} '{imputation_strategy}'; choose from {IMPUTATION_STRATEGIES}")
+
+# Group medians are learned by a fitted imputer, which the ingestion service
+# reuses to fill new titles without re-reading the catalogue
+imputer = NetflixImputer().fit(df_clean)
+missing_before = df_clean[list(imputer.lookups)].isnull().sum()
+if imputation_strategy == 'knn':
+    df_clean = NetflixKNNImputer().fit_transform(df_clean)
+df_clean = imputer.transform(df_clean)
+missing_after = df_clean[list(imputer.lookups)].isnull().sum()
+
+if imputation_strategy == 'knn':
+    knn_note = f"   Using the mean of the {KNN_NEIGHBORS} most similar titles (KD-tree on standardized features)"
+    strategy_notes = {
+        'IMDb_Rating': ("1. IMDb Rating - Nearest-Neighbor Imputation", knn_note),
+        'Budget_Million_USD': ("2. Budget - Nearest-Neighbor Imputation", knn_note),
+        'Netflix_Views_Million': ("3. Netflix Views - Nearest-Neighbor Imputation", knn_note)
+    }
+else:
+    strategy_notes = {
+        'IMDb_Rating': ("1. IMDb Rating - Strategic Imputation", "   Using median rating by Genre and Content Type"),
+        'Budget_Million_USD': ("2. Budget - Content Type Based Imputation", "   Using median budget by Content Type"),
+        'Netflix_Views_Million': ("3. Netflix Views - Time-based Imputation", "   Using median views by Release Year")
+    }
+
 # Strategy 1: IMDb Rating - Group-based median imputation
-print("1. IMDb Rating - Strategic Imputation")
-print("   Using median rating by Genre and Content Type")
-
-missing_imdb_before = df_clean['IMDb_Rating'].isnull().sum()
-
-for genre in df_clean['Genre'].unique():
-    for content_type in df_clean['Content_Type'].unique():
-        # Find records with missing IMDb rating for this genre-content combination
-        mask = (df_clean['Genre'] == genre) & \
-               (df_clean['Content_Type'] == content_type) & \
-               df_clean['IMDb_Rating'].isnull()
-        
-        if mask.sum() > 0:
-            # Calculate median for this group
-            group_median = df_clean[
-                (df_clean['Genre'] == genre) & 
-                (df_clean['Content_Type'] == content_type)
-            ]['IMDb_Rating'].median()
-            
-            # If no median available for this group, use overall median
-            if pd.isna(group_median):
-                group_median = df_clean['IMDb_Rating'].median()
-            
-            # Impute missing values
-            df_clean.loc[mask, 'IMDb_Rating'] = group_median
-
-missing_imdb_after = df_clean['IMDb_Rating'].isnull().sum()
-print(f"   ✅ Reduced from {missing_imdb_before} to {missing_imdb_after} missing values")
+print("\n".join(strategy_notes['IMDb_Rating']))
+print(f"   ✅ Reduced from {missing_before['IMDb_Rating']} to {missing_after['IMDb_Rating']} missing values")
 
 # Strategy 2: Budget - Content Type based imputation
-print("\n2. Budget - Content Type Based Imputation")
-print("   Using median budget by Content Type")
-
-missing_budget_before = df_clean['Budget_Million_USD'].isnull().sum()
-
-for content_type in df_clean['Content_Type'].unique():
-    mask = (df_clean['Content_Type'] == content_type) & df_clean['Budget_Million_USD'].isnull()
-    
-    if mask.sum() > 0:
-        type_median = df_clean[df_clean['Content_Type'] == content_type]['Budget_Million_USD'].median()
-        if pd.isna(type_median):
-            type_median = df_clean['Budget_Million_USD'].median()
-        df_clean.loc[mask, 'Budget_Million_USD'] = type_median
-
-missing_budget_after = df_clean['Budget_Million_USD'].isnull().sum()
-print(f"   ✅ Reduced from {missing_budget_before} to {missing_budget_after} missing values")
+print("\n" + "\n".join(strategy_notes['Budget_Million_USD']))
+print(f"   ✅ Reduced from {missing_before['Budget_Million_USD']} to {missing_after['Budget_Million_USD']} missing values")
 
 # Strategy 3: Netflix Views - Time-based imputation
-print("\n3. Netflix Views - Time-based Imputation")
-print("   Using median views by Release Year")
-
-missing_views_before = df_clean['Netflix_Views_Million'].isnull().sum()
-
-for year in df_clean['Release_Year'].unique():
-    mask = (df_clean['Release_Year'] == year) & df_clean['Netflix_Views_Million'].isnull()
-    
-    if mask.sum() > 0:
-        year_median = df_clean[df_clean['Release_Year'] == year]['Netflix_Views_Million'].median()
-        if pd.isna(year_median):
-            year_median = df_clean['Netflix_Views_Million'].median()
-        df_clean.loc[mask, 'Netflix_Views_Million'] = year_median
-
-missing_views_after = df_clean['Netflix_Views_Million'].isnull().sum()
-print(f"   ✅ Reduced from {missing_views_before} to {missing_views_after} missing values")
+print("\n" + "\n".join(strategy_notes['Netflix_Views_Million']))
+print(f"   ✅ Reduced from {missing_before['Netflix_Views_Million']} to {missing_after['Netflix_Views_Million']} missing values")
 
 # Strategy 4: Director Experience - Simple median imputation
 print("\n4. Director Experience - Median Imputation")
-
-missing_exp_before = df_clean['Director_Experience_Years'].isnull().sum()
-median_experience = df_clean['Director_Experience_Years'].median()
-df_clean['Director_Experience_Years'].fillna(median_experience, inplace=True)
-missing_exp_after = df_clean['Director_Experience_Years'].isnull().sum()
-print(f"   ✅ Reduced from {missing_exp_before} to {missing_exp_after} missing values")
+print(f"   ✅ Reduced from {missing_before['Director_Experience_Years']} to {missing_after['Director_Experience_Years']} missing values")
 
 # ============================================================================
 # DATA CLEANING VALIDATION
@@ -269,32 +227,30 @@ print(f"   - Rating range: {df_clean['IMDb_Rating'].min():.1f} to {df_clean['IMD
 print(f"   - Complete records: {len(df_clean[df_clean.isnull().sum(axis=1) == 0])}")
 
 # Before/After comparison visualization
-plt.figure(figsize=(12, 5))
-
-plt.subplot(1, 2, 1)
-missing_before = df.isnull().sum()
-missing_before = missing_before[missing_before > 0]
-plt.bar(range(len(missing_before)), missing_before.values, color='red', alpha=0.7)
-plt.xticks(range(len(missing_before)), missing_before.index, rotation=45)
-plt.title('Missing Values - BEFORE Cleaning')
-plt.ylabel('Count')
-
-plt.subplot(1, 2, 2)
-missing_after = df_clean.isnull().sum()
-missing_after = missing_after[missing_after > 0]
-if len(missing_after) > 0:
-    plt.bar(range(len(missing_after)), missing_after.values, color='green', alpha=0.7)
-    plt.xticks(range(len(missing_after)), missing_after.index, rotation=45)
-else:
-    plt.text(0.5, 0.5, 'No Missing Values!', ha='center', va='center', 
-             fontsize=16, fontweight='bold', color='green')
-    plt.xlim(0, 1)
-    plt.ylim(0, 1)
-plt.title('Missing Values - AFTER Cleaning')
-plt.ylabel('Count')
-
-plt.tight_layout()
-plt.show()
+def draw_missing_before_after(data):
+    plt.subplot(1, 2, 1)
+    missing_before = data['before'][data['before'] > 0]
+    plt.bar(range(len(missing_before)), missing_before.values, color='red', alpha=0.7)
+    plt.xticks(range(len(missing_before)), missing_before.index, rotation=45)
+    plt.title('Missing Values - BEFORE Cleaning')
+    plt.ylabel('Count')
+
+    plt.subplot(1, 2, 2)
+    missing_after = data['after'][data['after'] > 0]
+    if len(missing_after) > 0:
+        plt.bar(range(len(missing_after)), missing_after.values, color='green', alpha=0.7)
+        plt.xticks(range(len(missing_after)), missing_after.index, rotation=45)
+    else:
+        plt.text(0.5, 0.5, 'No Missing Values!', ha='center', va='center', 
+                 fontsize=16, fontweight='bold', color='green')
+        plt.xlim(0, 1)
+        plt.ylim(0, 1)
+    plt.title('Missing Values - AFTER Cleaning')
+    plt.ylabel('Count')
+
+show_figure(figure_cache, 'missing_before_after',
+            {'before': df.isnull().sum(), 'after': df_clean.isnull().sum()},
+            draw_missing_before_after, figsize=(12, 5))
 
 # Save cleaned dataset info
 print(f"\n💾 Cleaned Dataset Summary:")
@@ -0,0 +1,149 @@
+import json
+import os
+import sys
+import numpy as np
+import pandas as pd
+from Stage_Instrumentation import traced
+from Density_Binning import aligned_edges, sparse_group_bins
+
+PIPELINE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(PIPELINE_DIR, 'Review 2', 'netflix_aggregates.json')
+
+# The hand-picked real Netflix Originals the Review 2 dashboards show by default
+CURATED_TITLES = os.path.join(PIPELINE_DIR, 'Review 2', 'netflix_originals_curated.csv')
+
+# Catalogue column -> field name used by the Review 2 dashboards
+DASHBOARD_FIELDS = {
+    'Title': 'title',
+    'Genre': 'genre',
+    'IMDb_Rating': 'rating',
+    'Release_Year': 'year',
+    'Runtime_Minutes': 'runtime',
+    'Content_Type': 'type'
+}
+
+# The dashboard filters are genre == g, year >= y and rating >= r (r in 0.1 steps),
+# so cells of (genre, year, 0.1 rating bin) answer every filter exactly
+RATING_BIN_WIDTH = 0.1
+
+# Titles kept per (genre, year): the top TOP_K by rating rebuild the top-rated
+# chart exactly for any filter (a rating floor only trims from the bottom)
+TOP_K = 8
+
+# Runtime-vs-rating density bins per (genre, year) for the web scatter
+DENSITY_RUNTIME_BIN = 10
+DENSITY_RATING_BIN = 0.5
+
+
+def _dashboard_type(content_type):
+    """Collapse Content_Type into the Movie / Series split the dashboards colour by"""
+    return np.where(np.isin(content_type, ['Movie', 'Documentary']), 'Movie', 'Series')
+
+
+def _title_columns(rows):
+    return {
+        'genre': rows['genre_code'].tolist(),
+        'year': rows['year'].tolist(),
+        'title': rows['title'].astype(str).tolist(),
+        'rating': rows['rating'].tolist(),
+        'runtime': rows['runtime'].round(1).tolist(),
+        'type': rows['type'].tolist()
+    }
+
+
+@traced()
+def build_dashboard_aggregates(df, top_k=TOP_K, bin_width=RATING_BIN_WIDTH):
+    """Columnar cell aggregates, top titles and density bins per genre and year for the dashboard filters"""
+    data = df[list(DASHBOARD_FIELDS)].rename(columns=DASHBOARD_FIELDS).dropna(subset=['rating', 'year'])
+
+    genre_codes, genres = pd.factorize(data['genre'], sort=True)
+    data = data.assign(
+        genre_code=genre_codes,
+        year=data['year'].astype(int),
+        rating_bin=np.floor(np.round(data['rating'].to_numpy() / bin_width, 6)).astype(int),
+        type=_dashboard_type(data['type'].to_numpy())
+    )
+    # Sufficient statistics for the runtime-vs-rating trend line of any filter
+    data = data.assign(runtime_sq=data['runtime'] ** 2, runtime_rating=data['runtime'] * data['rating'],
+                       rating_sq=data['rating'] ** 2)
+
+    cells = data.groupby(['genre_code', 'year', 'rating_bin'], sort=True).agg(
+        count=('rating', 'size'), rating_sum=('rating', 'sum'), runtime_sum=('runtime', 'sum'),
+        runtime_sq_sum=('runtime_sq', 'sum'), runtime_rating_sum=('runtime_rating', 'sum'),
+        rating_sq_sum=('rating_sq', 'sum')).reset_index()
+
+    # Top-k titles per (genre, year), highest rating first with title as tie-break
+    ranked = data.sort_values(['genre_code', 'year', 'rating', 'title'], ascending=[True, True, False, True])
+    top_titles = ranked[ranked.groupby(['genre_code', 'year']).cumcount() < top_k]
+
+    # Runtime-vs-rating density: non-empty (genre, year, runtime bin, rating bin) counts
+    year_min = int(data['year'].min())
+    n_years = int(data['year'].max()) - year_min + 1
+    runtime_edges = aligned_edges(data['runtime'], DENSITY_RUNTIME_BIN)
+    rating_edges = aligned_edges(data['rating'], DENSITY_RATING_BIN, low=0.0, high=10.0)
+    density = sparse_group_bins(data['runtime'], data['rating'], data['genre_code'] * n_years + data['year'] - year_min,
+                                runtime_edges, rating_edges)
+    density_groups = np.asarray(density['group'])
+
+    return {
+        'version': 1,
+        'n_titles': int(len(data)),
+        'rating_bin_width': bin_width,
+        'top_k': top_k,
+        'genres': [str(genre) for genre in genres],
+        'year_range': [int(data['year'].min()), int(data['year'].max())],
+        'cells': {
+            'genre': cells['genre_code'].tolist(),
+            'year': cells['year'].tolist(),
+            'rating_bin': cells['rating_bin'].tolist(),
+            'count': cells['count'].tolist(),
+            'rating_sum': cells['rating_sum'].round(6).tolist(),
+            'runtime_sum': cells['runtime_sum'].round(3).tolist(),
+            'runtime_sq_sum': cells['runtime_sq_sum'].round(3).tolist(),
+            'runtime_rating_sum': cells['runtime_rating_sum'].round(4).tolist(),
+            'rating_sq_sum': cells['rating_sq_sum'].round(4).tolist()
+        },
+        'top_titles': _title_columns(top_titles),
+        'scatter_density': {
+            'runtime_edges': runtime_edges.tolist(),
+            'rating_edges': rating_edges.round(6).tolist(),
+            'genre': (density_groups // n_years).tolist(),
+            'year': (density_groups % n_years + year_min).tolist(),
+            'runtime_bin': density['ix'],
+            'rating_bin': density['iy'],
+            'count': density['count']
+        }
+    }
+
+
+def load_curated_titles(path=CURATED_TITLES):
+    """The curated titles, with the catalogue's column names"""
+    return pd.read_csv(path)
+
+
+def export_dashboard_aggregates(df, path=DEFAULT_OUTPUT, top_k=TOP_K, bin_width=RATING_BIN_WIDTH):
+    """Write the dashboard aggregates as compact JSON"""
+    aggregates = build_dashboard_aggregates(df, top_k=top_k, bin_width=bin_width)
+    with open(path, 'w') as f:
+        json.dump(aggregates, f, separators=(',', ':'))
+
+    size_kb = os.path.getsize(path) / 1024
+    print(f"📦 Exported {aggregates['n_titles']:,} titles as {len(aggregates['cells']['count']):,} cells, "
+          f"{len(aggregates['top_titles']['title']):,} top titles and "
+          f"{len(aggregates['scatter_density']['count']):,} density bins to {path} ({size_kb:.1f} KB)")
+    return aggregates
+
+
+# Example usage: python Dashboard_Aggregate_Export.py [catalogue.csv | n_rows] [output.json]
+#   With no arguments the curated titles are exported; a row count exports a
+#   synthetic catalogue of that size instead
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else CURATED_TITLES
+    output_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_OUTPUT
+
+    if os.path.exists(source):
+        catalogue = load_curated_titles(source)
+    else:
+        from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+        catalogue = NetflixCatalogueGenerator(n_rows=int(float(source)), seed=42).to_frame()
+    export_dashboard_aggregates(catalogue, output_path)
@@ -0,0 +1,198 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qs
+import pandas as pd
+from Initial_Visual_Representation_of_Key_Findings import NetflixVisualization
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Bounds for the recent-query cache (whichever is hit first evicts)
+QUERY_CACHE_ENTRIES = 512
+QUERY_CACHE_BYTES = 64 * 1024 ** 2
+
+FILTER_PARAMS = ['genre', 'language', 'year_min', 'year_max', 'rating_min', 'rating_max']
+
+HTTP_STATUS = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               500: 'Internal Server Error'}
+
+
+class QueryCache:
+    """LRU of serialized responses bounded by entry count and total bytes"""
+
+    def __init__(self, max_entries=QUERY_CACHE_ENTRIES, max_bytes=QUERY_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            body = self.entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body):
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= len(self.entries.pop(key))
+            self.entries[key] = body
+            self.total_bytes += len(body)
+            while self.entries and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.total_bytes, 'hits': self.hits, 'misses': self.misses}
+
+
+def parse_filters(query_string):
+    """Normalize the dashboard query string into filter values (ValueError on bad input)"""
+    params = {name: values[-1] for name, values in parse_qs(query_string).items() if values[-1] != ''}
+    unknown = set(params) - set(FILTER_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+
+    filters = {
+        'genre': None if params.get('genre', 'all') == 'all' else params['genre'],
+        'language': None if params.get('language', 'all') == 'all' else params['language'],
+        'year_range': None,
+        'rating_range': None
+    }
+    if 'year_min' in params or 'year_max' in params:
+        filters['year_range'] = (int(params.get('year_min', 0)), int(params.get('year_max', 9999)))
+    if 'rating_min' in params or 'rating_max' in params:
+        filters['rating_range'] = (float(params.get('rating_min', 0.0)), float(params.get('rating_max', 10.0)))
+    return filters
+
+
+class NetflixQueryService:
+    def __init__(self, analyzer, max_entries=QUERY_CACHE_ENTRIES, max_bytes=QUERY_CACHE_BYTES):
+        self.analyzer = analyzer
+        self.cache = QueryCache(max_entries, max_bytes)
+
+    def answer(self, filters):
+        """Serialized chart payload for one filter combination (cached)"""
+        key = tuple(sorted(filters.items()))
+        body = self.cache.get(key)
+        if body is None:
+            start = time.perf_counter()
+            payload = self.analyzer.compute_chart_aggregates(**filters)
+            payload['compute_ms'] = round((time.perf_counter() - start) * 1000, 2)
+            body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+            self.cache.put(key, body)
+        return body
+
+    async def _error(self, writer, status, message):
+        await self._respond(writer, status, json.dumps({'error': message}).encode('utf-8'))
+
+    async def _respond(self, writer, status, body=b'', content_type='application/json'):
+        headers = [
+            f"HTTP/1.1 {status} {HTTP_STATUS[status]}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            "Access-Control-Allow-Origin: *",
+            "Access-Control-Allow-Methods: GET, OPTIONS",
+            "Connection: close",
+            "", ""
+        ]
+        writer.write("\r\n".join(headers).encode('latin-1') + body)
+        await writer.drain()
+
+    async def handle(self, reader, writer):
+        """Serve one HTTP request: GET /query?..., GET /health, OPTIONS (CORS preflight)"""
+        try:
+            request_line = (await reader.readline()).decode('latin-1').strip()
+            # Drain the headers; the service only needs the request line
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            if not request_line:
+                return
+            parts = request_line.split(' ')
+            if len(parts) != 3:
+                await self._error(writer, 400, f"Malformed request line: {request_line[:100]!r}")
+                return
+            method, target, _ = parts
+            url = urlsplit(target)
+
+            if method == 'OPTIONS':
+                await self._respond(writer, 204)
+            elif method != 'GET':
+                await self._error(writer, 405, f"{method} not allowed")
+            elif url.path == '/health':
+                payload = {'titles': int(len(self.analyzer.df)), 'cache': self.cache.stats()}
+                await self._respond(writer, 200, json.dumps(payload).encode('utf-8'))
+            elif url.path == '/query':
+                try:
+                    filters = parse_filters(url.query)
+                except ValueError as error:
+                    await self._error(writer, 400, str(error))
+                    return
+                try:
+                    # Aggregation runs off the event loop so slow queries do not stall other clients
+                    body = await asyncio.get_running_loop().run_in_executor(None, self.answer, filters)
+                except Exception as error:
+                    print(f"❌ Query {url.query!r} failed: {type(error).__name__}: {error}")
+                    await self._error(writer, 500, f"{type(error).__name__}: {error}")
+                    return
+                await self._respond(writer, 200, body)
+            else:
+                await self._error(writer, 404, f"No route {url.path}")
+        except ConnectionError:
+            # The client went away; there is nobody left to answer
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"🌐 Serving {len(self.analyzer.df):,} titles on http://{host}:{port}/query")
+        async with server:
+            await server.serve_forever()
+
+
+def load_catalogue(source=None):
+    """Load the cleaned catalogue once: a .parquet/.csv/.pkl path, or a row count for the generator"""
+    if source is None or not os.path.exists(str(source)):
+        from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+        n_rows = int(float(source)) if source is not None else 100_000
+        catalogue = NetflixCatalogueGenerator(n_rows=n_rows, seed=42).to_frame()
+    elif source.endswith('.parquet'):
+        catalogue = pd.read_parquet(source)
+    elif source.endswith('.csv'):
+        catalogue = pd.read_csv(source)
+    else:
+        catalogue = pd.read_pickle(source)
+
+    analyzer = NetflixVisualization.from_catalogue(catalogue)
+    # Categorical columns keep the per-query group-bys cheap
+    for col in ['Genre', 'Language']:
+        analyzer.df[col] = analyzer.df[col].astype('category')
+    # Build the bitmap index up front so the first query does not pay for it
+    analyzer.get_bitmap_index()
+    return analyzer
+
+
+# Example usage: python Dashboard_Query_Service.py [catalogue.parquet | n_rows] [port]
+#   curl 'http://127.0.0.1:8765/query?genre=Drama&year_min=2018&rating_min=7'
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else None
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PORT
+    service = NetflixQueryService(load_catalogue(source))
+    try:
+        asyncio.run(service.serve(port=port))
+    except KeyboardInterrupt:
+        print("\n👋 Query service stopped")
@@ -1,17 +1,18 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+from Approximate_Distinct_Counts import categorical_cardinality
+from Lazy_Imports import lazy_import
+from Stage_Instrumentation import traced
 
-# Assuming netflix_df is already loaded from Step 1
-# If running separately, uncomment the next line and run Step 1 first
-# exec(open('step1_data_setup.py').read())
+# matplotlib is only imported when the missing-value charts are drawn
+plt = lazy_import('matplotlib.pyplot')
 
-print("="*70)
-print("STEP 2: DATA INTEGRITY AND CONSISTENCY CHECK")
-print("="*70)
+# netflix_df is provided by Step 1 when this script runs as a pipeline stage
+# (python Pipeline_Orchestrator.py integrity); importing it only defines
+# check_data_integrity()
 
-def check_data_integrity(df):
+@traced()
+def check_data_integrity(df, show_plots=True):
     """Comprehensive data integrity and consistency check"""
     
     integrity_report = {}
@@ -34,22 +35,23 @@ def check_data_integrity(df):
     integrity_report['missing_values'] = missing_df
     
     # Visualize missing data
-    plt.figure(figsize=(12, 6))
+    if show_plots and (missing_df['Missing_Count'] > 0).any():
+        plt.figure(figsize=(12, 6))
     
-    plt.subplot(1, 2, 1)
-    missing_df[missing_df['Missing_Count'] > 0]['Missing_Count'].plot(kind='bar', color='coral')
-    plt.title('Missing Values Count by Column')
-    plt.ylabel('Count')
-    plt.xticks(rotation=45)
+        plt.subplot(1, 2, 1)
+        missing_df[missing_df['Missing_Count'] > 0]['Missing_Count'].plot(kind='bar', color='coral')
+        plt.title('Missing Values Count by Column')
+        plt.ylabel('Count')
+        plt.xticks(rotation=45)
     
-    plt.subplot(1, 2, 2)
-    missing_df[missing_df['Missing_Count'] > 0]['Missing_Percentage'].plot(kind='bar', color='lightblue')
-    plt.title('Missing Values Percentage by Column')
-    plt.ylabel('Percentage (%)')
-    plt.xticks(rotation=45)
+        plt.subplot(1, 2, 2)
+        missing_df[missing_df['Missing_Count'] > 0]['Missing_Percentage'].plot(kind='bar', color='lightblue')
+        plt.title('Missing Values Percentage by Column')
+        plt.ylabel('Percentage (%)')
+        plt.xticks(rotation=45)
     
-    plt.tight_layout()
-    plt.show()
+        plt.tight_layout()
+        plt.show()
     
     print("\n" + "="*50)
     print("2. DATA TYPES CONSISTENCY")
@@ -98,11 +100,12 @@ def check_data_integrity(df):
     consistency_issues = []
     
     # Check if Seasons and Episodes_Total make sense
-    unrealistic_episodes = df[df['Episodes_Total'] < df['Seasons']]
-    if not unrealistic_episodes.empty:
-        issue = f"Found {len(unrealistic_episodes)} shows with fewer episodes than seasons"
-        consistency_issues.append(issue)
-        print(f"⚠️  {issue}")
+    if {'Seasons', 'Episodes_Total'} <= set(df.columns):
+        unrealistic_episodes = df[df['Episodes_Total'] < df['Seasons']]
+        if not unrealistic_episodes.empty:
+            issue = f"Found {len(unrealistic_episodes)} shows with fewer episodes than seasons"
+            consistency_issues.append(issue)
+            print(f"⚠️  {issue}")
     
     # Check if Release_Year is reasonable for Netflix
     old_shows = df[df['Release_Year'] < 2010]
@@ -149,49 +152,61 @@ def check_data_integrity(df):
     
     categorical_columns = df.select_dtypes(include=['object']).columns
     
-    for col in categorical_columns:
-        unique_count = df[col].nunique()
-        print(f"\n{col}: {unique_count} unique values")
-        print(f"Values: {sorted(df[col].unique())}")
+    # HyperLogLog sketches: exact counts and listings for low-cardinality
+    # columns, bounded-memory estimates (and no value dump) for the rest
+    cardinality = categorical_cardinality(df, categorical_columns)
+    integrity_report['distinct_counts'] = {col: sketch.count() for col, sketch in cardinality.items()}
+    
+    for col, sketch in cardinality.items():
+        if sketch.is_exact:
+            print(f"\n{col}: {sketch.count()} unique values")
+            print(f"Values: {sketch.values()}")
+        else:
+            print(f"\n{col}: ~{sketch.count():,} unique values (HyperLogLog estimate, ±{sketch.relative_error:.1%})")
+            print(f"Values: more than {sketch.exact_limit:,} distinct, not listed")
         
         # Check for potential data entry issues
-        if col == 'Genre':
+        if col == 'Genre' and sketch.is_exact:
             # Check for mixed case or unusual entries
-            genres = df[col].unique()
-            print(f"  Genres found: {list(genres)}")
+            print(f"  Genres found: {sketch.values()}")
     
     return integrity_report
 
-# Run integrity check
-print("Starting comprehensive data integrity check...\n")
-integrity_results = check_data_integrity(netflix_df)
+if __name__ == "__main__":
+    print("="*70)
+    print("STEP 2: DATA INTEGRITY AND CONSISTENCY CHECK")
+    print("="*70)
 
-print("\n" + "="*70)
-print("STEP 2 SUMMARY:")
-print("="*70)
-print("✓ Data integrity check completed")
-print("✓ Missing values identified and quantified")
-print("✓ Data types consistency verified")
-print("✓ Duplicate records checked")
-print("✓ Logical consistency validated")
-print("✓ Value ranges examined")
-print("✓ Categorical data validated")
+    # Run integrity check
+    print("Starting comprehensive data integrity check...\n")
+    integrity_results = check_data_integrity(netflix_df)
 
-print("\n🎯 KEY FINDINGS:")
-missing_cols = integrity_results['missing_values'][integrity_results['missing_values']['Missing_Count'] > 0]
-if not missing_cols.empty:
-    print(f"- Missing data found in {len(missing_cols)} columns")
-    for col in missing_cols.index:
-        print(f"  • {col}: {missing_cols.loc[col, 'Missing_Count']} missing ({missing_cols.loc[col, 'Missing_Percentage']}%)")
+    print("\n" + "="*70)
+    print("STEP 2 SUMMARY:")
+    print("="*70)
+    print("✓ Data integrity check completed")
+    print("✓ Missing values identified and quantified")
+    print("✓ Data types consistency verified")
+    print("✓ Duplicate records checked")
+    print("✓ Logical consistency validated")
+    print("✓ Value ranges examined")
+    print("✓ Categorical data validated")
 
-if integrity_results['duplicates'] > 0:
-    print(f"- {integrity_results['duplicates']} duplicate records found")
-else:
-    print("- No duplicate records found")
+    print("\n🎯 KEY FINDINGS:")
+    missing_cols = integrity_results['missing_values'][integrity_results['missing_values']['Missing_Count'] > 0]
+    if not missing_cols.empty:
+        print(f"- Missing data found in {len(missing_cols)} columns")
+        for col in missing_cols.index:
+            print(f"  • {col}: {missing_cols.loc[col, 'Missing_Count']} missing ({missing_cols.loc[col, 'Missing_Percentage']}%)")
+
+    if integrity_results['duplicates'] > 0:
+        print(f"- {integrity_results['duplicates']} duplicate records found")
+    else:
+        print("- No duplicate records found")
 
-if integrity_results['consistency_issues']:
-    print("- Consistency issues identified:")
-    for issue in integrity_results['consistency_issues']:
-        print(f"  • {issue}")
+    if integrity_results['consistency_issues']:
+        print("- Consistency issues identified:")
+        for issue in integrity_results['consistency_issues']:
+            print(f"  • {issue}")
 
-print("\n✓ Step 2 Complete: Data integrity analysis finished!")
\ No newline at end of file
+    print("\n✓ Step 2 Complete: Data integrity analysis finished!")
\ No newline at end of file
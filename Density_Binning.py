@@ -0,0 +1,161 @@
+import numpy as np
+from Lazy_Imports import lazy_import
+
+plt = lazy_import('matplotlib.pyplot')
+
+# Above this many points the runtime-vs-rating panel is drawn as a density grid
+DENSITY_THRESHOLD = 20_000
+
+
+def aligned_edges(values, bin_width, low=None, high=None):
+    """Uniform bin edges on multiples of bin_width covering the values"""
+    values = np.asarray(values, dtype=float)
+    low = np.floor(np.nanmin(values) / bin_width) * bin_width if low is None else low
+    high = np.ceil(np.nanmax(values) / bin_width) * bin_width if high is None else high
+    n_bins = max(int(round((high - low) / bin_width)), 1)
+    return low + bin_width * np.arange(n_bins + 1)
+
+
+def _widened(value_range):
+    """(low, high), widened by half a unit each way when every value is equal"""
+    low, high = value_range
+    return (low - 0.5, high + 0.5) if high <= low else (low, high)
+
+
+def bin_index(values, edges):
+    """Bin of each value for uniform edges (values outside fall into the end bins)"""
+    width = edges[1] - edges[0]
+    if not width > 0:
+        raise ValueError(f"Bin edges must be increasing, got a bin width of {width}")
+    index = np.floor(np.round((np.asarray(values, dtype=float) - edges[0]) / width, 9)).astype(np.int64)
+    return np.clip(index, 0, len(edges) - 2)
+
+
+class DensityGrid:
+    """2-D histogram of (x, y) with per-bin sufficient statistics for an exact OLS trend"""
+
+    STATS = ['count', 'sum_x', 'sum_y', 'sum_xx', 'sum_xy', 'sum_yy']
+
+    def __init__(self, x_edges, y_edges):
+        self.x_edges = np.asarray(x_edges, dtype=float)
+        self.y_edges = np.asarray(y_edges, dtype=float)
+        shape = (len(self.y_edges) - 1, len(self.x_edges) - 1)
+        for stat in self.STATS:
+            setattr(self, stat, np.zeros(shape))
+
+    @classmethod
+    def from_values(cls, x, y, x_bins=60, y_bins=40, x_range=None, y_range=None):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        valid = ~(np.isnan(x) | np.isnan(y))
+        x_range = _widened(x_range or (x[valid].min(), x[valid].max()))
+        y_range = _widened(y_range or (y[valid].min(), y[valid].max()))
+        grid = cls(np.linspace(*x_range, x_bins + 1), np.linspace(*y_range, y_bins + 1))
+        return grid.add(x, y)
+
+    def add(self, x, y):
+        """Accumulate more points into the grid"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        valid = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[valid], y[valid]
+
+        n_x = len(self.x_edges) - 1
+        flat = bin_index(y, self.y_edges) * n_x + bin_index(x, self.x_edges)
+        size = self.count.size
+        weights = {'count': None, 'sum_x': x, 'sum_y': y, 'sum_xx': x * x, 'sum_xy': x * y, 'sum_yy': y * y}
+        for stat, weight in weights.items():
+            getattr(self, stat).flat[:] += np.bincount(flat, weights=weight, minlength=size)
+        return self
+
+    def merge(self, other):
+        """Add another grid with the same edges"""
+        if not (np.array_equal(self.x_edges, other.x_edges) and np.array_equal(self.y_edges, other.y_edges)):
+            raise ValueError("Density grids must share bin edges to merge")
+        for stat in self.STATS:
+            setattr(self, stat, getattr(self, stat) + getattr(other, stat))
+        return self
+
+    def totals(self, mask=None):
+        """Sufficient statistics summed over all bins (or the bins selected by mask)"""
+        return {stat: float(getattr(self, stat)[mask].sum() if mask is not None else getattr(self, stat).sum())
+                for stat in self.STATS}
+
+    def trend(self, mask=None):
+        """(slope, intercept, r) of the least-squares line y = slope * x + intercept"""
+        return trend_from_sums(**self.totals(mask))
+
+    def plot(self, ax=None, cmap='viridis', show_trend=True):
+        """Draw the counts as a heatmap with the trend line; cost depends on bin count only"""
+        ax = ax or plt.gca()
+        counts = np.ma.masked_equal(self.count, 0)
+        mesh = ax.pcolormesh(self.x_edges, self.y_edges, counts, cmap=cmap, shading='flat')
+        plt.colorbar(mesh, ax=ax, label='Titles')
+        if show_trend:
+            slope, intercept, r = self.trend()
+            xs = np.array([self.x_edges[0], self.x_edges[-1]])
+            ax.plot(xs, slope * xs + intercept, 'r--', alpha=0.8, label=f'Trend (r = {r:.2f})')
+        return mesh
+
+    def to_payload(self):
+        """Sparse columnar form (non-empty bins only) for the web dashboards"""
+        iy, ix = np.nonzero(self.count)
+        slope, intercept, r = self.trend()
+        return {
+            'x_edges': self.x_edges.round(6).tolist(),
+            'y_edges': self.y_edges.round(6).tolist(),
+            'ix': ix.tolist(),
+            'iy': iy.tolist(),
+            'count': self.count[iy, ix].astype(int).tolist(),
+            'trend': {'slope': slope, 'intercept': intercept, 'r': r}
+        }
+
+
+def trend_from_sums(count, sum_x, sum_y, sum_xx, sum_xy, sum_yy=None):
+    """Closed-form OLS slope, intercept and Pearson r from sufficient statistics"""
+    if count < 2:
+        return float('nan'), float('nan'), float('nan')
+    sxx = sum_xx - sum_x * sum_x / count
+    sxy = sum_xy - sum_x * sum_y / count
+    slope = sxy / sxx if sxx > 0 else float('nan')
+    intercept = (sum_y - slope * sum_x) / count
+    r = float('nan')
+    if sum_yy is not None:
+        syy = sum_yy - sum_y * sum_y / count
+        if sxx > 0 and syy > 0:
+            r = sxy / np.sqrt(sxx * syy)
+    return float(slope), float(intercept), float(r)
+
+
+def sparse_group_bins(x, y, groups, x_edges, y_edges):
+    """Non-empty (group, x bin, y bin) counts in one bincount pass"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    groups = np.asarray(groups, dtype=np.int64)
+    valid = ~(np.isnan(x) | np.isnan(y)) & (groups >= 0)
+    x, y, groups = x[valid], y[valid], groups[valid]
+
+    n_x = len(x_edges) - 1
+    n_y = len(y_edges) - 1
+    flat = (groups * n_y + bin_index(y, y_edges)) * n_x + bin_index(x, x_edges)
+    keys, counts = np.unique(flat, return_counts=True)
+    return {
+        'group': (keys // (n_x * n_y)).tolist(),
+        'iy': ((keys // n_x) % n_y).tolist(),
+        'ix': (keys % n_x).tolist(),
+        'count': counts.tolist()
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    df = NetflixCatalogueGenerator(n_rows=1_000_000, seed=42).to_frame()
+    grid = DensityGrid.from_values(df['Runtime_Minutes'], df['IMDb_Rating'], x_bins=80, y_bins=45)
+
+    slope, intercept, r = grid.trend()
+    poly_slope, poly_intercept = np.polyfit(df['Runtime_Minutes'], df['IMDb_Rating'], 1)
+    print(f"📈 Binned trend:  slope={slope:.6e} intercept={intercept:.6f} r={r:.4f}")
+    print(f"📈 np.polyfit:    slope={poly_slope:.6e} intercept={poly_intercept:.6f}")
+    print(f"🧮 {len(df):,} titles in {int((grid.count > 0).sum()):,} non-empty bins")
@@ -5,12 +5,16 @@ import seaborn as sns
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.feature_selection import SelectKBest, f_regression, mutual_info_regression
 from sklearn.decomposition import PCA
-from scipy.stats import chi2_contingency
 import warnings
+from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+from Figure_Cache import default_figure_cache, show_figure
 
 warnings.filterwarnings('ignore')
 plt.style.use('seaborn-v0_8')
 
+# Figures are only redrawn when the data behind them changes
+figure_cache = default_figure_cache()
+
 print("=" * 60)
 print("STEP 2: FEATURE SELECTION AND ENGINEERING")
 print("=" * 60)
@@ -21,37 +25,14 @@ print("=" * 60)
 
 print("\n📊 Loading cleaned Netflix dataset...")
 
-# Recreate the cleaned dataset from Step 1
-np.random.seed(42)
-n_samples = 500
-
-# Generate the same dataset structure
-titles = [f"Netflix Original {i}" for i in range(1, n_samples + 1)]
-genres = ['Drama', 'Comedy', 'Action', 'Thriller', 'Horror', 'Romance', 'Sci-Fi', 
-          'Documentary', 'Animation', 'Crime']
-languages = ['English', 'Spanish', 'French', 'German', 'Italian', 'Portuguese', 
-             'Japanese', 'Korean', 'Hindi', 'Mandarin']
-content_types = ['Movie', 'TV Series', 'Limited Series', 'Documentary']
-
-data = {
-    'Title': titles,
-    'Genre': np.random.choice(genres, n_samples),
-    'Release_Date': pd.date_range(start='2015-01-01', end='2024-12-31', periods=n_samples),
-    'Runtime_Minutes': np.random.normal(120, 30, n_samples).astype(int),
-    'Language': np.random.choice(languages, n_samples),
-    'Content_Type': np.random.choice(content_types, n_samples),
-    'Budget_Million_USD': np.random.lognormal(mean=2.5, sigma=0.8, size=n_samples),
-    'IMDb_Rating': np.random.normal(6.8, 1.2, n_samples),
-    'IMDb_Votes': np.random.lognormal(mean=8, sigma=1.5, size=n_samples).astype(int),
-    'Netflix_Views_Million': np.random.lognormal(mean=2, sigma=1, size=n_samples),
-    'Director_Experience_Years': np.random.exponential(scale=8, size=n_samples).astype(int),
-    'Cast_Rating': np.random.normal(7.2, 1.5, n_samples)
-}
-
-df = pd.DataFrame(data)
-df['IMDb_Rating'] = df['IMDb_Rating'].clip(1, 10)
-df['Cast_Rating'] = df['Cast_Rating'].clip(1, 10)
-df['Release_Year'] = df['Release_Date'].dt.year
+if 'df_clean' in globals():
+    # Cleaned dataset handed over by the Step 1 pipeline stage
+    df = df_clean.copy()
+    original_columns = list(df.columns)
+else:
+    # Recreate the Step 1 dataset from the shared generator
+    df = NetflixCatalogueGenerator(n_rows=500, seed=42).to_frame()
+    original_columns = list(df.columns)
 
 print(f"✅ Dataset loaded: {df.shape[0]} records, {df.shape[1]} features")
 print(f"📋 Original features: {list(df.columns)}")
@@ -294,37 +275,41 @@ print(f"   - Components for 95% variance: {n_components_95}")
 print(f"   - Total original features: {X.shape[1]}")
 
 # Visualize PCA results
-plt.figure(figsize=(15, 5))
-
-plt.subplot(1, 3, 1)
-plt.plot(range(1, len(pca.explained_variance_ratio_) + 1), 
-         pca.explained_variance_ratio_, 'bo-')
-plt.xlabel('Principal Component')
-plt.ylabel('Explained Variance Ratio')
-plt.title('Scree Plot')
-plt.grid(True, alpha=0.3)
-
-plt.subplot(1, 3, 2)
-plt.plot(range(1, len(cumsum_var) + 1), cumsum_var * 100, 'ro-')
-plt.axhline(y=90, color='g', linestyle='--', label='90%')
-plt.axhline(y=95, color='b', linestyle='--', label='95%')
-plt.xlabel('Number of Components')
-plt.ylabel('Cumulative Explained Variance (%)')
-plt.title('Cumulative Explained Variance')
-plt.legend()
-plt.grid(True, alpha=0.3)
-
-plt.subplot(1, 3, 3)
-# Feature importance in first two components
-feature_importance = np.abs(pca.components_[:2]).mean(axis=0)
-top_features_idx = np.argsort(feature_importance)[-10:]
-plt.barh(range(10), feature_importance[top_features_idx])
-plt.yticks(range(10), X.columns[top_features_idx])
-plt.xlabel('Average Absolute Loading')
-plt.title('Top 10 Features in PC1-PC2')
-
-plt.tight_layout()
-plt.show()
+def draw_pca_panels(data):
+    explained_variance_ratio = data['explained_variance_ratio']
+    cumsum_var = np.cumsum(explained_variance_ratio)
+
+    plt.subplot(1, 3, 1)
+    plt.plot(range(1, len(explained_variance_ratio) + 1), 
+             explained_variance_ratio, 'bo-')
+    plt.xlabel('Principal Component')
+    plt.ylabel('Explained Variance Ratio')
+    plt.title('Scree Plot')
+    plt.grid(True, alpha=0.3)
+
+    plt.subplot(1, 3, 2)
+    plt.plot(range(1, len(cumsum_var) + 1), cumsum_var * 100, 'ro-')
+    plt.axhline(y=90, color='g', linestyle='--', label='90%')
+    plt.axhline(y=95, color='b', linestyle='--', label='95%')
+    plt.xlabel('Number of Components')
+    plt.ylabel('Cumulative Explained Variance (%)')
+    plt.title('Cumulative Explained Variance')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+    plt.subplot(1, 3, 3)
+    # Feature importance in first two components
+    feature_importance = np.abs(data['components'][:2]).mean(axis=0)
+    top_features_idx = np.argsort(feature_importance)[-10:]
+    plt.barh(range(10), feature_importance[top_features_idx])
+    plt.yticks(range(10), data['features'][top_features_idx])
+    plt.xlabel('Average Absolute Loading')
+    plt.title('Top 10 Features in PC1-PC2')
+
+show_figure(figure_cache, 'pca_overview',
+            {'explained_variance_ratio': pca.explained_variance_ratio_, 'components': pca.components_,
+             'features': np.asarray(X.columns)},
+            draw_pca_panels, figsize=(15, 5))
 
 # ============================================================================
 # FINAL FEATURE SELECTION SUMMARY
@@ -363,8 +348,8 @@ df_final = df[final_features].copy()
 
 print(f"\n📋 Final Dataset Shape: {df_final.shape}")
 print(f"📈 Feature Engineering Summary:")
-print(f"   - Original features: {len(data.keys())}")
-print(f"   - Created features: {df.shape[1] - len(data.keys())}")
+print(f"   - Original features: {len(original_columns)}")
+print(f"   - Created features: {df.shape[1] - len(original_columns)}")
 print(f"   - Final selected: {len(final_features) - 3}")  # Excluding target and identifiers
 
 # Feature importance visualization
@@ -401,8 +386,8 @@ print("="*60)
 # Store the engineered dataset for next steps
 engineered_netflix_data = df_final.copy()
 feature_engineering_summary = {
-    'original_features': len(data.keys()),
-    'total_created': df.shape[1] - len(data.keys()),
+    'original_features': len(original_columns),
+    'total_created': df.shape[1] - len(original_columns),
     'final_selected': len(final_features) - 3,
     'consensus_features': list(consensus_features),
     'recommended_features': list(recommended_features)
@@ -0,0 +1,223 @@
+import hashlib
+import inspect
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from Lazy_Imports import lazy_import
+
+plt = lazy_import('matplotlib.pyplot')
+
+PIPELINE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FIGURE_CACHE_DIR = os.path.join(PIPELINE_DIR, '.pipeline_cache', 'figures')
+
+# Rendered figures kept on disk; least recently used files go first past this size
+FIGURE_CACHE_BYTES = 256 * 1024 ** 2
+
+# NETFLIX_FIGURE_CACHE=<dir> moves the cache; NETFLIX_FIGURE_CACHE=0 turns it
+# off so every figure is drawn live (the benchmark suite does this)
+FIGURE_CACHE_ENV_VAR = 'NETFLIX_FIGURE_CACHE'
+
+FIGURE_FORMATS = ('png', 'svg')
+
+
+def _update_digest(digest, value):
+    """Feed a panel input (frames, arrays, containers, scalars) into the hash"""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        digest.update(type(value).__name__.encode('utf-8'))
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(list(value.columns)).encode('utf-8'))
+            digest.update(repr(value.dtypes.astype(str).tolist()).encode('utf-8'))
+        else:
+            digest.update(repr((value.name, str(value.dtype))).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(value, index=not isinstance(value, pd.Index)).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode('utf-8'))
+        if value.dtype == object:
+            digest.update(pickle.dumps(value.tolist(), protocol=4))
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode('utf-8'))
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(type(value).__name__.encode('utf-8'))
+        for item in value:
+            _update_digest(digest, item)
+    elif value is None or isinstance(value, (str, bytes, bool, int, float, np.generic)):
+        digest.update(repr(value).encode('utf-8'))
+    else:
+        digest.update(pickle.dumps(value, protocol=4))
+
+
+def _code_hash(draw):
+    """Hash of the drawing function, so editing a panel's code redraws it"""
+    try:
+        code = inspect.getsource(draw).encode('utf-8')
+    except (OSError, TypeError):
+        code = draw.__code__.co_code
+    return hashlib.sha256(code).hexdigest()
+
+
+def _style_hash():
+    """Hash of the active matplotlib style (rcParams) the figure would be drawn with"""
+    items = sorted((key, repr(value)) for key, value in plt.rcParams.items())
+    return hashlib.sha256(repr(items).encode('utf-8')).hexdigest()
+
+
+class NetflixFigureCache:
+    """Rendered figures on disk keyed by a hash of their input aggregate, parameters and code"""
+
+    def __init__(self, cache_dir=DEFAULT_FIGURE_CACHE_DIR, max_bytes=FIGURE_CACHE_BYTES, fmt='png', dpi=100):
+        if fmt not in FIGURE_FORMATS:
+            raise ValueError(f"Unsupported figure format: {fmt} (expected one of {FIGURE_FORMATS})")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.fmt = fmt
+        self.dpi = dpi
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, name, inputs, draw, figsize, **params):
+        """Content hash of one figure: its name, input aggregate, parameters, drawing code and style"""
+        digest = hashlib.sha256()
+        digest.update(name.encode('utf-8'))
+        _update_digest(digest, inputs)
+        _update_digest(digest, {'figsize': tuple(figsize), 'dpi': self.dpi, 'params': params})
+        digest.update(_code_hash(draw).encode('utf-8'))
+        digest.update(_style_hash().encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, name, key, fmt):
+        return os.path.join(self.cache_dir, f"{name}-{key[:16]}.{fmt}")
+
+    def render(self, name, inputs, draw, figsize=(8, 6), fmt=None, **params):
+        """Path of the rendered figure, drawing it only when no figure with the same key is cached
+
+        `draw(inputs, **params)` draws onto a fresh current figure (plt.subplot
+        etc. work as usual).
+        """
+        fmt = fmt or self.fmt
+        path = self._path(name, self.key(name, inputs, draw, figsize, **params), fmt)
+        if os.path.exists(path):
+            # Touching the file marks it as recently used for eviction
+            os.utime(path)
+            self.hits += 1
+            return path
+
+        self.misses += 1
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fig = plt.figure(figsize=figsize)
+        try:
+            draw(inputs, **params)
+            fig.tight_layout()
+            fig.savefig(path + '.tmp', format=fmt, dpi=self.dpi)
+        finally:
+            plt.close(fig)
+        os.replace(path + '.tmp', path)
+        self.evict()
+        return path
+
+    def entries(self):
+        """Cached figure files, least recently used first"""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        files = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.rsplit('.', 1)[-1] in FIGURE_FORMATS:
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(files)
+
+    def evict(self):
+        """Delete least recently used figures until the cache fits in max_bytes"""
+        files = self.entries()
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def stats(self):
+        files = self.entries()
+        return {'figures': len(files), 'bytes': sum(size for _, size, _ in files),
+                'hits': self.hits, 'misses': self.misses}
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
+
+
+def default_figure_cache():
+    """Figure cache configured from NETFLIX_FIGURE_CACHE (on by default, None when turned off)"""
+    setting = os.environ.get(FIGURE_CACHE_ENV_VAR, '')
+    if setting.lower() in ('0', 'off', 'false', 'no'):
+        return None
+    return NetflixFigureCache(setting or DEFAULT_FIGURE_CACHE_DIR)
+
+
+def show_figure(figure_cache, name, inputs, draw, figsize=(8, 6), **params):
+    """Show one figure, through the cache when there is one or drawn live otherwise"""
+    if figure_cache is None:
+        plt.figure(figsize=figsize)
+        draw(inputs, **params)
+        plt.tight_layout()
+        plt.show()
+        return None
+    path = figure_cache.render(name, inputs, draw, figsize=figsize, **params)
+    if figure_cache.fmt == 'png':
+        show_images([path], figsize=figsize)
+    return path
+
+
+def show_images(paths, ncols=1, figsize=None, title=None):
+    """Display rendered PNG figures in a grid of image axes"""
+    nrows = -(-len(paths) // ncols)
+    fig, axes = plt.subplots(nrows, ncols, figsize=figsize or (8 * ncols, 6 * nrows), squeeze=False)
+    for ax, path in zip(axes.flat, paths):
+        ax.imshow(plt.imread(path))
+    for ax in axes.flat:
+        ax.axis('off')
+    if title:
+        fig.suptitle(title, fontsize=20, fontweight='bold')
+    fig.tight_layout()
+    plt.show()
+    return fig
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from Initial_Visual_Representation_of_Key_Findings import NetflixVisualization
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    plt.switch_backend('Agg')
+    cache = NetflixFigureCache(tempfile.mkdtemp(prefix='netflix_figures_'))
+    catalogue = NetflixCatalogueGenerator(n_rows=200_000, seed=42).to_frame()
+
+    def render_dashboard(df, label):
+        analyzer = NetflixVisualization.from_catalogue(df)
+        hits, misses = cache.hits, cache.misses
+        start = time.perf_counter()
+        analyzer.create_overview_dashboard(figure_cache=cache)
+        plt.close('all')
+        elapsed = time.perf_counter() - start
+        print(f"🖼️  {label}: {elapsed:.2f}s, {cache.misses - misses} panels drawn, {cache.hits - hits} reused")
+
+    render_dashboard(catalogue, "First run")
+    render_dashboard(catalogue, "Same data")
+
+    # A day later only the latest release year has changed
+    latest = catalogue['Release_Year'] == catalogue['Release_Year'].max()
+    updated = catalogue.copy()
+    updated.loc[latest, 'IMDb_Rating'] = (updated.loc[latest, 'IMDb_Rating'] + 0.1).clip(upper=10.0)
+    render_dashboard(updated, "Latest year re-rated")
+
+    print(f"📦 Cache: {cache.stats()}")
@@ -0,0 +1,223 @@
+import numpy as np
+import pandas as pd
+from Execution_Backends import aggregate
+from Lazy_Imports import lazy_import
+from Stage_Instrumentation import traced
+
+# scipy is only needed for the F and t distributions
+stats = lazy_import('scipy.stats')
+
+P_VALUE_CORRECTIONS = ('holm', 'bonferroni', 'fdr_bh', 'none')
+
+
+def group_moments(values, groups):
+    """Per-group count, mean and sample variance (ddof=1) of the non-missing values"""
+    values = np.asarray(values, dtype=float)
+    codes, names = pd.factorize(pd.Series(groups), sort=True)
+    keep = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[keep], values[keep]
+
+    count = np.bincount(codes, minlength=len(names)).astype(float)
+    total = np.bincount(codes, weights=values, minlength=len(names))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        centered = values - mean[codes]
+        var = np.bincount(codes, weights=centered * centered, minlength=len(names)) / (count - 1)
+    return pd.DataFrame({'count': count.astype(int), 'mean': mean, 'var': var}, index=pd.Index(names, name='group'))
+
+
+def rating_moments(df, by, backend=None, column='IMDb_Rating'):
+    """Per-group count, mean and std of a column, computed on an execution backend"""
+    return aggregate(df, by, {
+        'count': (column, 'count'),
+        'mean': (column, 'mean'),
+        'std': (column, 'std')
+    }, backend)
+
+
+def _moment_arrays(moments, positive_variance=False):
+    """count, mean and variance arrays of the groups with at least two values
+    (and, for tests that weight by 1/variance, a nonzero variance)"""
+    var = moments['var'] if 'var' in moments.columns else moments['std'] ** 2
+    usable = (moments['count'] >= 2).to_numpy() & ~np.isnan(var.to_numpy(dtype=float))
+    if positive_variance:
+        usable &= (var > 0).to_numpy()
+    return (moments.index[usable], moments['count'].to_numpy(dtype=float)[usable],
+            moments['mean'].to_numpy(dtype=float)[usable], var.to_numpy(dtype=float)[usable])
+
+
+def _untestable(k):
+    """Result of an ANOVA with fewer than two usable groups"""
+    return {'F': np.nan, 'df_between': max(k - 1, 0), 'df_within': np.nan, 'p_value': np.nan}
+
+
+def one_way_anova(moments):
+    """Classic one-way ANOVA (equal variances) from per-group count, mean and variance"""
+    _, n, mean, var = _moment_arrays(moments)
+    k, total = len(n), n.sum()
+    if k < 2:
+        return dict(_untestable(k), eta_squared=np.nan)
+    grand_mean = (n * mean).sum() / total
+    ss_between = (n * (mean - grand_mean) ** 2).sum()
+    ss_within = ((n - 1) * var).sum()
+    df_between, df_within = k - 1, total - k
+    with np.errstate(invalid='ignore', divide='ignore'):
+        f_stat = (ss_between / df_between) / (ss_within / df_within)
+        eta_squared = ss_between / (ss_between + ss_within)
+    return {'F': f_stat, 'df_between': df_between, 'df_within': df_within,
+            'p_value': float(stats.f.sf(f_stat, df_between, df_within)),
+            'eta_squared': eta_squared}
+
+
+def welch_anova(moments):
+    """Welch's one-way ANOVA (unequal variances) from per-group count, mean and variance
+
+    Groups with zero variance would get infinite weight, so they are left out.
+    """
+    _, n, mean, var = _moment_arrays(moments, positive_variance=True)
+    k = len(n)
+    if k < 2:
+        return _untestable(k)
+    weights = n / var
+    weighted_mean = (weights * mean).sum() / weights.sum()
+    between = (weights * (mean - weighted_mean) ** 2).sum() / (k - 1)
+    spread = ((1 - weights / weights.sum()) ** 2 / (n - 1)).sum()
+    f_stat = between / (1 + 2 * (k - 2) / (k ** 2 - 1) * spread)
+    df_within = (k ** 2 - 1) / (3 * spread)
+    return {'F': f_stat, 'df_between': k - 1, 'df_within': df_within,
+            'p_value': float(stats.f.sf(f_stat, k - 1, df_within))}
+
+
+def adjust_p_values(p_values, method='holm'):
+    """Multiple-comparison adjusted p-values (Holm, Bonferroni or Benjamini-Hochberg)"""
+    if method not in P_VALUE_CORRECTIONS:
+        raise ValueError(f"Unknown correction '{method}' (expected one of {P_VALUE_CORRECTIONS})")
+    p_values = np.asarray(p_values, dtype=float)
+    m = len(p_values)
+    if method == 'none' or m == 0:
+        return p_values.copy()
+    if method == 'bonferroni':
+        return np.minimum(p_values * m, 1.0)
+
+    order = np.argsort(p_values, kind='stable')
+    ranked = p_values[order]
+    if method == 'holm':
+        adjusted = np.maximum.accumulate((m - np.arange(m)) * ranked)
+    else:
+        adjusted = np.minimum.accumulate((m / np.arange(1, m + 1) * ranked)[::-1])[::-1]
+    result = np.empty(m)
+    result[order] = np.minimum(adjusted, 1.0)
+    return result
+
+
+def pairwise_welch(moments, correction='holm', alpha=0.05):
+    """Welch t-test for every pair of groups at once, with adjusted p-values"""
+    names, n, mean, var = _moment_arrays(moments)
+    i, j = np.triu_indices(len(n), k=1)
+    se_sq_i, se_sq_j = var[i] / n[i], var[j] / n[j]
+    se_sq = se_sq_i + se_sq_j
+    diff = mean[i] - mean[j]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t_stat = diff / np.sqrt(se_sq)
+        # Welch-Satterthwaite degrees of freedom
+        dof = se_sq ** 2 / (se_sq_i ** 2 / (n[i] - 1) + se_sq_j ** 2 / (n[j] - 1))
+    p_value = 2 * stats.t.sf(np.abs(t_stat), dof)
+    # Two constant groups: equal means do not differ, different means certainly do
+    p_value = np.where(se_sq == 0, np.where(diff == 0, 1.0, 0.0), p_value)
+    p_adjusted = adjust_p_values(p_value, correction)
+
+    names = np.asarray(names, dtype=object)
+    return pd.DataFrame({
+        'group_a': names[i],
+        'group_b': names[j],
+        'mean_a': mean[i],
+        'mean_b': mean[j],
+        'diff': diff,
+        't': t_stat,
+        'df': dof,
+        'p_value': p_value,
+        'p_adjusted': p_adjusted,
+        'significant': p_adjusted < alpha
+    })
+
+
+@traced()
+def compare_groups(moments, correction='holm', alpha=0.05):
+    """ANOVA, Welch ANOVA and all pairwise Welch tests for one grouping
+
+    moments is a frame indexed by group with count, mean and var (or std)
+    columns, e.g. NetflixAggregateCube.rollup(dim) or group_moments().
+    Groups with fewer than two values are left out; with fewer than two
+    groups left the statistics are NaN and there are no pairs.
+    """
+    return {
+        'n_groups': len(_moment_arrays(moments)[0]),
+        'anova': one_way_anova(moments),
+        'welch_anova': welch_anova(moments),
+        'pairwise': pairwise_welch(moments, correction=correction, alpha=alpha),
+        'correction': correction,
+        'alpha': alpha
+    }
+
+
+def best_vs_worst(moments, comparison):
+    """Pairwise test row of the highest- against the lowest-mean group (None without two groups)"""
+    names, _, mean, _ = _moment_arrays(moments)
+    if len(names) < 2:
+        return None
+    order = np.argsort(mean, kind='stable')
+    best, worst = names[order[-1]], names[order[0]]
+    pairwise = comparison['pairwise']
+    match = (((pairwise['group_a'] == best) & (pairwise['group_b'] == worst)) |
+             ((pairwise['group_a'] == worst) & (pairwise['group_b'] == best)))
+    return pairwise[match].iloc[0] if match.any() else None
+
+
+def significance_summary(moments, comparison, label):
+    """One-line verdict for reports: is the spread across groups, and best vs worst, significant?"""
+    welch = comparison['welch_anova']
+    pair = best_vs_worst(moments, comparison)
+    if pair is None:
+        return f"{label} differences: not enough groups to test ({comparison['n_groups']} with two or more ratings)"
+    n_significant = int(comparison['pairwise']['significant'].sum())
+    verdict = 'significant' if pair['significant'] else 'not significant'
+    welch_text = (f"Welch ANOVA F={welch['F']:.2f}, p={welch['p_value']:.3g}" if not np.isnan(welch['F'])
+                  else "Welch ANOVA needs two groups with varying ratings")
+    return (f"{label} differences: {welch_text}; "
+            f"best vs worst {verdict} ({comparison['correction']}-adjusted p={pair['p_adjusted']:.3g}); "
+            f"{n_significant} of {len(comparison['pairwise'])} pairs differ")
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    df = NetflixCatalogueGenerator(n_rows=200_000, seed=42).to_frame()
+    moments = group_moments(df['IMDb_Rating'], df['Genre'])
+    comparison = compare_groups(moments)
+    print("🔬 GENRE COMPARISON")
+    print(significance_summary(moments, comparison, 'Genre'))
+
+    # Check against scipy on the raw values
+    samples = [group['IMDb_Rating'].to_numpy() for _, group in df.groupby('Genre')]
+    f_ref = stats.f_oneway(*samples)
+    welch_ref = [stats.ttest_ind(samples[a], samples[b], equal_var=False)
+                 for a in range(len(samples)) for b in range(a + 1, len(samples))]
+    print(f"✅ ANOVA matches scipy.stats.f_oneway: {np.isclose(comparison['anova']['F'], f_ref.statistic)}")
+    print(f"✅ Welch pairs match scipy.stats.ttest_ind: "
+          f"{np.allclose(comparison['pairwise']['p_value'], [ref.pvalue for ref in welch_ref])}")
+
+    # Degenerate catalogues: one genre, and a genre whose ratings are all equal
+    single = group_moments([7, 8, 6.5], ['Drama'] * 3)
+    print(f"✅ One group: {significance_summary(single, compare_groups(single), 'Genre')}")
+    constant = group_moments([7, 7, 7, 6, 8, 6.5], ['Drama'] * 3 + ['Comedy'] * 3)
+    print(f"✅ Constant group: {significance_summary(constant, compare_groups(constant), 'Genre')}")
+
+    # Hundreds of groups: every Genre x Language x Release_Year cell
+    cells = df['Genre'] + '|' + df['Language'] + '|' + df['Release_Year'].astype(str)
+    start = time.perf_counter()
+    cell_moments = group_moments(df['IMDb_Rating'], cells)
+    cell_comparison = compare_groups(cell_moments)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"\n⏱️  {len(cell_moments)} groups, {len(cell_comparison['pairwise']):,} Welch pairs in {elapsed_ms:.0f} ms")
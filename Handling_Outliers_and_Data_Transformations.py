@@ -1,16 +1,15 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
-from sklearn.preprocessing import PowerTransformer, QuantileTransformer
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from Lazy_Imports import lazy_import
+from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+from Stage_Instrumentation import traced
 import warnings
 warnings.filterwarnings('ignore')
 
+# Heavy dependencies are only imported when a method first needs them
+stats = lazy_import('scipy.stats')
+preprocessing = lazy_import('sklearn.preprocessing')
+
 class NetflixOutlierHandler:
     def __init__(self, df):
         self.df = df.copy()
@@ -79,6 +78,7 @@ class NetflixOutlierHandler:
             'percentage': len(outliers) / len(data) * 100
         }
     
+    @traced()
     def analyze_outliers(self, columns, methods=['iqr', 'zscore']):
         """Comprehensive outlier analysis"""
         print("🔍 OUTLIER DETECTION ANALYSIS")
@@ -126,6 +126,7 @@ class NetflixOutlierHandler:
             
             self.outlier_info[column] = outlier_results
     
+    @traced()
     def handle_outliers(self, column, method='cap', detection_method='iqr'):
         """Handle outliers using various strategies"""
         if column not in self.outlier_info:
@@ -167,6 +168,7 @@ class NetflixOutlierHandler:
             self.df[column] = self.df[column].clip(lower=p5, upper=p95)
             print(f"🎯 Winsorized to 5th-95th percentiles: [{p5:.3f}, {p95:.3f}]")
     
+    @traced()
     def apply_transformations(self, columns, transformations=['standard', 'minmax', 'robust']):
         """Apply various data transformations"""
         print("\n🔄 DATA TRANSFORMATIONS")
@@ -188,21 +190,21 @@ class NetflixOutlierHandler:
             
             if 'standard' in transformations:
                 # Standard Scaling (Z-score normalization)
-                scaler = StandardScaler()
+                scaler = preprocessing.StandardScaler()
                 standardized = scaler.fit_transform(data)
                 transformed_data[f'{column}_standard'] = standardized.flatten()
                 print(f"Standard - Mean: {standardized.mean():.3f}, Std: {standardized.std():.3f}")
             
             if 'minmax' in transformations:
                 # Min-Max Scaling
-                scaler = MinMaxScaler()
+                scaler = preprocessing.MinMaxScaler()
                 minmax_scaled = scaler.fit_transform(data)
                 transformed_data[f'{column}_minmax'] = minmax_scaled.flatten()
                 print(f"MinMax - Min: {minmax_scaled.min():.3f}, Max: {minmax_scaled.max():.3f}")
             
             if 'robust' in transformations:
                 # Robust Scaling (median and IQR)
-                scaler = RobustScaler()
+                scaler = preprocessing.RobustScaler()
                 robust_scaled = scaler.fit_transform(data)
                 transformed_data[f'{column}_robust'] = robust_scaled.flatten()
                 print(f"Robust - Median: {np.median(robust_scaled):.3f}, IQR: {np.percentile(robust_scaled, 75) - np.percentile(robust_scaled, 25):.3f}")
@@ -210,7 +212,7 @@ class NetflixOutlierHandler:
             if 'power' in transformations:
                 # Power Transformation (Yeo-Johnson)
                 try:
-                    transformer = PowerTransformer(method='yeo-johnson')
+                    transformer = preprocessing.PowerTransformer(method='yeo-johnson')
                     power_transformed = transformer.fit_transform(data)
                     transformed_data[f'{column}_power'] = power_transformed.flatten()
                     print(f"Power - Skewness: {stats.skew(power_transformed):.3f}")
@@ -219,7 +221,7 @@ class NetflixOutlierHandler:
             
             if 'quantile' in transformations:
                 # Quantile Transformation
-                transformer = QuantileTransformer(output_distribution='uniform')
+                transformer = preprocessing.QuantileTransformer(output_distribution='uniform')
                 quantile_transformed = transformer.fit_transform(data)
                 transformed_data[f'{column}_quantile'] = quantile_transformed.flatten()
                 print(f"Quantile - Range: [{quantile_transformed.min():.3f}, {quantile_transformed.max():.3f}]")
@@ -237,6 +239,7 @@ class NetflixOutlierHandler:
         
         return transformed_data
     
+    @traced()
     def distribution_analysis(self, columns):
         """Analyze distributions before and after transformations"""
         print("\n📈 DISTRIBUTION ANALYSIS")
@@ -290,26 +293,8 @@ class NetflixOutlierHandler:
 # Example usage
 if __name__ == "__main__":
     # Create sample Netflix data with outliers
-    np.random.seed(42)
-    
-    # Generate data with some outliers
-    normal_ratings = np.random.normal(6.8, 1.0, 90)
-    outlier_ratings = [2.1, 2.5, 9.8, 9.9]  # Extreme outliers
-    all_ratings = np.concatenate([normal_ratings, outlier_ratings])
-    
-    normal_runtime = np.random.normal(105, 15, 90)
-    outlier_runtime = [45, 250, 300, 320]  # Runtime outliers
-    all_runtime = np.concatenate([normal_runtime, outlier_runtime])
-    
-    sample_data = {
-        'Title': [f'Netflix Original {i}' for i in range(1, 95)],
-        'Genre': np.random.choice(['Drama', 'Comedy', 'Action', 'Documentary'], 94),
-        'IMDB Score': all_ratings,
-        'Runtime': all_runtime,
-        'Year': np.random.choice(range(2015, 2025), 94)
-    }
-    
-    df = pd.DataFrame(sample_data)
+    df = NetflixCatalogueGenerator(n_rows=94, seed=42, outlier_rate=0.05).to_frame().rename(
+        columns={'IMDb_Rating': 'IMDB Score', 'Runtime_Minutes': 'Runtime', 'Release_Year': 'Year'})
     
     # Initialize outlier handler
     handler = NetflixOutlierHandler(df)
@@ -0,0 +1,146 @@
+import numpy as np
+import pandas as pd
+
+# IMDb rating tiers shared by the findings report, pattern analysis,
+# dashboard and bitmap index (lower bound inclusive, open-ended outer tiers)
+RATING_TIER_EDGES = [6.0, 7.0, 8.0]
+
+# Up to this many edges bins are found by comparisons, beyond it by binary search
+COMPARE_EDGE_LIMIT = 16
+
+
+class BinSpec:
+    """Bin edges plus labels for the histogram kernel
+
+    open_ends=True adds a bin below the first and above the last edge (tiers);
+    open_ends=False bins only between the edges like pd.cut, and values
+    outside them are left unbinned. right=True closes bins on the right
+    ((a, b]) as pd.cut does by default; right=False closes them on the left.
+    """
+
+    def __init__(self, edges, labels=None, right=False, open_ends=True):
+        self.edges = np.asarray(edges, dtype=float)
+        if np.any(np.diff(self.edges) <= 0):
+            raise ValueError("Bin edges must be strictly increasing")
+        self.right = right
+        self.open_ends = open_ends
+        self.n_bins = len(self.edges) + 1 if open_ends else len(self.edges) - 1
+        if labels is None:
+            bounds = np.concatenate([[-np.inf], self.edges, [np.inf]]) if open_ends else self.edges
+            labels = [f"{low:g}-{high:g}" for low, high in zip(bounds[:-1], bounds[1:])]
+        if len(labels) != self.n_bins:
+            raise ValueError(f"Expected {self.n_bins} labels, got {len(labels)}")
+        self.labels = list(labels)
+
+    def codes(self, values):
+        """Bin number of every value (-1 for missing or out-of-range values)"""
+        values = np.asarray(values, dtype=float)
+        if len(self.edges) <= COMPARE_EDGE_LIMIT:
+            # Counting the edges each value passes is the same as searchsorted but
+            # streams through memory instead of branching per value
+            codes = np.zeros(len(values), dtype=np.intp)
+            for edge in self.edges:
+                codes += (values > edge) if self.right else (values >= edge)
+        else:
+            codes = np.searchsorted(self.edges, values, side='left' if self.right else 'right')
+        if not self.open_ends:
+            codes = codes - 1
+            codes[(codes < 0) | (codes >= self.n_bins)] = -1
+        codes[np.isnan(values)] = -1
+        return codes
+
+    def counts(self, values):
+        """Number of values in each bin"""
+        values = np.asarray(values, dtype=float)
+        if len(self.edges) > COMPARE_EDGE_LIMIT:
+            # Shifting by one sends unbinned values (-1) to a slot that is dropped
+            return np.bincount(self.codes(values) + 1, minlength=self.n_bins + 1)[1:]
+        # Bin counts are differences of the number of values past each edge,
+        # so no per-value bin numbers are materialized
+        passed = np.array([np.count_nonzero((values > edge) if self.right else (values >= edge))
+                           for edge in self.edges])
+        if self.open_ends:
+            n_valid = len(values) - np.count_nonzero(np.isnan(values))
+            passed = np.concatenate([[n_valid], passed, [0]])
+        return passed[:-1] - passed[1:]
+
+    def label(self, values):
+        """Bin label of every value (None where unbinned)"""
+        codes = self.codes(values)
+        labels = np.array(self.labels + [None], dtype=object)
+        return labels[codes]
+
+
+RATING_TIER_BINS = BinSpec(RATING_TIER_EDGES, ['Below Average', 'Average', 'Good', 'Excellent'])
+
+
+def binned_histogram(values, spec, groups=None):
+    """Counts and percentages per bin for any bin spec, optionally per group
+
+    Percentages are relative to all values passed (missing ones included), or
+    to each group's size when groups are given; per-group results are indexed
+    by (group, bin).
+    """
+    values = np.asarray(values, dtype=float)
+    if groups is None:
+        counts = spec.counts(values)
+        total = len(values)
+        return pd.DataFrame({
+            'count': counts,
+            'percent': counts / total * 100 if total else np.zeros(spec.n_bins)
+        }, index=pd.Index(spec.labels, name='bin'))
+
+    codes = spec.codes(values)
+    group_codes, group_names = pd.factorize(pd.Series(groups), sort=True)
+    n_groups = len(group_names)
+    keep = (codes >= 0) & (group_codes >= 0)
+    counts = np.bincount(group_codes[keep] * spec.n_bins + codes[keep],
+                         minlength=n_groups * spec.n_bins).reshape(n_groups, spec.n_bins)
+    sizes = np.bincount(group_codes[group_codes >= 0], minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        percent = counts / sizes[:, None] * 100
+    index = pd.MultiIndex.from_product([group_names, spec.labels], names=['group', 'bin'])
+    return pd.DataFrame({'count': counts.ravel(), 'percent': percent.ravel()}, index=index)
+
+
+def rating_tier_histogram(ratings, labels=None, groups=None):
+    """Rating tier counts and percentages (optionally with display labels for the four tiers)"""
+    spec = RATING_TIER_BINS if labels is None else BinSpec(RATING_TIER_EDGES, labels)
+    return binned_histogram(ratings, spec, groups=groups)
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    df = NetflixCatalogueGenerator(n_rows=1_000_000, seed=42, null_rate=0.02).to_frame()
+    ratings = df['IMDb_Rating']
+
+    def best_ms(func, repeat=5):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return result, min(timings)
+
+    tiers, kernel_ms = best_ms(lambda: rating_tier_histogram(ratings))
+    masks, masks_ms = best_ms(lambda: [
+        (ratings < 6.0).sum(), ((ratings >= 6.0) & (ratings < 7.0)).sum(),
+        ((ratings >= 7.0) & (ratings < 8.0)).sum(), (ratings >= 8.0).sum()])
+    _, apply_ms = best_ms(lambda: ratings.apply(lambda r: 'Excellent' if r >= 8.0 else 'Good' if r >= 7.0 else
+                                                'Average' if r >= 6.0 else 'Below Average').value_counts(), repeat=1)
+
+    print("⭐ RATING TIERS")
+    print(tiers.round(2))
+    print(f"\n⏱️  Kernel: {kernel_ms:.1f} ms, four boolean masks: {masks_ms:.1f} ms, apply: {apply_ms:.1f} ms")
+    print(f"✅ Matches boolean masks: {tiers['count'].tolist() == [int(m) for m in masks]}")
+
+    summary_bins = BinSpec([0, 5, 6, 7, 8, 10], right=True, open_ends=False)
+    cut_counts = pd.cut(ratings, bins=[0, 5, 6, 7, 8, 10]).value_counts().sort_index()
+    print(f"✅ Matches pd.cut: {binned_histogram(ratings, summary_bins)['count'].tolist() == cut_counts.tolist()}")
+
+    per_genre = rating_tier_histogram(ratings, groups=df['Genre'])
+    print(f"\n🎭 Excellent share by genre:")
+    print(per_genre.xs('Excellent', level='bin')['percent'].round(1).sort_values(ascending=False).head())
@@ -0,0 +1,119 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+PIPELINE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(PIPELINE_DIR, 'import_times.json')
+
+# Entry point -> statement that loads it (scripts without a .py suffix go through runpy)
+ENTRY_POINTS = {
+    'Data_Integrity_and_Consistency': 'import Data_Integrity_and_Consistency',
+    'Summary_Statistics_and_Insights': "import runpy; runpy.run_path('Summary_Statistics_and_Insights', run_name='summary')",
+    'Handling_Outliers_and_Data_Transformations': 'import Handling_Outliers_and_Data_Transformations',
+    'Patterns_Trends_and_Anomalies': 'import Patterns_Trends_and_Anomalies',
+    'Initial_Visual_Representation_of_Key_Findings': 'import Initial_Visual_Representation_of_Key_Findings',
+    'Aggregate_Cube': 'import Aggregate_Cube',
+    'Mergeable_Summary_Statistics': 'import Mergeable_Summary_Statistics',
+    'Parallel_Pipeline_Runner': 'import Parallel_Pipeline_Runner',
+    'Pipeline_Orchestrator': 'import Pipeline_Orchestrator',
+    'Synthetic_Catalogue_Generator': 'import Synthetic_Catalogue_Generator',
+    'Stage_Instrumentation': 'import Stage_Instrumentation',
+    'Dashboard_Aggregate_Export': 'import Dashboard_Aggregate_Export',
+    'Dashboard_Query_Service': 'import Dashboard_Query_Service',
+    'Bitmap_Index': 'import Bitmap_Index',
+    'Density_Binning': 'import Density_Binning',
+    'Figure_Cache': 'import Figure_Cache',
+    'Histogram_Kernel': 'import Histogram_Kernel',
+    'Execution_Backends': 'import Execution_Backends',
+    'Batched_Trend_Regression': 'import Batched_Trend_Regression',
+    'Group_Significance_Tests': 'import Group_Significance_Tests',
+    'Bootstrap_Confidence_Intervals': 'import Bootstrap_Confidence_Intervals',
+    'Approximate_Distinct_Counts': 'import Approximate_Distinct_Counts',
+    'Streaming_Heavy_Hitters': 'import Streaming_Heavy_Hitters',
+    'Stratified_Sampling': 'import Stratified_Sampling',
+    'Incremental_Aggregates': 'import Incremental_Aggregates',
+    'Imputation_Plan': 'import Imputation_Plan',
+    'Netflix_Imputer': 'import Netflix_Imputer',
+    'KNN_Imputation': 'import KNN_Imputation'
+}
+
+# Startup budget per entry point (milliseconds, on top of bare interpreter start)
+IMPORT_BUDGET_MS = 1000
+
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'scipy', 'sklearn', 'plotly']
+
+
+def measure_startup(statement, repeats=3):
+    """Best-of-N wall time and the heavy top-level packages loaded by `statement`"""
+    best = float('inf')
+    loaded = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                                   cwd=PIPELINE_DIR, capture_output=True, text=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        if completed.returncode != 0:
+            raise RuntimeError(f"'{statement}' failed:\n{completed.stderr[-2000:]}")
+        best = min(best, elapsed)
+
+        imported = set()
+        for line in completed.stderr.splitlines():
+            if line.startswith('import time:') and '|' in line:
+                imported.add(line.rsplit('|', 1)[1].strip().split('.')[0])
+        loaded = [module for module in HEAVY_MODULES if module in imported]
+
+    return best, loaded
+
+
+def run_import_benchmark(entry_points=None, budget_ms=IMPORT_BUDGET_MS, output_path=DEFAULT_OUTPUT):
+    """Record import time per entry point and flag entry points over budget"""
+    entry_points = entry_points or ENTRY_POINTS
+
+    print("⏱️  IMPORT TIME BENCHMARK")
+    print("=" * 70)
+
+    baseline_ms, _ = measure_startup('pass')
+    print(f"Bare interpreter start: {baseline_ms:.0f} ms")
+    print("+" + "-" * 68 + "+")
+    print("| {:<45} | {:>8} | {:>7} |".format("Entry point", "Import", "Budget"))
+    print("+" + "-" * 68 + "+")
+
+    results = {}
+    for name, statement in entry_points.items():
+        total_ms, heavy = measure_startup(statement)
+        import_ms = max(total_ms - baseline_ms, 0.0)
+        within_budget = import_ms <= budget_ms
+        results[name] = {
+            'import_ms': round(import_ms, 1),
+            'heavy_modules_loaded': heavy,
+            'within_budget': within_budget
+        }
+        status = 'OK' if within_budget else 'OVER'
+        print("| {:<45} | {:>5.0f} ms | {:>7} |".format(name, import_ms, status))
+        if heavy:
+            print(f"|   eager heavy imports: {', '.join(heavy):<44}|")
+    print("+" + "-" * 68 + "+")
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'baseline_ms': round(baseline_ms, 1),
+        'budget_ms': budget_ms,
+        'entry_points': results
+    }
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {output_path}")
+
+    return report
+
+
+# Example usage: python Import_Time_Benchmark.py  (exit code 1 if any entry point is over budget)
+if __name__ == "__main__":
+    report = run_import_benchmark()
+    over_budget = [name for name, result in report['entry_points'].items() if not result['within_budget']]
+    if over_budget:
+        print(f"⚠️  Over budget: {', '.join(over_budget)}")
+        sys.exit(1)
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+# Imputation plan from Step 1: column -> grouping used for its median
+IMPUTATION_PLAN = {
+    'IMDb_Rating': ['Genre', 'Content_Type'],
+    'Budget_Million_USD': ['Content_Type'],
+    'Netflix_Views_Million': ['Release_Year'],
+    'Director_Experience_Years': []
+}
+
+
+def impute_partition(df, medians):
+    """Fill missing values from {column: (group medians, global median)} per IMPUTATION_PLAN"""
+    df = df.copy()
+    for column, by in IMPUTATION_PLAN.items():
+        if column not in medians:
+            continue
+        group_medians, global_median = medians[column]
+        if by:
+            keys = pd.MultiIndex.from_frame(df[by]) if len(by) > 1 else pd.Index(df[by[0]])
+            fill = group_medians.reindex(keys).to_numpy(dtype=float)
+            fill = np.where(np.isnan(fill), global_median, fill)
+            df[column] = df[column].fillna(pd.Series(fill, index=df.index))
+        else:
+            df[column] = df[column].fillna(global_median)
+    return df
+
+
+# Example usage
+if __name__ == "__main__":
+    titles = pd.DataFrame({
+        'Genre': ['Drama', 'Drama', 'Comedy', 'Comedy'],
+        'Content_Type': ['Movie', 'Movie', 'Movie', 'Series'],
+        'IMDb_Rating': [7.5, np.nan, 6.0, np.nan]
+    })
+    group_medians = titles.groupby(IMPUTATION_PLAN['IMDb_Rating'])['IMDb_Rating'].median().dropna()
+    filled = impute_partition(titles, {'IMDb_Rating': (group_medians, titles['IMDb_Rating'].median())})
+    print(filled)
+    print(f"✅ Drama movie from its group median, Comedy series from the overall median: "
+          f"{filled['IMDb_Rating'].tolist() == [7.5, 7.5, 6.0, 6.75]}")
@@ -1,54 +1,50 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+from Aggregate_Cube import NetflixAggregateCube
+from Bitmap_Index import NetflixBitmapIndex
+from Bootstrap_Confidence_Intervals import bootstrap_grouped_means, format_interval
+from Density_Binning import DensityGrid, DENSITY_THRESHOLD
+from Figure_Cache import default_figure_cache, show_images
+from Histogram_Kernel import rating_tier_histogram
+from Execution_Backends import aggregate
+from Group_Significance_Tests import compare_groups, significance_summary
+from Lazy_Imports import lazy_import
+from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+from Stage_Instrumentation import traced
+from Stratified_Sampling import stratified_sample
+from Streaming_Heavy_Hitters import top_counts
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for professional visualizations
-plt.style.use('default')
-sns.set_palette("Set2")
+# Plotting libraries are only imported when a chart is first drawn, so the
+# text-only findings report starts without them
+plt = lazy_import('matplotlib.pyplot')
+sns = lazy_import('seaborn')
+
+# Display names of the rating tiers, lowest first
+RATING_QUALITY_LABELS = ['Below Average (<6.0)', 'Average (6.0-6.9)', 'Good (7.0-7.9)', 'Excellent (8.0+)']
 
 class NetflixVisualization:
-    def __init__(self):
+    def __init__(self, df=None, backend=None):
         """Initialize Netflix Visualization class"""
-        self.df = self.create_sample_data()
-        self.setup_plot_style()
+        self.df = df if df is not None else self.create_sample_data()
+        # Execution backend for the group-by aggregations (Execution_Backends)
+        self.backend = backend
+        self.cube = None
+        self.bitmap_index = None
+        self.plot_style_ready = False
     
-    def create_sample_data(self):
+    def create_sample_data(self, n_samples=300):
         """Create realistic Netflix Originals dataset"""
-        np.random.seed(42)
-        
-        # Define categories
-        genres = ['Drama', 'Comedy', 'Action', 'Thriller', 'Documentary', 
-                 'Horror', 'Romance', 'Sci-Fi', 'Crime', 'Animation']
-        languages = ['English', 'Spanish', 'French', 'German', 'Korean', 
-                    'Japanese', 'Hindi', 'Portuguese', 'Italian']
-        
-        n_samples = 300
-        
-        # Create realistic data with correlations
-        base_ratings = np.random.normal(6.5, 1.3, n_samples)
-        
-        data = {
-            'Title': [f'Netflix Original {i+1}' for i in range(n_samples)],
-            'Genre': np.random.choice(genres, n_samples, 
-                                    p=[0.18, 0.15, 0.12, 0.10, 0.08, 0.07, 0.08, 0.06, 0.09, 0.07]),
-            'Language': np.random.choice(languages, n_samples,
-                                       p=[0.35, 0.15, 0.08, 0.06, 0.08, 0.06, 0.07, 0.05, 0.10]),
-            'Runtime': np.clip(np.random.normal(105, 25, n_samples).astype(int), 60, 180),
-            'IMDb_Rating': np.clip(base_ratings, 3.5, 9.5),
-            'Release_Year': np.random.choice(range(2016, 2024), n_samples,
-                                           p=[0.05, 0.08, 0.12, 0.15, 0.18, 0.20, 0.15, 0.07]),
-            'Number_of_Votes': np.random.lognormal(8, 1.5, n_samples).astype(int),
-            'Budget_Category': np.random.choice(['Low', 'Medium', 'High'], n_samples,
-                                              p=[0.4, 0.4, 0.2])
-        }
+        generator = NetflixCatalogueGenerator(n_rows=n_samples, seed=42,
+                                              start_date='2016-01-01', end_date='2023-12-31')
+        df = generator.to_frame().rename(columns={'Runtime_Minutes': 'Runtime',
+                                                  'IMDb_Votes': 'Number_of_Votes'})
+        df['Runtime'] = df['Runtime'].clip(60, 180)
+        df['IMDb_Rating'] = df['IMDb_Rating'].clip(3.5, 9.5)
+        df['Budget_Category'] = self.budget_tiers(df['Budget_Million_USD'])
         
         # Add some realistic correlations
-        df = pd.DataFrame(data)
-        
         # Higher budget tends to have slightly higher ratings
         budget_boost = {'Low': 0, 'Medium': 0.2, 'High': 0.4}
         df['IMDb_Rating'] += df['Budget_Category'].map(budget_boost)
@@ -64,8 +60,38 @@ class NetflixVisualization:
         
         return df
     
+    @staticmethod
+    def budget_tiers(budget):
+        """Budget tiers: bottom 40%, middle 40%, top 20% of production budgets"""
+        return pd.qcut(budget, q=[0, 0.4, 0.8, 1.0], labels=['Low', 'Medium', 'High']).astype(str)
+    
+    @classmethod
+    def from_catalogue(cls, catalogue, backend=None):
+        """Create the visualization from a pipeline catalogue (generator or cleaned schema)"""
+        df = catalogue.rename(columns={'Runtime_Minutes': 'Runtime', 'IMDb_Votes': 'Number_of_Votes'})
+        if 'Budget_Category' not in df.columns:
+            budget_column = 'Budget_Million_USD' if 'Budget_Million_USD' in df.columns else 'Production_Budget_Million'
+            df['Budget_Category'] = cls.budget_tiers(df[budget_column])
+        if 'Release_Year' not in df.columns:
+            df['Release_Year'] = pd.to_datetime(df['Release_Date']).dt.year
+        return cls(df, backend=backend)
+    
+    def get_cube(self):
+        """Build (once) the aggregate cube that answers rating roll-ups"""
+        if self.cube is None:
+            self.cube = NetflixAggregateCube().build(self.df)
+        return self.cube
+    
+    def get_bitmap_index(self):
+        """Build (once) the bitmap index that answers filter selections and counts"""
+        if self.bitmap_index is None:
+            self.bitmap_index = NetflixBitmapIndex().build(self.df)
+        return self.bitmap_index
+    
     def setup_plot_style(self):
         """Setup consistent plot styling"""
+        plt.style.use('default')
+        sns.set_palette("Set2")
         plt.rcParams.update({
             'figure.figsize': (12, 8),
             'axes.titlesize': 14,
@@ -76,61 +102,164 @@ class NetflixVisualization:
             'figure.titlesize': 16
         })
     
-    def create_overview_dashboard(self):
-        """Create comprehensive overview dashboard of key findings"""
-        fig = plt.figure(figsize=(20, 15))
-        fig.suptitle('Netflix Originals IMDb Ratings Analysis - Key Findings Overview', 
-                     fontsize=20, fontweight='bold', y=0.98)
-        
-        # 1. Rating Distribution
-        plt.subplot(3, 3, 1)
-        self.df['IMDb_Rating'].hist(bins=25, alpha=0.7, color='skyblue', edgecolor='black')
-        plt.axvline(self.df['IMDb_Rating'].mean(), color='red', linestyle='--', 
-                   label=f'Mean: {self.df["IMDb_Rating"].mean():.2f}')
+    def compute_chart_aggregates(self, genre=None, language=None, year_range=None, rating_range=None, top_n=8):
+        """Chart payloads (rating histogram, genre means, yearly series, languages, top titles) for one filter"""
+        # Categorical filters resolve on the bitmap index; only the rating range reads a column
+        filters = {}
+        if genre is not None:
+            filters['Genre'] = genre if isinstance(genre, str) else list(genre)
+        if language is not None:
+            filters['Language'] = language if isinstance(language, str) else list(language)
+        if year_range is not None:
+            filters['Release_Year'] = tuple(year_range)
+        view = self.df.iloc[self.get_bitmap_index().rows(**filters)] if filters else self.df
+        if rating_range is not None:
+            view = view[view['IMDb_Rating'].between(*rating_range)]
+        view = view[view['IMDb_Rating'].notna()]
+        
+        # 0.5-wide rating bins over 0-10
+        bin_index = np.clip((view['IMDb_Rating'].to_numpy() * 2).astype(int), 0, 19)
+        rating_counts = np.bincount(bin_index, minlength=20)
+        
+        rating_aggs = {'mean': ('IMDb_Rating', 'mean'), 'count': ('IMDb_Rating', 'count')}
+        genre_stats = aggregate(view, 'Genre', rating_aggs, self.backend)
+        genre_stats = genre_stats.sort_values('mean', ascending=False)
+        yearly_stats = aggregate(view, 'Release_Year', rating_aggs, self.backend)
+        language_counts = top_counts(view['Language'], 8)
+        top_rated = view.nlargest(top_n, 'IMDb_Rating')
+        
+        return {
+            'n_titles': int(len(view)),
+            'mean_rating': round(float(view['IMDb_Rating'].mean()), 4) if len(view) else None,
+            'rating_histogram': {
+                'bin_start': [i * 0.5 for i in range(20)],
+                'count': rating_counts.tolist()
+            },
+            'genre_ratings': {
+                'genre': [str(g) for g in genre_stats.index],
+                'mean': genre_stats['mean'].round(4).tolist(),
+                'count': genre_stats['count'].astype(int).tolist()
+            },
+            'yearly': {
+                'year': [int(y) for y in yearly_stats.index],
+                'mean': yearly_stats['mean'].round(4).tolist(),
+                'count': yearly_stats['count'].astype(int).tolist()
+            },
+            'languages': {
+                'language': [str(l) for l in language_counts.index],
+                'count': language_counts.astype(int).tolist()
+            },
+            'top_rated': {
+                'title': top_rated['Title'].astype(str).tolist(),
+                'genre': top_rated['Genre'].astype(str).tolist(),
+                'year': top_rated['Release_Year'].astype(int).tolist(),
+                'rating': top_rated['IMDb_Rating'].round(2).tolist()
+            }
+        }
+    
+    def overview_panels(self, density=None):
+        """Input aggregate and drawing function of each overview dashboard panel
+        
+        density=None draws panel 5 as a binned density grid once the catalogue
+        has more than DENSITY_THRESHOLD titles; True/False forces either mode.
+        """
+        cube = self.get_cube()
+        if density is None:
+            density = len(self.df) > DENSITY_THRESHOLD
+        
+        ratings = self.df['IMDb_Rating'].dropna()
+        counts, edges = np.histogram(ratings, bins=25)
+        
+        if density:
+            runtime_rating = DensityGrid.from_values(self.df['Runtime'], self.df['IMDb_Rating'], x_bins=60, y_bins=40)
+        else:
+            # Points come from a stratified sample so the panel draws in constant
+            # time; the trend line is still fitted on every title
+            valid = self.df[['Runtime', 'IMDb_Rating']].dropna()
+            runtime_rating = {
+                'points': stratified_sample(self.df, columns=['Runtime', 'IMDb_Rating']),
+                'trend': np.polyfit(valid['Runtime'], valid['IMDb_Rating'], 1)
+            }
+        
+        # Rating quality tiers, best first
+        rating_tiers = rating_tier_histogram(self.df['IMDb_Rating'], labels=RATING_QUALITY_LABELS)['count'][::-1]
+        
+        return [
+            ('rating_distribution', {'counts': counts, 'edges': edges, 'mean': ratings.mean()},
+             self._draw_rating_distribution),
+            ('genre_ratings', cube.rollup('Genre')['mean'].sort_values(ascending=True), self._draw_genre_ratings),
+            ('yearly_ratings', cube.rollup('Release_Year')['mean'], self._draw_yearly_ratings),
+            ('language_share', top_counts(self.df['Language'], 8), self._draw_language_share),
+            ('runtime_vs_rating', runtime_rating,
+             self._draw_runtime_density if density else self._draw_runtime_scatter),
+            ('budget_ratings', cube.rollup('Budget_Category')['mean'], self._draw_budget_ratings),
+            ('genre_counts', self.df['Genre'].value_counts(), self._draw_genre_counts),
+            ('rating_quality', rating_tiers[rating_tiers > 0], self._draw_rating_quality),
+            ('language_ratings', cube.rollup('Language')[['mean', 'count']], self._draw_language_ratings)
+        ]
+    
+    # 1. Rating Distribution
+    @staticmethod
+    def _draw_rating_distribution(data):
+        plt.hist(data['edges'][:-1], bins=data['edges'], weights=data['counts'],
+                 alpha=0.7, color='skyblue', edgecolor='black')
+        plt.axvline(data['mean'], color='red', linestyle='--', 
+                   label=f'Mean: {data["mean"]:.2f}')
         plt.xlabel('IMDb Rating')
         plt.ylabel('Frequency')
         plt.title('Distribution of IMDb Ratings')
         plt.legend()
         plt.grid(True, alpha=0.3)
-        
-        # 2. Ratings by Genre
-        plt.subplot(3, 3, 2)
-        genre_ratings = self.df.groupby('Genre')['IMDb_Rating'].mean().sort_values(ascending=True)
+    
+    # 2. Ratings by Genre
+    @staticmethod
+    def _draw_genre_ratings(genre_ratings):
         genre_ratings.plot(kind='barh', color='lightcoral')
         plt.xlabel('Average IMDb Rating')
         plt.title('Average Rating by Genre')
         plt.grid(True, alpha=0.3)
-        
-        # 3. Ratings Over Time
-        plt.subplot(3, 3, 3)
-        yearly_ratings = self.df.groupby('Release_Year')['IMDb_Rating'].mean()
+    
+    # 3. Ratings Over Time
+    @staticmethod
+    def _draw_yearly_ratings(yearly_ratings):
         plt.plot(yearly_ratings.index, yearly_ratings.values, marker='o', linewidth=2, markersize=6)
         plt.xlabel('Release Year')
         plt.ylabel('Average IMDb Rating')
         plt.title('Rating Trends Over Time')
         plt.grid(True, alpha=0.3)
-        
-        # 4. Language Distribution
-        plt.subplot(3, 3, 4)
-        language_counts = self.df['Language'].value_counts().head(8)
+    
+    # 4. Language Distribution
+    @staticmethod
+    def _draw_language_share(language_counts):
         plt.pie(language_counts.values, labels=language_counts.index, autopct='%1.1f%%', startangle=90)
         plt.title('Content Distribution by Language')
-        
-        # 5. Runtime vs Rating Scatter
-        plt.subplot(3, 3, 5)
-        plt.scatter(self.df['Runtime'], self.df['IMDb_Rating'], alpha=0.6, s=50)
+    
+    # 5. Runtime vs Rating Scatter
+    @staticmethod
+    def _draw_runtime_scatter(data):
+        points = data['points']
+        plt.scatter(points['Runtime'], points['IMDb_Rating'], alpha=0.6, s=50)
         # Add trend line
-        z = np.polyfit(self.df['Runtime'], self.df['IMDb_Rating'], 1)
-        p = np.poly1d(z)
-        plt.plot(self.df['Runtime'], p(self.df['Runtime']), "r--", alpha=0.8)
+        p = np.poly1d(data['trend'])
+        plt.plot(points['Runtime'], p(points['Runtime']), "r--", alpha=0.8)
         plt.xlabel('Runtime (minutes)')
         plt.ylabel('IMDb Rating')
         plt.title('Runtime vs IMDb Rating')
         plt.grid(True, alpha=0.3)
-        
-        # 6. Budget Category Impact
-        plt.subplot(3, 3, 6)
-        budget_ratings = self.df.groupby('Budget_Category')['IMDb_Rating'].mean()
+    
+    # 5. Runtime vs Rating as binned counts plus a trend line fitted from the bins' sufficient statistics
+    @staticmethod
+    def _draw_runtime_density(grid):
+        grid.plot()
+        plt.legend()
+        plt.xlabel('Runtime (minutes)')
+        plt.ylabel('IMDb Rating')
+        plt.title('Runtime vs IMDb Rating')
+        plt.grid(True, alpha=0.3)
+    
+    # 6. Budget Category Impact
+    @staticmethod
+    def _draw_budget_ratings(budget_ratings):
         budget_order = ['Low', 'Medium', 'High']
         budget_ratings = budget_ratings.reindex(budget_order)
         bars = plt.bar(budget_ratings.index, budget_ratings.values, 
@@ -144,41 +273,28 @@ class NetflixVisualization:
             plt.text(bar.get_x() + bar.get_width()/2., height + 0.01,
                     f'{height:.2f}', ha='center', va='bottom')
         plt.grid(True, alpha=0.3)
-        
-        # 7. Genre Popularity (Count)
-        plt.subplot(3, 3, 7)
-        genre_counts = self.df['Genre'].value_counts()
+    
+    # 7. Genre Popularity (Count)
+    @staticmethod
+    def _draw_genre_counts(genre_counts):
         genre_counts.plot(kind='bar', color='mediumpurple', alpha=0.8)
         plt.xlabel('Genre')
         plt.ylabel('Number of Titles')
         plt.title('Number of Titles by Genre')
         plt.xticks(rotation=45)
         plt.grid(True, alpha=0.3)
-        
-        # 8. Rating Quality Categories
-        plt.subplot(3, 3, 8)
-        # Categorize ratings
-        def categorize_rating(rating):
-            if rating >= 8.0:
-                return 'Excellent (8.0+)'
-            elif rating >= 7.0:
-                return 'Good (7.0-7.9)'
-            elif rating >= 6.0:
-                return 'Average (6.0-6.9)'
-            else:
-                return 'Below Average (<6.0)'
-        
-        self.df['Rating_Category'] = self.df['IMDb_Rating'].apply(categorize_rating)
-        rating_cat_counts = self.df['Rating_Category'].value_counts()
-        
+    
+    # 8. Rating Quality Categories
+    @staticmethod
+    def _draw_rating_quality(rating_cat_counts):
         colors = ['gold', 'lightgreen', 'orange', 'lightcoral']
         plt.pie(rating_cat_counts.values, labels=rating_cat_counts.index, 
                autopct='%1.1f%%', colors=colors, startangle=90)
         plt.title('Distribution of Rating Quality')
-        
-        # 9. Top Languages by Average Rating
-        plt.subplot(3, 3, 9)
-        lang_ratings = self.df.groupby('Language')['IMDb_Rating'].agg(['mean', 'count'])
+    
+    # 9. Top Languages by Average Rating
+    @staticmethod
+    def _draw_language_ratings(lang_ratings):
         # Filter languages with at least 10 titles
         lang_ratings = lang_ratings[lang_ratings['count'] >= 10]
         lang_ratings = lang_ratings.sort_values('mean', ascending=True)
@@ -188,66 +304,97 @@ class NetflixVisualization:
         plt.xlabel('Average IMDb Rating')
         plt.title('Average Rating by Language\n(Min 10 titles)')
         plt.grid(True, alpha=0.3)
+    
+    @traced()
+    def create_overview_dashboard(self, density=None, figure_cache=None):
+        """Create comprehensive overview dashboard of key findings
+        
+        With a figure_cache (Figure_Cache.NetflixFigureCache) each panel is
+        rendered once per distinct input aggregate and reused on later runs;
+        the paths of the panel images are returned.
+        """
+        panels = self.overview_panels(density)
+        if not self.plot_style_ready:
+            self.setup_plot_style()
+            self.plot_style_ready = True
+        title = 'Netflix Originals IMDb Ratings Analysis - Key Findings Overview'
+        
+        if figure_cache is not None:
+            paths = [figure_cache.render(f"overview_{name}", data, draw, figsize=(20 / 3, 5))
+                     for name, data, draw in panels]
+            if figure_cache.fmt == 'png':
+                show_images(paths, ncols=3, figsize=(20, 15), title=title)
+            return paths
+        
+        fig = plt.figure(figsize=(20, 15))
+        fig.suptitle(title, fontsize=20, fontweight='bold', y=0.98)
+        for position, (name, data, draw) in enumerate(panels, start=1):
+            plt.subplot(3, 3, position)
+            draw(data)
         
         plt.tight_layout()
         plt.show()
     
+    @traced()
     def create_detailed_findings_report(self):
         """Generate detailed statistical findings"""
+        cube = self.get_cube()
+        # Confidence intervals for every group mean printed below (NETFLIX_BOOTSTRAP=1 resamples them)
+        intervals = bootstrap_grouped_means(self.df)
         print("="*60)
         print("NETFLIX ORIGINALS - KEY FINDINGS SUMMARY")
         print("="*60)
         
-        # Basic Statistics
+        # Basic Statistics (answered from the cube, not the raw rows)
+        overall = cube.rollup().iloc[0]
         print(f"\n📊 DATASET OVERVIEW:")
-        print(f"Total Netflix Originals Analyzed: {len(self.df)}")
-        print(f"Average IMDb Rating: {self.df['IMDb_Rating'].mean():.2f}")
-        print(f"Rating Standard Deviation: {self.df['IMDb_Rating'].std():.2f}")
-        print(f"Highest Rated: {self.df['IMDb_Rating'].max():.2f}")
-        print(f"Lowest Rated: {self.df['IMDb_Rating'].min():.2f}")
+        print(f"Total Netflix Originals Analyzed: {int(overall['rows'])}")
+        print(f"Average IMDb Rating: {overall['mean']:.2f}")
+        print(f"Rating Standard Deviation: {overall['std']:.2f}")
+        print(f"Highest Rated: {overall['max']:.2f}")
+        print(f"Lowest Rated: {overall['min']:.2f}")
         
         # Genre Analysis
         print(f"\n🎭 GENRE INSIGHTS:")
-        genre_stats = self.df.groupby('Genre')['IMDb_Rating'].agg(['mean', 'count', 'std'])
+        genre_stats = cube.rollup('Genre')[['mean', 'count', 'var', 'std']]
         best_genre = genre_stats['mean'].idxmax()
         worst_genre = genre_stats['mean'].idxmin()
-        print(f"Best Performing Genre: {best_genre} (Avg: {genre_stats.loc[best_genre, 'mean']:.2f})")
-        print(f"Worst Performing Genre: {worst_genre} (Avg: {genre_stats.loc[worst_genre, 'mean']:.2f})")
+        print(f"Best Performing Genre: {best_genre} ({format_interval(intervals['Genre'], best_genre)})")
+        print(f"Worst Performing Genre: {worst_genre} ({format_interval(intervals['Genre'], worst_genre)})")
+        # Significance from the cube's per-genre moments (no second pass over the rows)
+        print(significance_summary(genre_stats, compare_groups(genre_stats), 'Genre'))
         print(f"Most Produced Genre: {genre_stats['count'].idxmax()} ({genre_stats['count'].max()} titles)")
         
         # Language Analysis
         print(f"\n🌍 LANGUAGE INSIGHTS:")
-        lang_stats = self.df.groupby('Language')['IMDb_Rating'].agg(['mean', 'count'])
+        lang_stats = cube.rollup('Language')[['mean', 'count', 'var']]
         lang_stats = lang_stats[lang_stats['count'] >= 5]  # Filter for significance
         best_lang = lang_stats['mean'].idxmax()
-        print(f"Best Performing Language: {best_lang} (Avg: {lang_stats.loc[best_lang, 'mean']:.2f})")
-        print(f"Most Common Language: {self.df['Language'].mode()[0]} ({self.df['Language'].value_counts().iloc[0]} titles)")
+        print(f"Best Performing Language: {best_lang} ({format_interval(intervals['Language'], best_lang)})")
+        print(significance_summary(lang_stats, compare_groups(lang_stats), 'Language'))
+        language_counts = self.get_bitmap_index().value_counts('Language')
+        print(f"Most Common Language: {language_counts.index[0]} ({language_counts.iloc[0]} titles)")
         
         # Yearly Trends
         print(f"\n📈 YEARLY TRENDS:")
-        yearly_stats = self.df.groupby('Release_Year')['IMDb_Rating'].mean()
+        yearly_stats = cube.rollup('Release_Year')['mean']
         best_year = yearly_stats.idxmax()
         worst_year = yearly_stats.idxmin()
-        print(f"Best Year for Ratings: {best_year} (Avg: {yearly_stats[best_year]:.2f})")
-        print(f"Worst Year for Ratings: {worst_year} (Avg: {yearly_stats[worst_year]:.2f})")
+        print(f"Best Year for Ratings: {best_year} ({format_interval(intervals['Release_Year'], best_year)})")
+        print(f"Worst Year for Ratings: {worst_year} ({format_interval(intervals['Release_Year'], worst_year)})")
         
         # Budget Impact
         print(f"\n💰 BUDGET IMPACT:")
-        budget_stats = self.df.groupby('Budget_Category')['IMDb_Rating'].mean()
+        budget_stats = cube.rollup('Budget_Category')['mean']
         for budget, rating in budget_stats.items():
-            print(f"{budget} Budget: {rating:.2f} average rating")
+            budget_ci = intervals['Budget_Category'].loc[budget]
+            print(f"{budget} Budget: {rating:.2f} average rating (95% CI {budget_ci['ci_low']:.2f}-{budget_ci['ci_high']:.2f})")
         
         # Quality Distribution
         print(f"\n⭐ QUALITY DISTRIBUTION:")
-        excellent = len(self.df[self.df['IMDb_Rating'] >= 8.0])
-        good = len(self.df[(self.df['IMDb_Rating'] >= 7.0) & (self.df['IMDb_Rating'] < 8.0)])
-        average = len(self.df[(self.df['IMDb_Rating'] >= 6.0) & (self.df['IMDb_Rating'] < 7.0)])
-        below_avg = len(self.df[self.df['IMDb_Rating'] < 6.0])
-        
-        print(f"Excellent (8.0+): {excellent} titles ({excellent/len(self.df)*100:.1f}%)")
-        print(f"Good (7.0-7.9): {good} titles ({good/len(self.df)*100:.1f}%)")
-        print(f"Average (6.0-6.9): {average} titles ({average/len(self.df)*100:.1f}%)")
-        print(f"Below Average (<6.0): {below_avg} titles ({below_avg/len(self.df)*100:.1f}%)")
+        tiers = rating_tier_histogram(self.df['IMDb_Rating'], labels=RATING_QUALITY_LABELS)
+        for label, row in tiers[::-1].iterrows():
+            print(f"{label}: {int(row['count'])} titles ({row['percent']:.1f}%)")
         
         print("\n" + "="*60)
     
@@ -256,8 +403,8 @@ class NetflixVisualization:
         print("Starting Netflix Originals IMDb Analysis...")
         print("Generating Initial Visual Representation of Key Findings...\n")
         
-        # Create the main dashboard
-        self.create_overview_dashboard()
+        # Create the main dashboard (panels whose inputs did not change come from the figure cache)
+        self.create_overview_dashboard(figure_cache=default_figure_cache())
         
         # Generate detailed findings report
         self.create_detailed_findings_report()
@@ -0,0 +1,152 @@
+import os
+import numpy as np
+from Lazy_Imports import lazy_import
+from Stage_Instrumentation import traced
+
+# scikit-learn is only imported once an index is built
+neighbors = lazy_import('sklearn.neighbors')
+
+# Columns filled from similar titles
+KNN_TARGETS = ['IMDb_Rating', 'Budget_Million_USD', 'Netflix_Views_Million']
+
+# Features titles are compared on (a title missing one sits at the feature's
+# mean) and the skewed ones that are log-scaled first
+KNN_FEATURES = ['Runtime_Minutes', 'IMDb_Votes', 'Cast_Rating', 'Release_Year', 'Seasons', 'Episodes_Total']
+KNN_LOG_FEATURES = ['IMDb_Votes', 'Episodes_Total']
+
+KNN_NEIGHBORS = 10
+
+# Titles per kneighbors() call; bounds the neighbor arrays of one batch
+KNN_QUERY_BATCH = 50_000
+
+# Strategy of the cleaning step: group medians unless NETFLIX_IMPUTATION=knn
+IMPUTATION_ENV_VAR = 'NETFLIX_IMPUTATION'
+IMPUTATION_STRATEGIES = ('median', 'knn')
+
+
+class NetflixKNNImputer:
+    """Fill missing values with the mean of the k most similar titles
+
+    Titles are compared on standardized KNN_FEATURES. The donors (titles
+    with every target present) go into one KD-tree or ball tree, so a
+    lookup costs about O(k log n) instead of a full row of the n x n
+    distance matrix that brute-force KNN imputation builds. Each
+    incomplete title is queried once, in batches of KNN_QUERY_BATCH, and
+    the answer fills all of its missing targets.
+    """
+
+    def __init__(self, targets=None, features=None, n_neighbors=KNN_NEIGHBORS, algorithm='kd_tree',
+                 n_jobs=None, batch_rows=KNN_QUERY_BATCH):
+        self.targets = list(targets or KNN_TARGETS)
+        self.features = list(features or KNN_FEATURES)
+        self.n_neighbors = n_neighbors
+        self.algorithm = algorithm
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.batch_rows = batch_rows
+        self.index = None
+
+    def _raw_features(self, df):
+        values = df[self.features_].to_numpy(dtype=float, na_value=np.nan)
+        for position, column in enumerate(self.features_):
+            if column in KNN_LOG_FEATURES:
+                values[:, position] = np.log1p(values[:, position])
+        return values
+
+    def _scaled_features(self, df):
+        """Standardized feature matrix; a missing feature sits at the fitted mean"""
+        scaled = (self._raw_features(df) - self.center_) / self.scale_
+        return np.where(np.isnan(scaled), 0.0, scaled)
+
+    @traced()
+    def fit(self, df):
+        """Learn the feature scaling and index the donor titles"""
+        self.targets_ = [col for col in self.targets if col in df.columns]
+        self.features_ = [col for col in self.features
+                          if col in df.columns and col not in self.targets_ and df[col].notna().any()]
+        if not self.features_:
+            raise ValueError(f"None of the KNN features have values in the catalogue: {self.features}")
+
+        # Scaling from the values present; missing features are filled with the mean
+        raw = self._raw_features(df)
+        self.center_ = np.nanmean(raw, axis=0)
+        spread = np.nanstd(raw, axis=0)
+        self.scale_ = np.where(spread > 0, spread, 1.0)
+
+        donors = df[self.targets_].notna().all(axis=1).to_numpy()
+        if not donors.any():
+            raise ValueError("No title has every KNN target present to serve as a donor")
+        self.donor_values_ = df.loc[donors, self.targets_].to_numpy(dtype=float, na_value=np.nan)
+        self.index = neighbors.NearestNeighbors(n_neighbors=min(self.n_neighbors, int(donors.sum())),
+                                                algorithm=self.algorithm, n_jobs=self.n_jobs)
+        self.index.fit(self._scaled_features(df)[donors])
+        return self
+
+    @traced()
+    def transform(self, df):
+        """Copy of `df` with missing targets filled from each title's nearest donors"""
+        if self.index is None:
+            raise ValueError("KNN imputer is not fitted; call fit() first")
+        df = df.copy()
+        filled = df[self.targets_].to_numpy(dtype=float, na_value=np.nan, copy=True)
+        rows = np.flatnonzero(np.isnan(filled).any(axis=1))
+        if len(rows) == 0:
+            return df
+
+        features = self._scaled_features(df.iloc[rows])
+        for start in range(0, len(rows), self.batch_rows):
+            batch = rows[start:start + self.batch_rows]
+            _, neighbor_ids = self.index.kneighbors(features[start:start + self.batch_rows])
+            # (titles, k, targets) -> mean over the k neighbors
+            estimates = self.donor_values_[neighbor_ids].mean(axis=1)
+            filled[batch] = np.where(np.isnan(filled[batch]), estimates, filled[batch])
+
+        for position, column in enumerate(self.targets_):
+            df[column] = filled[:, position]
+        return df
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    # Exact nearest neighbors: the tree agrees with a brute-force search
+    small = NetflixCatalogueGenerator(n_rows=10_000, seed=42, null_rate=0.05).to_frame()
+    imputer = NetflixKNNImputer()
+    filled = imputer.fit_transform(small)
+
+    missing = small['Budget_Million_USD'].isnull().to_numpy()
+    donors = small[imputer.targets_].notna().all(axis=1).to_numpy()
+    scaled = imputer._scaled_features(small)
+    distances = ((scaled[missing][:, None, :] - scaled[donors][None, :, :]) ** 2).sum(axis=2)
+    nearest = np.argsort(distances, axis=1, kind='stable')[:, :imputer.n_neighbors]
+    brute = small.loc[donors, 'Budget_Million_USD'].to_numpy()[nearest].mean(axis=1)
+    agree = np.isclose(filled.loc[missing, 'Budget_Million_USD'].to_numpy(), brute).sum()
+    print(f"✅ Budgets from the tree match a brute-force search for {agree} of {missing.sum()} titles")
+    print(f"✅ Missing targets left: {int(filled[imputer.targets_].isnull().sum().sum())}")
+
+    # A feature missing for some titles is still used for the others
+    gappy = small.copy()
+    gappy.loc[gappy.sample(frac=0.1, random_state=0).index, 'Cast_Rating'] = np.nan
+    gappy_imputer = NetflixKNNImputer().fit(gappy)
+    print(f"✅ Partially missing Cast_Rating kept as a feature: {'Cast_Rating' in gappy_imputer.features_}, "
+          f"missing targets left: {int(gappy_imputer.transform(gappy)[imputer.targets_].isnull().sum().sum())}")
+
+    from sklearn.impute import KNNImputer
+    print("\n⏱️  Imputation time (tree vs sklearn KNNImputer, which scans n x n distances):")
+    for n_rows in [10_000, 30_000, 200_000]:
+        df = NetflixCatalogueGenerator(n_rows=n_rows, seed=42, null_rate=0.05).to_frame()
+        start = time.perf_counter()
+        knn = NetflixKNNImputer().fit(df)
+        knn.transform(df)
+        tree_s = time.perf_counter() - start
+        if n_rows > 30_000:
+            print(f"   {n_rows:>9,} titles: tree {tree_s:.2f}s")
+            continue
+        matrix = np.column_stack([knn._scaled_features(df), df[knn.targets_].to_numpy(dtype=float)])
+        start = time.perf_counter()
+        KNNImputer(n_neighbors=knn.n_neighbors).fit_transform(matrix)
+        print(f"   {n_rows:>9,} titles: tree {tree_s:.2f}s, KNNImputer {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,26 @@
+import importlib
+
+
+class LazyModule:
+    """Stand-in for a heavy module that is only imported on first attribute access"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name):
+    """Return a proxy for `name`; the real import happens when it is first used"""
+    return LazyModule(name)
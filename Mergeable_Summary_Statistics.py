@@ -0,0 +1,289 @@
+import pandas as pd
+import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
+from Stage_Instrumentation import traced
+
+# Below this many rows a partition is not worth shipping to another process
+MIN_ROWS_PER_PARTITION = 50_000
+
+
+class MomentState:
+    """Mergeable count/mean/central-moment state for one numeric column"""
+
+    def __init__(self, n=0, mean=0.0, m2=0.0, m3=0.0, m4=0.0, min_value=np.nan, max_value=np.nan):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+        self.m3 = m3
+        self.m4 = m4
+        self.min = min_value
+        self.max = max_value
+
+    @classmethod
+    def from_values(cls, values):
+        """Build the state from the non-null values of one partition"""
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return cls()
+
+        mean = values.mean()
+        delta = values - mean
+        delta_sq = delta * delta
+        return cls(
+            n=len(values),
+            mean=mean,
+            m2=delta_sq.sum(),
+            m3=(delta_sq * delta).sum(),
+            m4=(delta_sq * delta_sq).sum(),
+            min_value=values.min(),
+            max_value=values.max()
+        )
+
+    def merge(self, other):
+        """Combine two partition states (Pebay's pairwise update formulas)"""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            return other
+
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_sq = delta * delta
+
+        mean = self.mean + delta * nb / n
+        m2 = self.m2 + other.m2 + delta_sq * na * nb / n
+        m3 = (self.m3 + other.m3
+              + delta_sq * delta * na * nb * (na - nb) / n ** 2
+              + 3 * delta * (na * other.m2 - nb * self.m2) / n)
+        m4 = (self.m4 + other.m4
+              + delta_sq * delta_sq * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+              + 6 * delta_sq * (na * na * other.m2 + nb * nb * self.m2) / n ** 2
+              + 4 * delta * (na * other.m3 - nb * self.m3) / n)
+
+        return MomentState(n, mean, m2, m3, m4, min(self.min, other.min), max(self.max, other.max))
+
+    def variance(self):
+        """Sample variance (ddof=1), as pandas .var()"""
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan
+
+    def skewness(self):
+        """Adjusted Fisher-Pearson skewness, as pandas .skew()"""
+        if self.n < 3 or self.m2 == 0:
+            return np.nan if self.n < 3 else 0.0
+        n = self.n
+        g1 = np.sqrt(n) * self.m3 / self.m2 ** 1.5
+        return np.sqrt(n * (n - 1)) / (n - 2) * g1
+
+    def kurtosis(self):
+        """Bias-corrected excess kurtosis, as pandas .kurtosis()"""
+        if self.n < 4 or self.m2 == 0:
+            return np.nan if self.n < 4 else 0.0
+        n = self.n
+        adjustment = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        return n * (n + 1) * (n - 1) * self.m4 / ((n - 2) * (n - 3) * self.m2 ** 2) - adjustment
+
+
+def merge_moment_frames(moments, levels=None, dropna=False):
+    """Merge rows of (count, mean, m2) per group of the index `levels` (all rows when None)
+
+    The n-way form of MomentState.merge for the mean and m2 (Chan et al.):
+    m2 = sum(m2_i) + sum(n_i * (mean_i - mean) ** 2), which never subtracts
+    large squared sums. A row with a negative count and m2 retracts those
+    values from its group. Returns count, mean and m2 per group (one row
+    when `levels` is None).
+    """
+    count = moments['count'].astype(float)
+    has_values = count != 0
+    row_mean = moments['mean'].where(has_values, 0.0)
+    frame = pd.DataFrame({'count': count, 'weighted': count * row_mean}, index=moments.index)
+    if levels:
+        grouped = frame.groupby(level=levels, observed=True, dropna=dropna)
+        total, weighted = grouped['count'].transform('sum'), grouped['weighted'].transform('sum')
+    else:
+        total, weighted = frame['count'].sum(), frame['weighted'].sum()
+    mean = weighted / (total.where(total != 0) if levels else (total or np.nan))
+    frame['m2'] = moments['m2'].where(has_values, 0.0) + (count * (row_mean - mean) ** 2).where(has_values, 0.0)
+
+    sums = (frame.groupby(level=levels, observed=True, dropna=dropna).sum() if levels
+            else frame.sum().to_frame().T)
+    return pd.DataFrame({
+        'count': sums['count'],
+        'mean': sums['weighted'] / sums['count'].where(sums['count'] != 0),
+        'm2': sums['m2'].clip(lower=0)
+    })
+
+
+class QuantileSketch:
+    """Mergeable t-digest style quantile sketch
+
+    Values are kept exactly while the sketch holds at most `exact_limit`
+    points, so small catalogues get the same quantiles as pandas. Beyond
+    that, sorted points are folded into centroids whose size is bounded by
+    the arcsine scale function, which keeps the tails precise.
+    """
+
+    def __init__(self, compression=1000, exact_limit=None):
+        self.compression = compression
+        self.exact_limit = exact_limit if exact_limit is not None else 20 * compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.nan
+        self.max = np.nan
+
+    @classmethod
+    def from_values(cls, values, compression=1000, exact_limit=None):
+        """Build a sketch from the non-null values of one partition"""
+        sketch = cls(compression, exact_limit)
+        values = np.sort(values[~np.isnan(values)])
+        if len(values):
+            sketch.means = values
+            sketch.weights = np.ones(len(values))
+            sketch.min = values[0]
+            sketch.max = values[-1]
+            sketch._compress()
+        return sketch
+
+    def _compress(self):
+        """Fold centroids together once the sketch exceeds its exact limit"""
+        if len(self.means) <= self.exact_limit:
+            return
+
+        total = self.weights.sum()
+        cumulative = np.cumsum(self.weights)
+        q_mid = (cumulative - self.weights / 2) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_mid - 1)
+        buckets = np.floor(k - k[0]).astype(np.int64)
+
+        weights = np.bincount(buckets, weights=self.weights)
+        sums = np.bincount(buckets, weights=self.weights * self.means)
+        keep = weights > 0
+        self.weights = weights[keep]
+        self.means = sums[keep] / self.weights
+
+    def merge(self, other):
+        """Combine two sketches into one"""
+        merged = QuantileSketch(self.compression, self.exact_limit)
+        means = np.concatenate([self.means, other.means])
+        weights = np.concatenate([self.weights, other.weights])
+        order = np.argsort(means, kind='mergesort')
+        merged.means = means[order]
+        merged.weights = weights[order]
+        merged.min = np.nanmin([self.min, other.min]) if len(means) else np.nan
+        merged.max = np.nanmax([self.max, other.max]) if len(means) else np.nan
+        merged._compress()
+        return merged
+
+    def quantile(self, q):
+        """Linear-interpolated quantile (identical to pandas while exact)"""
+        if len(self.means) == 0:
+            return np.nan
+
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - (self.weights + 1) / 2
+        positions = np.concatenate([[0], centers, [total - 1]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * (total - 1), positions, values))
+
+
+class ColumnSummaryState:
+    """Moments and quantile sketch for one numeric column"""
+
+    def __init__(self, moments, sketch):
+        self.moments = moments
+        self.sketch = sketch
+
+    @classmethod
+    def from_values(cls, values, compression=1000):
+        """Build both states from one partition of a column"""
+        values = np.asarray(values, dtype=float)
+        return cls(MomentState.from_values(values), QuantileSketch.from_values(values, compression))
+
+    def merge(self, other):
+        """Combine two partition states of the same column"""
+        return ColumnSummaryState(self.moments.merge(other.moments), self.sketch.merge(other.sketch))
+
+
+def compute_partition_state(frame, compression=1000):
+    """Summarize every column of one partition (runs inside a worker process)"""
+    return {
+        col: ColumnSummaryState.from_values(frame[col].to_numpy(dtype=float, na_value=np.nan), compression)
+        for col in frame.columns
+    }
+
+
+def merge_partition_states(states):
+    """Reduce a list of per-partition states into one state per column"""
+    merged = dict(states[0])
+    for state in states[1:]:
+        for col, col_state in state.items():
+            merged[col] = merged[col].merge(col_state)
+    return merged
+
+
+@traced()
+def summarize_numeric(df, n_jobs=None, n_partitions=None, compression=1000):
+    """Produce the describe() and additional-statistics tables in one parallel pass"""
+    numerical_cols = df.select_dtypes(include=[np.number]).columns
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    if n_partitions is None:
+        n_partitions = max(1, min(n_jobs, len(df) // MIN_ROWS_PER_PARTITION))
+
+    bounds = np.linspace(0, len(df), n_partitions + 1).astype(int)
+    partitions = [df[numerical_cols].iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+    if n_jobs > 1 and len(partitions) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(partitions))) as pool:
+            states = list(pool.map(compute_partition_state, partitions, [compression] * len(partitions)))
+    else:
+        states = [compute_partition_state(partition, compression) for partition in partitions]
+
+    merged = merge_partition_states(states)
+
+    describe_rows = {}
+    additional_rows = {}
+    for col in numerical_cols:
+        moments = merged[col].moments
+        sketch = merged[col].sketch
+        q1, q2, q3 = (sketch.quantile(q) for q in (0.25, 0.5, 0.75))
+        std = np.sqrt(moments.variance())
+
+        describe_rows[col] = {
+            'count': float(moments.n),
+            'mean': moments.mean if moments.n else np.nan,
+            'std': std,
+            'min': moments.min,
+            '25%': q1,
+            '50%': q2,
+            '75%': q3,
+            'max': moments.max
+        }
+        additional_rows[col] = {
+            'Skewness': moments.skewness(),
+            'Kurtosis': moments.kurtosis(),
+            'Variance': moments.variance(),
+            'Std_Dev': std,
+            'Range': moments.max - moments.min,
+            'IQR': q3 - q1
+        }
+
+    summary_stats = pd.DataFrame(describe_rows, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'])
+    additional_stats = pd.DataFrame.from_dict(additional_rows, orient='index')
+    return summary_stats, additional_stats
+
+
+# Example usage
+if __name__ == "__main__":
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    df = NetflixCatalogueGenerator(n_rows=200_000, seed=42).to_frame()
+    df = df[['IMDb_Rating', 'Runtime_Minutes', 'Budget_Million_USD', 'IMDb_Votes']]
+
+    summary_stats, additional_stats = summarize_numeric(df, n_partitions=4)
+
+    print("📊 DESCRIPTIVE STATISTICS (one parallel pass)")
+    print(summary_stats.round(2))
+    print("\n📈 ADDITIONAL STATISTICAL MEASURES:")
+    print(additional_stats.round(3))
@@ -0,0 +1,376 @@
+import pandas as pd
+import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
+from Imputation_Plan import IMPUTATION_PLAN, impute_partition
+from Mergeable_Summary_Statistics import QuantileSketch
+from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+from Stage_Instrumentation import traced
+
+# Columns flagged with the IQR rule and the quantile-binned features
+OUTLIER_COLUMNS = ['IMDb_Rating', 'Runtime_Minutes', 'Budget_Million_USD', 'Netflix_Views_Million']
+QUANTILE_FEATURES = {
+    'Budget_Category': ('Budget_Million_USD', [0.25, 0.5, 0.75],
+                        ['Low_Budget', 'Medium_Budget', 'High_Budget', 'Premium_Budget']),
+    'Popularity_Tier': ('IMDb_Votes', [1 / 3, 2 / 3], ['Niche', 'Popular', 'Viral'])
+}
+
+# Numeric columns whose correlation matrix is merged across shards
+CORRELATION_COLUMNS = ['Runtime_Minutes', 'Budget_Million_USD', 'IMDb_Votes', 'Netflix_Views_Million',
+                       'Director_Experience_Years', 'Cast_Rating', 'IMDb_Rating']
+
+SEASON_MAP = {12: 'Winter', 1: 'Winter', 2: 'Winter',
+              3: 'Spring', 4: 'Spring', 5: 'Spring',
+              6: 'Summer', 7: 'Summer', 8: 'Summer',
+              9: 'Fall', 10: 'Fall', 11: 'Fall'}
+
+
+# ============================================================================
+# ROW-LOCAL STAGES (safe to run on any shard independently)
+# ============================================================================
+
+def clean_partition(df):
+    """Coerce types, clip ratings to 1-10 and drop duplicate rows within a shard
+
+    Both sharding keys send identical rows to the same shard, so dropping
+    duplicates per shard is equivalent to dropping them globally.
+    """
+    df = df.copy()
+    if 'Release_Date' in df.columns:
+        df['Release_Date'] = pd.to_datetime(df['Release_Date'], errors='coerce')
+        if 'Release_Year' not in df.columns:
+            df['Release_Year'] = df['Release_Date'].dt.year
+
+    for col in ['IMDb_Rating', 'Cast_Rating']:
+        if col in df.columns:
+            df[col] = df[col].clip(1, 10)
+
+    return df.drop_duplicates()
+
+
+def validate_partition(df):
+    """Flag rows that fail the Step 2 integrity rules"""
+    flags = pd.DataFrame(index=df.index)
+    if 'IMDb_Rating' in df.columns:
+        flags['Invalid_Rating'] = (df['IMDb_Rating'] < 1) | (df['IMDb_Rating'] > 10)
+    if 'Runtime_Minutes' in df.columns:
+        flags['Unrealistic_Runtime'] = (df['Runtime_Minutes'] < 5) | (df['Runtime_Minutes'] > 300)
+    if 'Release_Year' in df.columns:
+        flags['Pre_Netflix_Era'] = df['Release_Year'] < 2010
+    for col in ['IMDb_Votes', 'Budget_Million_USD', 'Runtime_Minutes']:
+        if col in df.columns:
+            flags[f'Negative_{col}'] = df[col] < 0
+
+    df = df.copy()
+    df['Integrity_Issues'] = flags.sum(axis=1).astype('int8')
+    return df, flags.sum().to_dict()
+
+
+def derive_features_partition(df):
+    """Temporal, categorical and ratio features that need only the row itself"""
+    df = df.copy()
+
+    if 'Release_Date' in df.columns:
+        df['Release_Month'] = df['Release_Date'].dt.month
+        df['Release_Quarter'] = df['Release_Date'].dt.quarter
+        df['Release_Day_of_Week'] = df['Release_Date'].dt.dayofweek
+        df['Release_Season'] = df['Release_Month'].map(SEASON_MAP)
+    if 'Release_Year' in df.columns:
+        df['Age_Years'] = 2024 - df['Release_Year']
+        df['Is_Recent'] = (df['Age_Years'] <= 2).astype(int)
+
+    if 'Runtime_Minutes' in df.columns:
+        df['Runtime_Category'] = pd.cut(df['Runtime_Minutes'],
+                                        bins=[0, 90, 120, 180, float('inf')],
+                                        labels=['Short', 'Medium', 'Long', 'Very_Long'])
+    if 'Language' in df.columns:
+        df['Language_Group'] = np.where(df['Language'] == 'English', 'English', 'Non_English')
+
+    if {'Budget_Million_USD', 'Runtime_Minutes'} <= set(df.columns):
+        df['Budget_per_Minute'] = df['Budget_Million_USD'] / df['Runtime_Minutes']
+    if {'Netflix_Views_Million', 'Budget_Million_USD'} <= set(df.columns):
+        df['Views_per_Dollar'] = df['Netflix_Views_Million'] / df['Budget_Million_USD']
+    if {'IMDb_Rating', 'IMDb_Votes'} <= set(df.columns):
+        df['Rating_Popularity_Score'] = df['IMDb_Rating'] * np.log1p(df['IMDb_Votes'])
+    for source, target in [('Budget_Million_USD', 'Budget_Log'),
+                           ('Netflix_Views_Million', 'Views_Log'),
+                           ('IMDb_Votes', 'Votes_Log')]:
+        if source in df.columns:
+            df[target] = np.log1p(df[source])
+
+    return df
+
+
+# ============================================================================
+# MERGEABLE STATE (combined across shards between the two phases)
+# ============================================================================
+
+class CoMomentState:
+    """Mergeable mean vector and co-moment matrix for correlations"""
+
+    def __init__(self, columns, n=0, mean=None, comoment=None):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = n
+        self.mean = mean if mean is not None else np.zeros(k)
+        self.comoment = comoment if comoment is not None else np.zeros((k, k))
+
+    @classmethod
+    def from_frame(cls, df, columns):
+        """Build the state from the complete rows of one shard"""
+        values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+        values = values[~np.isnan(values).any(axis=1)]
+        if len(values) == 0:
+            return cls(columns)
+        mean = values.mean(axis=0)
+        centered = values - mean
+        return cls(columns, len(values), mean, centered.T @ centered)
+
+    def merge(self, other):
+        """Combine two shard states"""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            return other
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.n / n
+        comoment = self.comoment + other.comoment + np.outer(delta, delta) * self.n * other.n / n
+        return CoMomentState(self.columns, n, mean, comoment)
+
+    def correlation(self):
+        """Pearson correlation matrix over the merged complete rows"""
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = self.comoment / np.outer(scale, scale)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+def _sketch(values):
+    return QuantileSketch.from_values(np.asarray(values, dtype=float))
+
+
+def _non_null(values):
+    return values[~np.isnan(values)]
+
+
+def _group_values(df, by, column):
+    """Non-missing values of `column` per group of `by`, and those of rows with no group
+
+    The values themselves are sent to the merge step, so the merged
+    medians are exact however the catalogue is sharded (a sketch is only
+    exact up to its capacity).
+    """
+    values = np.asarray(df[column], dtype=float)
+    if not by:
+        return {(): _non_null(values)}, values[:0]
+    keys = by[0] if len(by) == 1 else by
+    groups = {}
+    grouped = np.zeros(len(values), dtype=bool)
+    for key, positions in df.groupby(keys, observed=True).indices.items():
+        groups[key] = _non_null(values[positions])
+        grouped[positions] = True
+    return groups, _non_null(values[~grouped])
+
+
+def _median(values):
+    return float(np.median(values)) if len(values) else np.nan
+
+
+def _merge_value_maps(maps):
+    """Concatenate the per-shard value arrays of every group"""
+    parts = {}
+    for value_map in maps:
+        for key, values in value_map.items():
+            parts.setdefault(key, []).append(values)
+    return {key: np.concatenate(arrays) for key, arrays in parts.items()}
+
+
+def _merge_sketch_maps(maps):
+    merged = {}
+    for sketch_map in maps:
+        for key, sketch in sketch_map.items():
+            merged[key] = merged[key].merge(sketch) if key in merged else sketch
+    return merged
+
+
+def quantile_cutoffs(sketches):
+    """IQR outlier bounds and quantile-feature bin edges from {column: sketch with .quantile(q)}"""
+    bounds = {}
+    for column in OUTLIER_COLUMNS:
+        if column in sketches:
+            q1, q3 = sketches[column].quantile(0.25), sketches[column].quantile(0.75)
+            bounds[column] = (q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+
+    bins = {}
+    for feature, (column, quantiles, _) in QUANTILE_FEATURES.items():
+        if column in sketches:
+            edges = [sketches[column].quantile(q) for q in quantiles]
+            bins[feature] = [-np.inf] + edges + [np.inf]
+    return bounds, bins
+
+
+def _phase_one(shard):
+    """Clean and validate a shard, then collect the states the merge step needs"""
+    shard, issue_counts = validate_partition(clean_partition(shard))
+
+    state = {'issues': issue_counts, 'groups': {}, 'globals': {}}
+    for column, by in IMPUTATION_PLAN.items():
+        if column in shard.columns and set(by) <= set(shard.columns):
+            state['groups'][column] = _group_values(shard, by, column)
+    for column in set(OUTLIER_COLUMNS) | {spec[0] for spec in QUANTILE_FEATURES.values()}:
+        if column in shard.columns:
+            state['globals'][column] = _sketch(shard[column])
+    return shard, state
+
+
+def _phase_two(shard, merged):
+    """Impute, derive features and flag outliers using the merged global state"""
+    shard = impute_partition(shard, merged['medians'])
+    shard = derive_features_partition(shard)
+
+    for feature, (column, _, labels) in QUANTILE_FEATURES.items():
+        if feature in merged['bins']:
+            shard[feature] = pd.cut(shard[column], bins=merged['bins'][feature], labels=labels)
+
+    for column, (lower, upper) in merged['bounds'].items():
+        shard[f'{column}_Outlier'] = (shard[column] < lower) | (shard[column] > upper)
+
+    corr_columns = [col for col in CORRELATION_COLUMNS if col in shard.columns]
+    return shard, CoMomentState.from_frame(shard, corr_columns)
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+class NetflixParallelRunner:
+    def __init__(self, n_jobs=None, shard_by='title_hash', n_shards=None):
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.shard_by = shard_by
+        self.n_shards = n_shards or self.n_jobs
+        self.merged = {}
+        self.issue_counts = {}
+        self.correlation_matrix = None
+
+    def shard_ids(self, df):
+        """Shard number of every row, by Release_Year or by a hash of Title"""
+        if self.shard_by == 'release_year':
+            years = df['Release_Year'] if 'Release_Year' in df.columns else pd.to_datetime(df['Release_Date']).dt.year
+            shard_ids = pd.factorize(years, sort=True)[0] % self.n_shards
+        elif self.shard_by == 'title_hash':
+            shard_ids = pd.util.hash_pandas_object(df['Title'], index=False).to_numpy() % self.n_shards
+        else:
+            raise ValueError(f"Unknown shard key: {self.shard_by}")
+        return np.asarray(shard_ids)
+
+    def shard(self, df):
+        """Split the catalogue into one frame per shard"""
+        shard_ids = self.shard_ids(df)
+        shards = [df[shard_ids == i] for i in range(self.n_shards)]
+        return [shard for shard in shards if len(shard)]
+
+    def _map(self, func, *iterables):
+        if self.n_jobs > 1:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as pool:
+                return list(pool.map(func, *iterables))
+        return list(map(func, *iterables))
+
+    def _merge_states(self, states):
+        """Explicit merge step for the globally dependent statistics
+
+        Imputation medians are exact; outlier bounds and bin edges come from
+        the merged quantile sketches.
+        """
+        medians = {}
+        for column, by in IMPUTATION_PLAN.items():
+            shard_values = [state['groups'][column] for state in states if column in state['groups']]
+            if not shard_values:
+                continue
+            group_values = _merge_value_maps([groups for groups, _ in shard_values])
+            every_value = np.concatenate(list(group_values.values()) + [rest for _, rest in shard_values])
+            group_medians = pd.Series({key: _median(values) for key, values in group_values.items()},
+                                      dtype=float)
+            if len(by) > 1:
+                group_medians.index = pd.MultiIndex.from_tuples(group_medians.index, names=by)
+            medians[column] = (group_medians, _median(every_value))
+
+        bounds, bins = quantile_cutoffs(_merge_sketch_maps([state['globals'] for state in states]))
+
+        issues = {}
+        for state in states:
+            for issue, count in state['issues'].items():
+                issues[issue] = issues.get(issue, 0) + count
+
+        return {
+            'medians': medians,
+            'bounds': bounds,
+            'bins': bins,
+            'issues': issues
+        }
+
+    @traced()
+    def run(self, df):
+        """Run cleaning, validation, feature derivation and outlier flagging across shards"""
+        print("=" * 60)
+        print(f"PARALLEL PIPELINE: {len(df)} titles, {self.n_jobs} workers, shard by {self.shard_by}")
+        print("=" * 60)
+
+        shards = self.shard(df)
+        print(f"🧩 Split catalogue into {len(shards)} shards")
+
+        # Phase 1: row-local cleaning and validation, plus partial states
+        results = self._map(_phase_one, shards)
+        shards = [shard for shard, _ in results]
+        self.merged = self._merge_states([state for _, state in results])
+        self.issue_counts = self.merged['issues']
+        print("✅ Phase 1: cleaned and validated shards, merged medians/quantiles")
+
+        # Phase 2: imputation, features and outlier flags with merged state
+        results = self._map(_phase_two, shards, [self.merged] * len(shards))
+        processed = pd.concat([shard for shard, _ in results]).sort_index()
+
+        corr_state = results[0][1]
+        for _, state in results[1:]:
+            corr_state = corr_state.merge(state)
+        self.correlation_matrix = corr_state.correlation()
+        print("✅ Phase 2: imputed, engineered features and flagged outliers")
+
+        print(f"\n📊 Integrity issues: {self.issue_counts}")
+        for column in self.merged['bounds']:
+            print(f"   • {column}: {int(processed[f'{column}_Outlier'].sum())} outliers flagged")
+
+        return processed
+
+
+# Example usage
+if __name__ == "__main__":
+    df = NetflixCatalogueGenerator(n_rows=20_000, chunk_size=5_000, seed=42, null_rate=0.05).to_frame()
+
+    runner = NetflixParallelRunner(n_jobs=4, shard_by='title_hash')
+    result = runner.run(df)
+
+    print(f"\n📋 Output shape: {result.shape}, remaining missing ratings: {result['IMDb_Rating'].isnull().sum()}")
+    print("\n🔗 Merged correlation matrix:")
+    print(runner.correlation_matrix.round(3))
+
+    # Exact medians: more than a sketch's 20,000 values per group, and the
+    # same imputed values however the catalogue is sharded (bin edges and
+    # outlier bounds still come from sketches)
+    large = NetflixCatalogueGenerator(n_rows=300_000, seed=7, null_rate=0.05).to_frame()
+    coarse = NetflixParallelRunner(n_jobs=2, n_shards=2)
+    fine = NetflixParallelRunner(n_jobs=2, n_shards=8)
+    coarse_result, fine_result = coarse.run(large), fine.run(large)
+    cleaned = clean_partition(large)
+    for column, by in IMPUTATION_PLAN.items():
+        group_medians, global_median = coarse.merged['medians'][column]
+        if by:
+            expected = cleaned.groupby(by)[column].median()
+            pd.testing.assert_series_equal(group_medians.sort_index(), expected.sort_index(),
+                                           check_names=False, check_index_type=False)
+        assert global_median == cleaned[column].median()
+    imputed = list(IMPUTATION_PLAN)
+    pd.testing.assert_frame_equal(coarse_result[imputed], fine_result[imputed])
+    print(f"\n✅ Merged medians equal the serial medians "
+          f"(largest group: {cleaned.groupby(['Content_Type']).size().max()} titles), "
+          f"2 and 8 shards impute the same values")
@@ -1,21 +1,24 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from Aggregate_Cube import NetflixAggregateCube
+from Lazy_Imports import lazy_import
+from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+from Stage_Instrumentation import traced
+from Histogram_Kernel import rating_tier_histogram
+from Execution_Backends import aggregate
+from Batched_Trend_Regression import batched_trends
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for better visualizations
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# scipy is only imported once an analysis first needs it
+stats = lazy_import('scipy.stats')
 
 class NetflixPatternAnalyzer:
-    def __init__(self, df):
+    def __init__(self, df, backend=None):
         self.df = df.copy()
+        self.cube = None
+        # Execution backend for the group-by aggregations (Execution_Backends)
+        self.backend = backend
         self.prepare_data()
     
     def prepare_data(self):
@@ -30,27 +33,53 @@ class NetflixPatternAnalyzer:
         if 'IMDB Score' in self.df.columns:
             self.df['IMDB Score'] = pd.to_numeric(self.df['IMDB Score'], errors='coerce')
     
+    def release_trends(self, slices=None, zero_fill=False):
+        """Yearly release-count trend (slope, R², p-value) of the catalogue and of every Genre, Language and Genre × Language slice"""
+        if slices is None:
+            slices = [[]] + [keys for keys in [['Genre'], ['Language'], ['Genre', 'Language']]
+                             if all(key in self.df.columns for key in keys)]
+        return batched_trends(self.df, x='Year', slices=slices, zero_fill=zero_fill)
+    
+    def get_cube(self):
+        """Build (once) the aggregate cube of IMDB Score moments by Genre and Year"""
+        if self.cube is None:
+            self.cube = NetflixAggregateCube(['Genre', 'Year'], measure='IMDB Score').build(self.df)
+        return self.cube
+    
+    @traced()
     def temporal_trends(self):
         """Analyze temporal patterns in Netflix releases and ratings"""
         print("=== TEMPORAL TRENDS ANALYSIS ===\n")
         
         # 1. Release trends over time
         if 'Year' in self.df.columns:
-            yearly_releases = self.df.groupby('Year').size()
-            yearly_avg_rating = self.df.groupby('Year')['IMDB Score'].mean()
+            yearly_releases = aggregate(self.df, 'Year', {'releases': ('Year', 'size')}, self.backend)['releases']
+            yearly_avg_rating = self.get_cube().rollup('Year')['mean']
             
             print("📈 Release Volume Trends:")
             print(f"   • Peak release year: {yearly_releases.idxmax()} ({yearly_releases.max()} releases)")
             print(f"   • Lowest release year: {yearly_releases.idxmin()} ({yearly_releases.min()} releases)")
             print(f"   • Average releases per year: {yearly_releases.mean():.1f}")
             
-            # Trend analysis
-            years = yearly_releases.index
-            releases = yearly_releases.values
-            slope, intercept, r_value, p_value, std_err = stats.linregress(years, releases)
+            # Trend analysis: one batched fit for the catalogue and every slice
+            trends = self.release_trends()
+            overall = trends.iloc[0]
+            slope = overall['slope']
             
             trend_direction = "increasing" if slope > 0 else "decreasing"
-            print(f"   • Overall trend: {trend_direction} (slope: {slope:.2f}, R²: {r_value**2:.3f})")
+            print(f"   • Overall trend: {trend_direction} (slope: {slope:.2f}, R²: {overall['r_squared']:.3f})")
+            
+            slice_trends = trends.iloc[1:]
+            significant = slice_trends[slice_trends['p_value'] < 0.05]
+            print(f"   • Slices with a significant trend (p < 0.05): {len(significant)} of {len(slice_trends)}")
+            for slice_name in ['Genre', 'Language']:
+                ranked = slice_trends[slice_trends['slice'] == slice_name].sort_values('slope')
+                if len(ranked):
+                    rising, falling = ranked.iloc[-1], ranked.iloc[0]
+                    print(f"   • Fastest growing {slice_name.lower()}: {rising[slice_name]} "
+                          f"({rising['slope']:+.2f}/year, p = {rising['p_value']:.3f})")
+                    print(f"   • Fastest shrinking {slice_name.lower()}: {falling[slice_name]} "
+                          f"({falling['slope']:+.2f}/year, p = {falling['p_value']:.3f})")
             
             print(f"\n⭐ Rating Trends Over Time:")
             print(f"   • Highest rated year: {yearly_avg_rating.idxmax()} (avg: {yearly_avg_rating.max():.2f})")
@@ -58,29 +87,39 @@ class NetflixPatternAnalyzer:
             
         # 2. Seasonal patterns
         if 'Month' in self.df.columns:
-            monthly_releases = self.df.groupby('Month').size()
-            monthly_ratings = self.df.groupby('Month')['IMDB Score'].mean()
+            monthly_stats = aggregate(self.df, 'Month', {
+                'releases': ('Month', 'size'),
+                'rating': ('IMDB Score', 'mean')
+            }, self.backend)
+            monthly_releases = monthly_stats['releases']
+            monthly_ratings = monthly_stats['rating']
             
             print(f"\n📅 Seasonal Release Patterns:")
             print(f"   • Peak release month: {monthly_releases.idxmax()} ({monthly_releases.max()} releases)")
             print(f"   • Lowest release month: {monthly_releases.idxmin()} ({monthly_releases.min()} releases)")
     
+    @traced()
     def genre_patterns(self):
         """Analyze patterns by genre"""
         print("\n=== GENRE PATTERNS ANALYSIS ===\n")
         
         if 'Genre' in self.df.columns:
             # Genre performance
-            genre_stats = self.df.groupby('Genre').agg({
-                'IMDB Score': ['mean', 'std', 'count'],
-                'Runtime': 'mean' if 'Runtime' in self.df.columns else lambda x: None
-            }).round(2)
+            genre_aggs = {
+                'mean': ('IMDB Score', 'mean'),
+                'std': ('IMDB Score', 'std'),
+                'count': ('IMDB Score', 'count')
+            }
+            if 'Runtime' in self.df.columns:
+                genre_aggs['Runtime'] = ('Runtime', 'mean')
+            genre_stats = aggregate(self.df, 'Genre', genre_aggs, self.backend).round(2)
             
-            genre_ratings = self.df.groupby('Genre')['IMDB Score'].mean().sort_values(ascending=False)
+            genre_cube = self.get_cube().rollup('Genre')
+            genre_ratings = genre_cube['mean'].sort_values(ascending=False)
             
             print("🎭 Genre Performance Rankings:")
             for i, (genre, rating) in enumerate(genre_ratings.head(5).items(), 1):
-                count = self.df[self.df['Genre'] == genre].shape[0]
+                count = genre_cube.loc[genre, 'rows']
                 print(f"   {i}. {genre}: {rating:.2f} avg rating ({count} titles)")
             
             print(f"\n📊 Genre Distribution:")
@@ -89,6 +128,7 @@ class NetflixPatternAnalyzer:
                 pct = (count / len(self.df)) * 100
                 print(f"   {i}. {genre}: {count} titles ({pct:.1f}%)")
     
+    @traced()
     def rating_distribution_patterns(self):
         """Analyze rating distribution patterns"""
         print("\n=== RATING DISTRIBUTION PATTERNS ===\n")
@@ -117,18 +157,13 @@ class NetflixPatternAnalyzer:
         print(f"   • Kurtosis: {kurtosis:.3f} ({'heavy-tailed' if kurtosis > 0 else 'light-tailed' if kurtosis < 0 else 'normal-tailed'})")
         
         # Rating categories
-        excellent = (ratings >= 8.0).sum()
-        good = ((ratings >= 7.0) & (ratings < 8.0)).sum()
-        average = ((ratings >= 6.0) & (ratings < 7.0)).sum()
-        poor = (ratings < 6.0).sum()
-        
-        total = len(ratings)
+        categories = rating_tier_histogram(ratings, labels=['Poor (<6.0)', 'Average (6.0-6.9)',
+                                                            'Good (7.0-7.9)', 'Excellent (8.0+)'])
         print(f"\n⭐ Rating Categories:")
-        print(f"   • Excellent (8.0+): {excellent} titles ({excellent/total*100:.1f}%)")
-        print(f"   • Good (7.0-7.9): {good} titles ({good/total*100:.1f}%)")
-        print(f"   • Average (6.0-6.9): {average} titles ({average/total*100:.1f}%)")
-        print(f"   • Poor (<6.0): {poor} titles ({poor/total*100:.1f}%)")
+        for label, row in categories[::-1].iterrows():
+            print(f"   • {label}: {int(row['count'])} titles ({row['percent']:.1f}%)")
     
+    @traced()
     def correlation_patterns(self):
         """Identify correlation patterns between variables"""
         print("\n=== CORRELATION PATTERNS ===\n")
@@ -158,6 +193,7 @@ class NetflixPatternAnalyzer:
         else:
             print("   • No strong correlations found (|r| > 0.5)")
     
+    @traced()
     def identify_anomalies(self):
         """Identify potential anomalies in the data"""
         print("\n=== ANOMALY DETECTION ===\n")
@@ -190,6 +226,7 @@ class NetflixPatternAnalyzer:
         print(f"   • Number of outliers: {len(z_outliers)}")
         print(f"   • Percentage of data: {len(z_outliers)/len(ratings)*100:.1f}%")
     
+    @traced()
     def run_full_analysis(self):
         """Run complete pattern analysis"""
         print("🎬 NETFLIX ORIGINALS - PATTERN & TREND ANALYSIS")
@@ -207,17 +244,8 @@ class NetflixPatternAnalyzer:
 # Example usage with sample data
 if __name__ == "__main__":
     # Create sample Netflix data for demonstration
-    np.random.seed(42)
-    
-    sample_data = {
-        'Title': [f'Netflix Original {i}' for i in range(1, 101)],
-        'Genre': np.random.choice(['Drama', 'Comedy', 'Action', 'Documentary', 'Horror', 'Romance'], 100),
-        'IMDB Score': np.random.normal(6.8, 1.2, 100).clip(3.0, 9.5),
-        'Runtime': np.random.normal(105, 25, 100).clip(80, 180),
-        'Premiere': pd.date_range('2015-01-01', '2024-12-31', periods=100)
-    }
-    
-    df = pd.DataFrame(sample_data)
+    df = NetflixCatalogueGenerator(n_rows=100, seed=42).to_frame().rename(
+        columns={'IMDb_Rating': 'IMDB Score', 'Runtime_Minutes': 'Runtime', 'Release_Date': 'Premiere'})
     
     # Initialize analyzer
     analyzer = NetflixPatternAnalyzer(df)
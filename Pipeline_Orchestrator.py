@@ -0,0 +1,269 @@
+import ast
+import hashlib
+import inspect
+import os
+import pickle
+import runpy
+import sys
+from Stage_Instrumentation import span
+
+PIPELINE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(PIPELINE_DIR, '.pipeline_cache')
+
+
+def _is_main_block(node):
+    """True for `if __name__ == "__main__":`, whose imports only the module's own example uses"""
+    test = getattr(node, 'test', None)
+    return (isinstance(node, ast.If) and isinstance(test, ast.Compare)
+            and isinstance(test.left, ast.Name) and test.left.id == '__name__'
+            and any(isinstance(c, ast.Constant) and c.value == '__main__' for c in test.comparators))
+
+
+def _import_nodes(tree):
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        yield node
+        pending.extend(child for child in ast.iter_child_nodes(node) if not _is_main_block(child))
+
+
+def local_dependencies(path):
+    """Repo modules a source file imports, directly or through other repo modules"""
+    found = set()
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        with open(current, 'rb') as f:
+            tree = ast.parse(f.read())
+        # A stage script runs as __main__, so its own main block counts
+        for node in (ast.walk(tree) if current == path else _import_nodes(tree)):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                module_path = os.path.join(PIPELINE_DIR, name.split('.')[0] + '.py')
+                if module_path not in found and module_path != path and os.path.exists(module_path):
+                    found.add(module_path)
+                    pending.append(module_path)
+    return sorted(found)
+
+
+class Stage:
+    """One pipeline step with declared inputs and outputs
+
+    A stage either runs one of the step scripts (its inputs are injected as
+    globals and its outputs read back from the script namespace) or calls a
+    plain function that takes the inputs as keyword arguments and returns a
+    dict of outputs. `env` names the environment variables that change what
+    the stage produces; their values are part of the cache key.
+    """
+
+    def __init__(self, name, outputs, inputs=(), script=None, func=None, env=()):
+        if (script is None) == (func is None):
+            raise ValueError(f"Stage '{name}' needs exactly one of script or func")
+        self.name = name
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.script = script
+        self.func = func
+        self.env = list(env)
+
+    def code_hash(self):
+        """Hash of the code that produces this stage's outputs, including every
+        repo module it imports (an edit to an imported helper invalidates the stage)"""
+        if self.script is not None:
+            path = os.path.join(PIPELINE_DIR, self.script)
+            with open(path, 'rb') as f:
+                code = f.read()
+        else:
+            path = inspect.getsourcefile(self.func)
+            code = inspect.getsource(self.func).encode('utf-8')
+        digest = hashlib.sha256(code)
+        for module_path in local_dependencies(path):
+            digest.update(os.path.basename(module_path).encode('utf-8'))
+            with open(module_path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def execute(self, inputs):
+        """Run the stage and return its outputs"""
+        with span(f"stage:{self.name}"):
+            if self.script is not None:
+                namespace = runpy.run_path(os.path.join(PIPELINE_DIR, self.script),
+                                           init_globals=dict(inputs), run_name='__main__')
+                return {name: namespace[name] for name in self.outputs}
+            return self.func(**inputs)
+
+
+def prepare_netflix_df(df_clean):
+    """Step 1 data setup: expose the cleaned catalogue as netflix_df for Steps 2 and 3"""
+    netflix_df = df_clean.rename(columns={'Budget_Million_USD': 'Production_Budget_Million'})
+    return {'netflix_df': netflix_df}
+
+
+DEFAULT_STAGES = [
+    Stage('cleaning', outputs=['df_clean', 'imputer'], script='Cleaning_and_handling_missing_values.py',
+          env=['NETFLIX_IMPUTATION']),
+    Stage('netflix_df', inputs=['df_clean'], outputs=['netflix_df'], func=prepare_netflix_df),
+    Stage('features', inputs=['df_clean'], outputs=['engineered_netflix_data', 'feature_engineering_summary'],
+          script='Feature_selection_and_engineering.py'),
+    Stage('integrity', inputs=['netflix_df'], outputs=['integrity_results'],
+          script='Data_Integrity_and_Consistency.py'),
+    Stage('summary', inputs=['netflix_df'], outputs=['summary_results'],
+          script='Summary_Statistics_and_Insights', env=['NETFLIX_BOOTSTRAP'])
+]
+
+
+class NetflixPipelineOrchestrator:
+    def __init__(self, stages=None, cache_dir=DEFAULT_CACHE_DIR):
+        self.stages = {stage.name: stage for stage in (stages or DEFAULT_STAGES)}
+        self.cache_dir = cache_dir
+        self.producers = {}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                if output in self.producers:
+                    raise ValueError(f"Output '{output}' is produced by more than one stage")
+                self.producers[output] = stage.name
+        self.keys = {}
+
+    def _stage_order(self, targets):
+        """Upstream-first order of every stage the targets depend on"""
+        order = []
+        visiting = set()
+
+        def visit(name):
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle at stage '{name}'")
+            visiting.add(name)
+            for input_name in self.stages[name].inputs:
+                if input_name not in self.producers:
+                    raise KeyError(f"No stage produces input '{input_name}' of '{name}'")
+                visit(self.producers[input_name])
+            visiting.discard(name)
+            order.append(name)
+
+        for target in targets:
+            visit(target)
+        return order
+
+    def stage_key(self, name):
+        """Cache key from the stage code hash, its environment settings and the keys of its upstream stages"""
+        if name not in self.keys:
+            stage = self.stages[name]
+            digest = hashlib.sha256()
+            digest.update(stage.name.encode('utf-8'))
+            digest.update(stage.code_hash().encode('utf-8'))
+            for variable in stage.env:
+                digest.update(f"{variable}={os.environ.get(variable, '')}".encode('utf-8'))
+            for input_name in stage.inputs:
+                digest.update(input_name.encode('utf-8'))
+                digest.update(self.stage_key(self.producers[input_name]).encode('utf-8'))
+            self.keys[name] = digest.hexdigest()
+        return self.keys[name]
+
+    def _cache_path(self, name):
+        return os.path.join(self.cache_dir, f"{name}-{self.stage_key(name)[:16]}.pkl")
+
+    def is_cached(self, name):
+        """True when this stage's outputs for the current code and inputs are on disk"""
+        return os.path.exists(self._cache_path(name))
+
+    def _load(self, name):
+        with open(self._cache_path(name), 'rb') as f:
+            return pickle.load(f)
+
+    def _store(self, name, outputs):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(name)
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(outputs, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+
+    def prune(self):
+        """Delete cached outputs of known stages whose key no longer matches the
+        current code, inputs and environment; returns the number removed"""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        current = {os.path.basename(self._cache_path(name)) for name in self.stages}
+        removed = 0
+        for entry in os.scandir(self.cache_dir):
+            stage_name = entry.name.rsplit('-', 1)[0]
+            if (stage_name in self.stages and entry.name.endswith(('.pkl', '.pkl.tmp'))
+                    and entry.name not in current):
+                os.remove(entry.path)
+                removed += 1
+        return removed
+
+    def run(self, targets=None, force=(), prune=True):
+        """Run the target stages, reusing memoized outputs wherever the key matches
+
+        Afterwards the outputs cached under superseded keys are deleted (switching
+        an environment setting back therefore recomputes the affected stages).
+        """
+        targets = list(targets or self.stages)
+        order = self._stage_order(targets)
+        self.keys = {}
+
+        # Stages whose outputs must be recomputed; cached stages upstream of
+        # them are only loaded, and cached stages nobody needs are not touched
+        to_run = [name for name in order if name in force or not self.is_cached(name)]
+        needed = set(to_run)
+        for name in to_run:
+            for input_name in self.stages[name].inputs:
+                needed.add(self.producers[input_name])
+        needed.update(name for name in targets)
+
+        print("=" * 60)
+        print("PIPELINE ORCHESTRATOR")
+        print("=" * 60)
+
+        results = {}
+        for name in order:
+            if name not in needed:
+                print(f"⏭️  {name}: cached, not needed")
+                continue
+
+            if name in to_run:
+                print(f"▶️  {name}: running (key {self.stage_key(name)[:12]})")
+                stage = self.stages[name]
+                inputs = {input_name: results[input_name] for input_name in stage.inputs}
+                outputs = stage.execute(inputs)
+                self._store(name, outputs)
+            else:
+                print(f"✅ {name}: loaded from cache (key {self.stage_key(name)[:12]})")
+                outputs = self._load(name)
+            results.update(outputs)
+
+        if prune:
+            removed = self.prune()
+            if removed:
+                print(f"🧹 Removed {removed} cached outputs from earlier code or settings")
+        return results
+
+    def status(self):
+        """Print whether each stage is cached for the current code"""
+        print("📋 PIPELINE STATUS")
+        print("-" * 40)
+        for name in self._stage_order(list(self.stages)):
+            stage = self.stages[name]
+            state = 'cached' if self.is_cached(name) else 'stale'
+            print(f"   {name:<12} {state:<7} inputs={stage.inputs} outputs={stage.outputs}")
+
+
+# Example usage: python Pipeline_Orchestrator.py [stage ...] [--force stage,...]
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    force = ()
+    if '--force' in args:
+        position = args.index('--force')
+        force = tuple(args[position + 1].split(','))
+        args = args[:position] + args[position + 2:]
+
+    orchestrator = NetflixPipelineOrchestrator()
+    orchestrator.run(args or None, force=force)
+    orchestrator.status()
@@ -294,63 +294,41 @@
     </div>
 
     <script>
-        // Sample Netflix Originals data
-        const netflixData = [
-            {title: "Stranger Things", genre: "Drama", rating: 8.7, year: 2016, runtime: 51, type: "Series"},
-            {title: "The Crown", genre: "Drama", rating: 8.6, year: 2016, runtime: 58, type: "Series"},
-            {title: "House of Cards", genre: "Drama", rating: 8.7, year: 2013, runtime: 51, type: "Series"},
-            {title: "Orange Is the New Black", genre: "Comedy", rating: 8.1, year: 2013, runtime: 60, type: "Series"},
-            {title: "Narcos", genre: "Crime", rating: 8.8, year: 2015, runtime: 49, type: "Series"},
-            {title: "The Witcher", genre: "Fantasy", rating: 8.2, year: 2019, runtime: 60, type: "Series"},
-            {title: "Ozark", genre: "Crime", rating: 8.4, year: 2017, runtime: 60, type: "Series"},
-            {title: "Dark", genre: "Sci-Fi", rating: 8.8, year: 2017, runtime: 60, type: "Series"},
-            {title: "Mindhunter", genre: "Crime", rating: 8.6, year: 2017, runtime: 54, type: "Series"},
-            {title: "The Umbrella Academy", genre: "Action", rating: 7.9, year: 2019, runtime: 55, type: "Series"},
-            {title: "Bridgerton", genre: "Romance", rating: 7.3, year: 2020, runtime: 60, type: "Series"},
-            {title: "The Queen's Gambit", genre: "Drama", rating: 8.5, year: 2020, runtime: 60, type: "Series"},
-            {title: "Squid Game", genre: "Thriller", rating: 8.0, year: 2021, runtime: 60, type: "Series"},
-            {title: "Money Heist", genre: "Crime", rating: 8.2, year: 2017, runtime: 70, type: "Series"},
-            {title: "Roma", genre: "Drama", rating: 7.7, year: 2018, runtime: 135, type: "Movie"},
-            {title: "The Irishman", genre: "Crime", rating: 7.8, year: 2019, runtime: 209, type: "Movie"},
-            {title: "Marriage Story", genre: "Drama", rating: 7.9, year: 2019, runtime: 137, type: "Movie"},
-            {title: "Bird Box", genre: "Horror", rating: 6.6, year: 2018, runtime: 124, type: "Movie"},
-            {title: "Extraction", genre: "Action", rating: 6.7, year: 2020, runtime: 116, type: "Movie"},
-            {title: "The Old Guard", genre: "Action", rating: 6.6, year: 2020, runtime: 125, type: "Movie"},
-            {title: "Enola Holmes", genre: "Mystery", rating: 6.6, year: 2020, runtime: 123, type: "Movie"},
-            {title: "Da 5 Bloods", genre: "War", rating: 6.5, year: 2020, runtime: 154, type: "Movie"},
-            {title: "I Care a Lot", genre: "Thriller", rating: 6.3, year: 2020, runtime: 118, type: "Movie"},
-            {title: "The Trial of the Chicago 7", genre: "Drama", rating: 7.8, year: 2020, runtime: 129, type: "Movie"},
-            {title: "Mank", genre: "Biography", rating: 6.8, year: 2020, runtime: 131, type: "Movie"},
-            {title: "The Power of the Dog", genre: "Drama", rating: 6.8, year: 2021, runtime: 126, type: "Movie"},
-            {title: "Don't Look Up", genre: "Comedy", rating: 7.2, year: 2021, runtime: 138, type: "Movie"},
-            {title: "Red Notice", genre: "Action", rating: 6.3, year: 2021, runtime: 118, type: "Movie"},
-            {title: "The Adam Project", genre: "Sci-Fi", rating: 6.7, year: 2022, runtime: 106, type: "Movie"},
-            {title: "Our Planet", genre: "Documentary", rating: 9.3, year: 2019, runtime: 50, type: "Series"},
-            {title: "Making a Murderer", genre: "Documentary", rating: 8.6, year: 2015, runtime: 60, type: "Series"},
-            {title: "Wild Wild Country", genre: "Documentary", rating: 8.2, year: 2018, runtime: 60, type: "Series"},
-            {title: "Tiger King", genre: "Documentary", rating: 7.5, year: 2020, runtime: 45, type: "Series"},
-            {title: "The Social Dilemma", genre: "Documentary", rating: 7.6, year: 2020, runtime: 94, type: "Movie"},
-            {title: "My Octopus Teacher", genre: "Documentary", rating: 8.1, year: 2020, runtime: 85, type: "Movie"},
-            {title: "American Factory", genre: "Documentary", rating: 7.4, year: 2019, runtime: 110, type: "Movie"},
-            {title: "Icarus", genre: "Documentary", rating: 7.9, year: 2017, runtime: 121, type: "Movie"},
-            {title: "Fyre", genre: "Documentary", rating: 7.2, year: 2019, runtime: 97, type: "Movie"}
-        ];
-
-        let filteredData = [...netflixData];
+        // Pre-aggregated catalogue written by Dashboard_Aggregate_Export.py: counts and
+        // sums per (genre, year, rating bin) cell plus top titles and runtime/rating
+        // density bins per genre and year, so filtering costs the same for 300 or
+        // 10 million titles
+        const AGGREGATES_URL = 'netflix_aggregates.json';
+
+        let aggregates = null;
+        let selection = null;
         let charts = {};
 
+        function loadAggregates() {
+            return fetch(AGGREGATES_URL)
+                .then(response => response.json())
+                .then(data => {
+                    aggregates = data;
+                });
+        }
+
         // Initialize filters
         function initializeFilters() {
-            const genres = [...new Set(netflixData.map(item => item.genre))].sort();
             const genreSelect = document.getElementById('genreFilter');
             
-            genres.forEach(genre => {
+            aggregates.genres.forEach((genre, index) => {
                 const option = document.createElement('option');
-                option.value = genre;
+                option.value = index;
                 option.textContent = genre;
                 genreSelect.appendChild(option);
             });
 
+            const yearFilter = document.getElementById('yearFilter');
+            yearFilter.min = aggregates.year_range[0];
+            yearFilter.max = aggregates.year_range[1];
+            yearFilter.value = aggregates.year_range[0];
+            document.getElementById('yearValue').textContent = yearFilter.value;
+
             // Event listeners
             document.getElementById('genreFilter').addEventListener('change', updateVisualizations);
             document.getElementById('yearFilter').addEventListener('input', updateFilters);
@@ -367,16 +345,47 @@
             updateVisualizations();
         }
 
+        // Titles from one of the exported title tables that pass the filters
+        function selectTitles(table, genre, minYear, minRating) {
+            const rows = [];
+            for (let i = 0; i < table.title.length; i++) {
+                if ((genre < 0 || table.genre[i] === genre) && table.year[i] >= minYear && table.rating[i] >= minRating) {
+                    rows.push({
+                        title: table.title[i],
+                        genre: aggregates.genres[table.genre[i]],
+                        year: table.year[i],
+                        rating: table.rating[i],
+                        runtime: table.runtime[i],
+                        type: table.type[i]
+                    });
+                }
+            }
+            return rows;
+        }
+
         function updateVisualizations() {
-            const genre = document.getElementById('genreFilter').value;
+            const genreValue = document.getElementById('genreFilter').value;
+            const genre = genreValue === 'all' ? -1 : parseInt(genreValue);
             const minYear = parseInt(document.getElementById('yearFilter').value);
             const minRating = parseFloat(document.getElementById('ratingFilter').value);
+            const minBin = Math.round(minRating / aggregates.rating_bin_width);
+
+            // Every filter is a union of whole cells
+            const cells = aggregates.cells;
+            const cellIndex = [];
+            for (let i = 0; i < cells.count.length; i++) {
+                if ((genre < 0 || cells.genre[i] === genre) && cells.year[i] >= minYear && cells.rating_bin[i] >= minBin) {
+                    cellIndex.push(i);
+                }
+            }
 
-            filteredData = netflixData.filter(item => {
-                return (genre === 'all' || item.genre === genre) &&
-                       item.year >= minYear &&
-                       item.rating >= minRating;
-            });
+            selection = {
+                genre: genre,
+                minYear: minYear,
+                minRating: minRating,
+                cells: cellIndex,
+                topTitles: selectTitles(aggregates.top_titles, genre, minYear, minRating)
+            };
 
             createRatingDistribution();
             createGenreChart();
@@ -392,23 +401,22 @@
                 charts.rating.destroy();
             }
 
-            const ratings = filteredData.map(item => item.rating);
-            const bins = [6, 6.5, 7, 7.5, 8, 8.5, 9, 9.5, 10];
-            const counts = new Array(bins.length - 1).fill(0);
-
-            ratings.forEach(rating => {
-                for (let i = 0; i < bins.length - 1; i++) {
-                    if (rating >= bins[i] && rating < bins[i + 1]) {
-                        counts[i]++;
-                        break;
-                    }
-                }
+            // 0.5-wide bars built from the finer cell rating bins
+            const cells = aggregates.cells;
+            const binsPerBar = Math.round(0.5 / aggregates.rating_bin_width);
+            const allCounts = new Array(20).fill(0);
+            selection.cells.forEach(i => {
+                allCounts[Math.min(Math.floor(cells.rating_bin[i] / binsPerBar), 19)] += cells.count[i];
             });
 
+            const firstBar = Math.max(allCounts.findIndex(count => count > 0), 0);
+            const counts = allCounts.slice(firstBar);
+            const bins = counts.map((_, i) => (firstBar + i) * 0.5);
+
             charts.rating = new Chart(ctx, {
                 type: 'bar',
                 data: {
-                    labels: bins.slice(0, -1).map(bin => `${bin}+`),
+                    labels: bins.map(bin => `${bin.toFixed(1)}+`),
                     datasets: [{
                         label: 'Count',
                         data: counts,
@@ -446,13 +454,15 @@
                 charts.genre.destroy();
             }
 
+            const cells = aggregates.cells;
             const genreStats = {};
-            filteredData.forEach(item => {
-                if (!genreStats[item.genre]) {
-                    genreStats[item.genre] = { total: 0, count: 0 };
+            selection.cells.forEach(i => {
+                const genre = aggregates.genres[cells.genre[i]];
+                if (!genreStats[genre]) {
+                    genreStats[genre] = { total: 0, count: 0 };
                 }
-                genreStats[item.genre].total += item.rating;
-                genreStats[item.genre].count++;
+                genreStats[genre].total += cells.rating_sum[i];
+                genreStats[genre].count += cells.count[i];
             });
 
             const genres = Object.keys(genreStats);
@@ -498,10 +508,47 @@
             });
         }
 
+        // Least-squares trend of rating on runtime from the selected cells' sums
+        function selectionTrend() {
+            const cells = aggregates.cells;
+            let n = 0, sx = 0, sy = 0, sxx = 0, sxy = 0, syy = 0;
+            selection.cells.forEach(i => {
+                n += cells.count[i];
+                sx += cells.runtime_sum[i];
+                sy += cells.rating_sum[i];
+                sxx += cells.runtime_sq_sum[i];
+                sxy += cells.runtime_rating_sum[i];
+                syy += cells.rating_sq_sum[i];
+            });
+            const varX = sxx - sx * sx / n;
+            const covXY = sxy - sx * sy / n;
+            const varY = syy - sy * sy / n;
+            const slope = covXY / varX;
+            return { slope: slope, intercept: (sy - slope * sx) / n, r: covXY / Math.sqrt(varX * varY) };
+        }
+
         function createScatterPlot() {
             const container = d3.select("#scatterPlot");
             container.selectAll("*").remove();
 
+            // Density bins of the selected genres/years; a rating floor keeps every bin that reaches it
+            const density = aggregates.scatter_density;
+            const xEdges = density.runtime_edges;
+            const yEdges = density.rating_edges;
+            const binCounts = new Map();
+            for (let i = 0; i < density.count.length; i++) {
+                if ((selection.genre < 0 || density.genre[i] === selection.genre) &&
+                    density.year[i] >= selection.minYear && yEdges[density.rating_bin[i] + 1] > selection.minRating) {
+                    const key = density.rating_bin[i] * xEdges.length + density.runtime_bin[i];
+                    binCounts.set(key, (binCounts.get(key) || 0) + density.count[i]);
+                }
+            }
+            const bins = [...binCounts].map(([key, count]) => ({
+                ix: key % xEdges.length,
+                iy: Math.floor(key / xEdges.length),
+                count: count
+            }));
+
             const margin = {top: 20, right: 20, bottom: 40, left: 50};
             const width = container.node().offsetWidth - margin.left - margin.right;
             const height = 400 - margin.top - margin.bottom;
@@ -514,16 +561,15 @@
                 .attr("transform", `translate(${margin.left},${margin.top})`);
 
             const xScale = d3.scaleLinear()
-                .domain(d3.extent(filteredData, d => d.runtime))
+                .domain([d3.min(bins, d => xEdges[d.ix]), d3.max(bins, d => xEdges[d.ix + 1])])
                 .range([0, width]);
 
             const yScale = d3.scaleLinear()
-                .domain(d3.extent(filteredData, d => d.rating))
+                .domain([d3.min(bins, d => yEdges[d.iy]), d3.max(bins, d => yEdges[d.iy + 1])])
                 .range([height, 0]);
 
-            const colorScale = d3.scaleOrdinal()
-                .domain(['Movie', 'Series'])
-                .range(['#e50914', '#ff6b6b']);
+            const colorScale = d3.scaleSequential(d3.interpolateReds)
+                .domain([0, d3.max(bins, d => d.count) || 1]);
 
             // Add axes
             g.append("g")
@@ -558,27 +604,24 @@
                 .attr("class", "tooltip")
                 .style("opacity", 0);
 
-            // Add circles
-            g.selectAll(".dot")
-                .data(filteredData)
-                .enter().append("circle")
-                .attr("class", "dot")
-                .attr("r", 6)
-                .attr("cx", d => xScale(d.runtime))
-                .attr("cy", d => yScale(d.rating))
-                .style("fill", d => colorScale(d.type))
-                .style("opacity", 0.7)
-                .style("stroke", "#ffffff")
-                .style("stroke-width", 1)
+            // One rectangle per non-empty bin, coloured by title count
+            g.selectAll(".bin")
+                .data(bins)
+                .enter().append("rect")
+                .attr("class", "bin")
+                .attr("x", d => xScale(xEdges[d.ix]))
+                .attr("y", d => yScale(yEdges[d.iy + 1]))
+                .attr("width", d => Math.max(xScale(xEdges[d.ix + 1]) - xScale(xEdges[d.ix]), 1))
+                .attr("height", d => Math.max(yScale(yEdges[d.iy]) - yScale(yEdges[d.iy + 1]), 1))
+                .style("fill", d => colorScale(d.count))
+                .style("opacity", 0.9)
                 .on("mouseover", function(event, d) {
                     tooltip.transition()
                         .duration(200)
                         .style("opacity", .9);
-                    tooltip.html(`<strong>${d.title}</strong><br/>
-                                Rating: ${d.rating}<br/>
-                                Runtime: ${d.runtime} min<br/>
-                                Genre: ${d.genre}<br/>
-                                Year: ${d.year}`)
+                    tooltip.html(`<strong>${d.count} titles</strong><br/>
+                                Runtime: ${xEdges[d.ix]}-${xEdges[d.ix + 1]} min<br/>
+                                Rating: ${yEdges[d.iy].toFixed(1)}-${yEdges[d.iy + 1].toFixed(1)}`)
                         .style("left", (event.pageX + 10) + "px")
                         .style("top", (event.pageY - 28) + "px");
                 })
@@ -588,20 +631,36 @@
                         .style("opacity", 0);
                 });
 
+            // Trend line
+            const trend = selectionTrend();
+            const [x0, x1] = xScale.domain();
+            g.append("line")
+                .attr("x1", xScale(x0))
+                .attr("y1", yScale(trend.slope * x0 + trend.intercept))
+                .attr("x2", xScale(x1))
+                .attr("y2", yScale(trend.slope * x1 + trend.intercept))
+                .style("stroke", "#4ecdc4")
+                .style("stroke-width", 2)
+                .style("stroke-dasharray", "6,4");
+
             // Create legend
             const legend = d3.select("#scatterLegend");
             legend.selectAll("*").remove();
-            
-            ['Movie', 'Series'].forEach(type => {
+
+            [
+                { label: 'Fewer titles', color: colorScale(colorScale.domain()[1] * 0.15) },
+                { label: 'More titles', color: colorScale(colorScale.domain()[1]) },
+                { label: `Trend (r = ${trend.r.toFixed(2)})`, color: '#4ecdc4' }
+            ].forEach(item => {
                 const legendItem = legend.append("div")
                     .attr("class", "legend-item");
                 
                 legendItem.append("div")
                     .attr("class", "legend-color")
-                    .style("background-color", colorScale(type));
+                    .style("background-color", item.color);
                 
                 legendItem.append("span")
-                    .text(type);
+                    .text(item.label);
             });
         }
 
@@ -612,12 +671,13 @@
                 charts.time.destroy();
             }
 
+            const cells = aggregates.cells;
             const yearData = {};
-            filteredData.forEach(item => {
-                if (!yearData[item.year]) {
-                    yearData[item.year] = 0;
+            selection.cells.forEach(i => {
+                if (!yearData[cells.year[i]]) {
+                    yearData[cells.year[i]] = 0;
                 }
-                yearData[item.year]++;
+                yearData[cells.year[i]] += cells.count[i];
             });
 
             const years = Object.keys(yearData).sort();
@@ -667,7 +727,7 @@
                 charts.topRated.destroy();
             }
 
-            const topRated = filteredData
+            const topRated = selection.topTitles
                 .sort((a, b) => b.rating - a.rating)
                 .slice(0, 8);
 
@@ -715,8 +775,10 @@
 
         // Initialize the dashboard
         document.addEventListener('DOMContentLoaded', function() {
-            initializeFilters();
-            updateVisualizations();
+            loadAggregates().then(() => {
+                initializeFilters();
+                updateVisualizations();
+            });
         });
     </script>
 </body>
@@ -0,0 +1,227 @@
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+# NETFLIX_TRACE=<path> turns tracing on for the whole run and writes the trace
+# there at exit ({pid} in the path keeps traces from several processes apart);
+# NETFLIX_TRACE_MEMORY=1 also tracks Python allocations per span
+TRACE_ENV_VAR = 'NETFLIX_TRACE'
+TRACE_MEMORY_ENV_VAR = 'NETFLIX_TRACE_MEMORY'
+
+_DISABLED_SPAN = nullcontext()
+
+
+def peak_rss_mb():
+    """Process-wide peak resident set size in MB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return round(peak / (1024 ** 2 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _row_count(args):
+    """Best-effort row count from a call's leading arguments (a DataFrame or an object holding .df)"""
+    for arg in args[:2]:
+        shape = getattr(arg, 'shape', None)
+        if shape:
+            return int(shape[0])
+        frame = getattr(arg, 'df', None)
+        if getattr(frame, 'shape', None):
+            return int(frame.shape[0])
+    return None
+
+
+class _Span:
+    """One timed region; becomes a Chrome-trace complete ('X') event on exit"""
+
+    def __init__(self, tracer, name, rows, args):
+        self.tracer = tracer
+        self.name = name
+        self.rows = rows
+        self.args = args
+        self.alloc_peak = 0
+
+    def __enter__(self):
+        tracer = self.tracer
+        if tracer.track_allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            if tracer.stack:
+                parent = tracer.stack[-1]
+                parent.alloc_peak = max(parent.alloc_peak, peak)
+            tracemalloc.reset_peak()
+            self.alloc_start = current
+        tracer.stack.append(self)
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall_end = time.perf_counter_ns()
+        cpu_s = time.process_time() - self.cpu_start
+        tracer = self.tracer
+        tracer.stack.pop()
+
+        args = dict(self.args)
+        args['cpu_ms'] = round(cpu_s * 1000, 3)
+        args['peak_rss_mb'] = peak_rss_mb()
+        if self.rows is not None:
+            args['rows'] = self.rows
+        if tracer.track_allocations:
+            self.alloc_peak = max(self.alloc_peak, tracemalloc.get_traced_memory()[1])
+            args['peak_alloc_mb'] = round((self.alloc_peak - self.alloc_start) / 1024 ** 2, 3)
+            if tracer.stack:
+                parent = tracer.stack[-1]
+                parent.alloc_peak = max(parent.alloc_peak, self.alloc_peak)
+            tracemalloc.reset_peak()
+        if exc_type is not None:
+            args['error'] = exc_type.__name__
+
+        tracer.events.append({
+            'name': self.name,
+            'cat': 'stage' if len(tracer.stack) == 0 else 'method',
+            'ph': 'X',
+            'ts': (self.wall_start - tracer.origin_ns) / 1000,
+            'dur': (wall_end - self.wall_start) / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': args
+        })
+        return False
+
+
+class StageTracer:
+    """Collects spans and writes them as a Chrome trace (chrome://tracing, Perfetto)"""
+
+    def __init__(self):
+        self.enabled = False
+        self.track_allocations = False
+        self.output_path = None
+        self.events = []
+        self.stack = []
+        self.origin_ns = time.perf_counter_ns()
+
+    def enable(self, output_path=None, track_allocations=False):
+        self.enabled = True
+        self.output_path = output_path
+        self.track_allocations = track_allocations
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        self.enabled = False
+        if self.track_allocations and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.track_allocations = False
+
+    def span(self, name, rows=None, **args):
+        """Context manager timing one region (a shared no-op when tracing is off)"""
+        if not self.enabled:
+            return _DISABLED_SPAN
+        return _Span(self, name, rows, args)
+
+    def write(self, path=None):
+        """Write the collected spans as Chrome-trace JSON"""
+        path = (path or self.output_path or 'trace.json').format(pid=os.getpid())
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+        print(f"🧭 Trace with {len(self.events)} spans written to {path}")
+        return path
+
+    def summary(self, top=15):
+        """Print total wall and CPU time per span name, slowest first"""
+        totals = {}
+        for event in self.events:
+            total = totals.setdefault(event['name'], {'calls': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0, 'rows': 0})
+            total['calls'] += 1
+            total['wall_ms'] += event['dur'] / 1000
+            total['cpu_ms'] += event['args']['cpu_ms']
+            total['rows'] = max(total['rows'], event['args'].get('rows') or 0)
+
+        print("⏱️  SPAN SUMMARY")
+        print("-" * 78)
+        print("{:<40} {:>6} {:>12} {:>12} {:>10}".format("Span", "Calls", "Wall (ms)", "CPU (ms)", "Rows"))
+        ranked = sorted(totals.items(), key=lambda item: item[1]['wall_ms'], reverse=True)
+        for name, total in ranked[:top]:
+            print("{:<40} {:>6} {:>12.1f} {:>12.1f} {:>10,}".format(
+                name[:40], total['calls'], total['wall_ms'], total['cpu_ms'], total['rows']))
+        return totals
+
+
+TRACER = StageTracer()
+
+
+def span(name, rows=None, **args):
+    """Time a region on the global tracer"""
+    return TRACER.span(name, rows, **args)
+
+
+def traced(name=None, rows=None):
+    """Decorator that wraps every call in a span
+
+    `rows` is an optional callable receiving the call's arguments and
+    returning the row count; by default it is read from a DataFrame argument
+    or from `self.df`.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            row_count = rows(*args, **kwargs) if rows is not None else _row_count(args)
+            with _Span(TRACER, span_name, row_count, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable_tracing(output_path=None, track_allocations=False):
+    TRACER.enable(output_path, track_allocations)
+
+
+def disable_tracing():
+    TRACER.disable()
+
+
+def _write_at_exit():
+    if TRACER.events:
+        TRACER.write()
+
+
+# The module-level tracer is configured once, in the imported module (not in
+# a copy run as __main__)
+if os.environ.get(TRACE_ENV_VAR) and __name__ != "__main__":
+    enable_tracing(os.environ[TRACE_ENV_VAR], track_allocations=os.environ.get(TRACE_MEMORY_ENV_VAR) == '1')
+    atexit.register(_write_at_exit)
+
+
+# Example usage: NETFLIX_TRACE=trace.json python Stage_Instrumentation.py
+if __name__ == "__main__":
+    # Use the imported module so these spans share the tracer the decorated methods report to
+    import Stage_Instrumentation as instrumentation
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+    from Handling_Outliers_and_Data_Transformations import NetflixOutlierHandler
+
+    if not instrumentation.TRACER.enabled:
+        instrumentation.enable_tracing('stage_trace.json')
+
+    with instrumentation.span('outlier_stage'):
+        df = NetflixCatalogueGenerator(n_rows=200_000, seed=42, outlier_rate=0.01).to_frame()
+        df = df.rename(columns={'IMDb_Rating': 'IMDB Score', 'Runtime_Minutes': 'Runtime'})
+        handler = NetflixOutlierHandler(df)
+        handler.analyze_outliers(['IMDB Score', 'Runtime'])
+        handler.apply_transformations(['IMDB Score', 'Runtime'])
+
+    instrumentation.TRACER.summary()
+    if os.environ.get(TRACE_ENV_VAR) is None:
+        instrumentation.TRACER.write()
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+from Stage_Instrumentation import traced
+
+# Points drawn by a point-level plot (scatter, per-title heatmap rows); more
+# than this are sampled, fewer are drawn in full
+PLOT_SAMPLE_SIZE = 5_000
+
+# Strata every sample keeps in proportion (and keeps at least one title of)
+SAMPLE_STRATA = ['Genre', 'Release_Year']
+
+# Rows scanned per chunk of the single pass
+SAMPLE_CHUNK_ROWS = 1_000_000
+
+_KEY = '_sample_key'
+
+
+@traced()
+def stratified_sample(df, size=PLOT_SAMPLE_SIZE, strata=None, columns=None, seed=42, chunk_rows=SAMPLE_CHUNK_ROWS):
+    """Reservoir sample of about `size` rows, stratified by `strata`, in one chunked pass
+
+    Every row gets a uniform random key and each stratum keeps the rows with
+    the smallest keys seen so far (bottom-k reservoir sampling, at most
+    `size` per stratum). At the end each stratum is cut to its share of
+    `size` by its row count, with at least one row per stratum, so rare
+    genre-year combinations still show up. Frames with at most `size` rows
+    come back whole. Only use the sample for drawing points; means, counts
+    and trends belong on the full data.
+    """
+    strata = [col for col in (SAMPLE_STRATA if strata is None else strata) if col in df.columns]
+    columns = list(df.columns) if columns is None else list(columns)
+    if len(df) <= size:
+        return df[columns]
+    if not strata:
+        return df[columns].sample(n=size, random_state=seed).sort_index()
+
+    rng = np.random.default_rng(seed)
+    kept = list(dict.fromkeys(strata + columns))
+    reservoir = None
+    stratum_sizes = None
+    for start in range(0, len(df), chunk_rows):
+        chunk = df[kept].iloc[start:start + chunk_rows]
+        chunk = chunk.assign(**{_KEY: rng.random(len(chunk))})
+        sizes = chunk.groupby(strata, observed=True, dropna=False).size()
+        stratum_sizes = sizes if stratum_sizes is None else stratum_sizes.add(sizes, fill_value=0)
+
+        pool = chunk if reservoir is None else pd.concat([reservoir, chunk])
+        pool = pool.sort_values(_KEY, kind='stable')
+        reservoir = pool.groupby(strata, observed=True, dropna=False, sort=False).head(size)
+
+    # Proportional quota per stratum, then the smallest keys up to the quota
+    quotas = np.maximum(1, np.round(stratum_sizes * size / stratum_sizes.sum())).astype(int)
+    rank = reservoir.groupby(strata, observed=True, dropna=False, sort=False).cumcount().to_numpy()
+    quota = quotas.reindex(pd.MultiIndex.from_frame(reservoir[strata]) if len(strata) > 1
+                           else reservoir[strata[0]]).to_numpy()
+    sample = reservoir[rank < quota]
+    return sample[columns].sort_index()
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    print("🎯 STRATIFIED PLOT SAMPLES")
+    for n_rows in [50_000, 500_000, 2_000_000]:
+        df = NetflixCatalogueGenerator(n_rows=n_rows, seed=42).to_frame()
+        start = time.perf_counter()
+        sample = stratified_sample(df, columns=['Runtime_Minutes', 'IMDb_Rating'])
+        sample_ms = (time.perf_counter() - start) * 1000
+
+        full_share = df.groupby(SAMPLE_STRATA).size() / len(df)
+        strata = df.loc[sample.index].groupby(SAMPLE_STRATA).size() / len(sample)
+        drift = (strata.reindex(full_share.index, fill_value=0) - full_share).abs().max()
+        print(f"   {n_rows:>9,} titles -> {len(sample):,} points in {sample_ms:.0f} ms; "
+              f"{strata.size}/{full_share.size} strata, max share drift {drift:.4f}; "
+              f"mean rating {df['IMDb_Rating'].mean():.3f} (sample {sample['IMDb_Rating'].mean():.3f})")
+
+    again = stratified_sample(df, columns=['IMDb_Rating'])
+    print(f"✅ Reproducible from the seed: {again.index.equals(sample.index)}")
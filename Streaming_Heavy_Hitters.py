@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+from Stage_Instrumentation import traced
+
+# Counters kept per column; columns with at most this many distinct values
+# are counted exactly
+HEAVY_HITTER_CAPACITY = 1_000
+
+# Rows counted per chunk: the summary keeps `capacity` counters between
+# chunks, and one chunk's value_counts() is the only other working memory.
+# Columns that fit in one chunk are counted exactly with a plain value_counts()
+HEAVY_HITTER_CHUNK_ROWS = 1_000_000
+
+
+class HeavyHitterSketch:
+    """Mergeable SpaceSaving summary of the most frequent values of a column
+
+    At most `capacity` counters are kept. A tracked value's count is an
+    upper bound that overestimates by at most its error; an untracked value
+    occurs at most `min_count()` times. Until a value has been evicted the
+    counts are exact.
+    """
+
+    def __init__(self, capacity=HEAVY_HITTER_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.n_rows = 0
+        self.is_exact = True
+
+    @classmethod
+    def from_values(cls, values, capacity=HEAVY_HITTER_CAPACITY):
+        """Build a summary from one chunk of a column"""
+        values = pd.Series(values)
+        sketch = cls(capacity)
+        counts = values.value_counts(dropna=True)
+        sketch.counts = counts.astype(np.int64)
+        sketch.errors = pd.Series(0, index=counts.index, dtype=np.int64)
+        sketch.n_rows = len(values)
+        sketch._truncate()
+        return sketch
+
+    def _truncate(self):
+        """Keep the `capacity` largest counters"""
+        if len(self.counts) > self.capacity:
+            keep = self.counts.nlargest(self.capacity, keep='first').index
+            self.counts = self.counts.loc[keep]
+            self.errors = self.errors.loc[keep]
+            self.is_exact = False
+
+    def min_count(self):
+        """Upper bound on the count of any value that is not tracked"""
+        return int(self.counts.min()) if len(self.counts) >= self.capacity else 0
+
+    def update(self, values):
+        """Add one chunk of values"""
+        merged = self.merge(HeavyHitterSketch.from_values(values, self.capacity))
+        self.__dict__.update(merged.__dict__)
+        return self
+
+    def merge(self, other):
+        """Combine two summaries (e.g. of two chunks); values missing from a full
+        summary are credited with its min_count(), as mergeable SpaceSaving requires"""
+        merged = HeavyHitterSketch(self.capacity)
+        index = self.counts.index.union(other.counts.index, sort=False)
+        own_floor, other_floor = self.min_count(), other.min_count()
+        merged.counts = (self.counts.reindex(index, fill_value=own_floor) +
+                         other.counts.reindex(index, fill_value=other_floor))
+        merged.errors = (self.errors.reindex(index, fill_value=own_floor) +
+                         other.errors.reindex(index, fill_value=other_floor))
+        merged.n_rows = self.n_rows + other.n_rows
+        merged.is_exact = self.is_exact and other.is_exact
+        merged._truncate()
+        return merged
+
+    def top(self, k=10):
+        """Top-k values with counts, shares of all rows and the maximum overcount"""
+        order = np.lexsort((np.arange(len(self.counts)), -self.counts.to_numpy()))[:k]
+        counts = self.counts.iloc[order]
+        return pd.DataFrame({
+            'Count': counts,
+            'Percentage': (counts / self.n_rows * 100).round(1) if self.n_rows else counts * 0.0,
+            'Max_Error': self.errors.iloc[order]
+        })
+
+
+@traced()
+def heavy_hitters(values, capacity=HEAVY_HITTER_CAPACITY, chunk_rows=HEAVY_HITTER_CHUNK_ROWS):
+    """SpaceSaving summary of a column built in one chunked pass"""
+    values = pd.Series(values)
+    sketch = HeavyHitterSketch(capacity)
+    for start in range(0, len(values), chunk_rows):
+        sketch.update(values.iloc[start:start + chunk_rows])
+    return sketch
+
+
+def top_counts(values, k=10, capacity=HEAVY_HITTER_CAPACITY, chunk_rows=HEAVY_HITTER_CHUNK_ROWS):
+    """Drop-in for value_counts().head(k), backed by the streaming summary above chunk_rows rows"""
+    values = pd.Series(values)
+    if len(values) <= chunk_rows:
+        # One chunk would be counted exactly anyway; skip the summary's bookkeeping
+        return values.value_counts().head(k)
+    counts = heavy_hitters(values, capacity, chunk_rows).top(k)['Count']
+    counts.name = 'count'
+    counts.index.name = values.name
+    return counts
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Synthetic_Catalogue_Generator import NetflixCatalogueGenerator
+
+    df = NetflixCatalogueGenerator(n_rows=2_000_000, seed=42).to_frame()
+
+    for col in ['Language', 'Genre']:
+        exact = df[col].value_counts().head(8)
+        streamed = top_counts(df[col], 8, chunk_rows=250_000)
+        print(f"✅ {col} top 8 exact: {streamed.sort_index().equals(exact.sort_index())}")
+
+    # The dashboard's language panel: one filtered view per query, counted exactly
+    view = df.loc[df['Genre'] == 'Drama', 'Language'].iloc[:20_000]
+    runs = 200
+    start = time.perf_counter()
+    for _ in range(runs):
+        top_counts(view, 8)
+    panel_ms = (time.perf_counter() - start) * 1000 / runs
+    start = time.perf_counter()
+    for _ in range(runs):
+        view.value_counts().head(8)
+    print(f"⏱️  Language panel ({len(view):,} titles): top_counts {panel_ms:.2f} ms, "
+          f"value_counts().head(8) {(time.perf_counter() - start) * 1000 / runs:.2f} ms")
+
+    # A skewed high-cardinality column: director-style IDs with a Zipf tail
+    rng = np.random.default_rng(0)
+    ids = pd.Series(rng.zipf(1.3, len(df)) % 500_000, name='Director_ID')
+
+    import tracemalloc
+    tracemalloc.start()
+    start = time.perf_counter()
+    sketch = heavy_hitters(ids, chunk_rows=250_000)
+    sketch_ms = (time.perf_counter() - start) * 1000
+    sketch_mb = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    exact = ids.value_counts()
+    exact_ms = (time.perf_counter() - start) * 1000
+    exact_mb = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+
+    top = sketch.top(10)
+    top['Exact'] = exact.reindex(top.index).to_numpy()
+    print(f"\n🔥 Top 10 of {exact.size:,} distinct values ({sketch.capacity} counters, exact: {sketch.is_exact}):")
+    print(top)
+    within = ((top['Count'] >= top['Exact']) & (top['Count'] - top['Max_Error'] <= top['Exact'])).all()
+    print(f"\n✅ Every count within its error bound: {within}")
+    print(f"✅ Same top 10: {list(top.index) == list(exact.index[:10])}")
+    print(f"⏱️  Streaming summary: {sketch_ms:.0f} ms (peak {sketch_mb:.1f} MB), "
+          f"full value_counts(): {exact_ms:.0f} ms (peak {exact_mb:.1f} MB)")
@@ -0,0 +1,158 @@
+import pandas as pd
+import numpy as np
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from Lazy_Imports import lazy_import
+from Stage_Instrumentation import traced
+
+# pyarrow is only needed when writing Parquet
+pa = lazy_import('pyarrow')
+pq = lazy_import('pyarrow.parquet')
+
+GENRES = ['Drama', 'Comedy', 'Action', 'Thriller', 'Horror', 'Romance', 'Sci-Fi',
+          'Documentary', 'Animation', 'Crime']
+LANGUAGES = ['English', 'Spanish', 'French', 'German', 'Italian', 'Portuguese',
+             'Japanese', 'Korean', 'Hindi', 'Mandarin']
+CONTENT_TYPES = ['Movie', 'TV Series', 'Limited Series', 'Documentary']
+LANGUAGE_COUNTRY = {
+    'English': 'United States', 'Spanish': 'Spain', 'French': 'France', 'German': 'Germany',
+    'Italian': 'Italy', 'Portuguese': 'Brazil', 'Japanese': 'Japan', 'Korean': 'South Korea',
+    'Hindi': 'India', 'Mandarin': 'China'
+}
+
+# Columns that receive injected nulls / outliers
+NULLABLE_COLUMNS = ['IMDb_Rating', 'Budget_Million_USD', 'Netflix_Views_Million', 'Director_Experience_Years']
+OUTLIER_COLUMNS = ['IMDb_Rating', 'Runtime_Minutes', 'Budget_Million_USD', 'Netflix_Views_Million']
+
+
+class NetflixCatalogueGenerator:
+    def __init__(self, n_rows=500, chunk_size=1_000_000, seed=42, null_rate=0.0, outlier_rate=0.0,
+                 start_date='2015-01-01', end_date='2024-12-31'):
+        self.n_rows = int(n_rows)
+        self.chunk_size = int(chunk_size)
+        self.seed = seed
+        self.null_rate = null_rate
+        self.outlier_rate = outlier_rate
+        self.start_date = np.datetime64(start_date, 'D')
+        self.n_days = int((np.datetime64(end_date, 'D') - self.start_date).astype(int)) + 1
+
+        # One independent stream per chunk: any chunk can be generated alone,
+        # in any order or process, and still produce the same rows
+        self.n_chunks = max(1, -(-self.n_rows // self.chunk_size))
+        self.chunk_seeds = np.random.SeedSequence(seed).spawn(self.n_chunks)
+
+    def chunk_bounds(self, chunk_index):
+        """Row range [start, end) covered by one chunk"""
+        start = chunk_index * self.chunk_size
+        return start, min(start + self.chunk_size, self.n_rows)
+
+    def generate_chunk(self, chunk_index):
+        """Generate one chunk of the catalogue"""
+        rng = np.random.default_rng(self.chunk_seeds[chunk_index])
+        start, end = self.chunk_bounds(chunk_index)
+        n = end - start
+
+        release_dates = self.start_date + rng.integers(0, self.n_days, n).astype('timedelta64[D]')
+        languages = rng.choice(LANGUAGES, n)
+        content_types = rng.choice(CONTENT_TYPES, n)
+        is_series = np.isin(content_types, ['TV Series'])
+        seasons = np.where(is_series, rng.integers(1, 6, n), 1)
+        episodes = np.where(content_types == 'Movie', 1, seasons * rng.integers(6, 13, n))
+
+        df = pd.DataFrame({
+            'Title': 'Netflix Original ' + pd.Series(np.arange(start + 1, end + 1)).astype(str),
+            'Genre': rng.choice(GENRES, n),
+            'Release_Date': pd.to_datetime(release_dates),
+            'Runtime_Minutes': rng.normal(120, 30, n).astype(int),
+            'Language': languages,
+            'Country': pd.Series(languages).map(LANGUAGE_COUNTRY).to_numpy(),
+            'Content_Type': content_types,
+            'Seasons': seasons,
+            'Episodes_Total': episodes,
+            'Budget_Million_USD': rng.lognormal(mean=2.5, sigma=0.8, size=n),
+            'IMDb_Rating': rng.normal(6.8, 1.2, n).clip(1, 10),
+            'IMDb_Votes': rng.lognormal(mean=8, sigma=1.5, size=n).astype(int),
+            'Netflix_Views_Million': rng.lognormal(mean=2, sigma=1, size=n),
+            'Director_Experience_Years': rng.exponential(scale=8, size=n).astype(int),
+            'Cast_Rating': rng.normal(7.2, 1.5, n).clip(1, 10)
+        })
+        df['Release_Year'] = df['Release_Date'].dt.year
+        df.index = pd.RangeIndex(start, end)
+
+        if self.outlier_rate > 0:
+            self._inject_outliers(df, rng)
+        if self.null_rate > 0:
+            self._inject_nulls(df, rng)
+        return df
+
+    def _inject_outliers(self, df, rng):
+        """Push a fraction of values far outside the normal range"""
+        n = len(df)
+        for col in OUTLIER_COLUMNS:
+            mask = rng.random(n) < self.outlier_rate
+            k = int(mask.sum())
+            if k == 0:
+                continue
+            if col == 'IMDb_Rating':
+                df.loc[mask, col] = np.where(rng.random(k) < 0.5, rng.uniform(1.0, 2.5, k), rng.uniform(9.6, 10.0, k))
+            elif col == 'Runtime_Minutes':
+                df.loc[mask, col] = np.where(rng.random(k) < 0.5, rng.integers(5, 30, k), rng.integers(250, 400, k))
+            else:
+                df.loc[mask, col] = df.loc[mask, col] * rng.uniform(10, 30, k)
+
+    def _inject_nulls(self, df, rng):
+        """Blank out a fraction of the nullable columns"""
+        n = len(df)
+        for col in NULLABLE_COLUMNS:
+            mask = rng.random(n) < self.null_rate
+            if col == 'Director_Experience_Years':
+                df[col] = df[col].astype(float)
+            df.loc[mask, col] = np.nan
+
+    def iter_chunks(self, n_jobs=1):
+        """Yield the catalogue chunk by chunk (optionally generated in parallel)"""
+        if n_jobs > 1 and self.n_chunks > 1:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                yield from pool.map(self.generate_chunk, range(self.n_chunks))
+        else:
+            for chunk_index in range(self.n_chunks):
+                yield self.generate_chunk(chunk_index)
+
+    @traced(rows=lambda self, *args, **kwargs: self.n_rows)
+    def to_frame(self, n_jobs=1):
+        """Materialize the whole catalogue in memory"""
+        return pd.concat(self.iter_chunks(n_jobs))
+
+    @traced(rows=lambda self, *args, **kwargs: self.n_rows)
+    def to_parquet(self, path, n_jobs=1):
+        """Stream the catalogue to a Parquet file, one row group per chunk"""
+        writer = None
+        try:
+            for chunk in self.iter_chunks(n_jobs):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        size_mb = os.path.getsize(path) / 1024 ** 2
+        print(f"💾 Wrote {self.n_rows:,} titles in {self.n_chunks} chunks to {path} ({size_mb:.1f} MB)")
+        return path
+
+
+# Example usage: python Synthetic_Catalogue_Generator.py [n_rows] [output.parquet]
+if __name__ == "__main__":
+    n_rows = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10_000
+    generator = NetflixCatalogueGenerator(n_rows=n_rows, chunk_size=250_000, seed=42,
+                                          null_rate=0.03, outlier_rate=0.01)
+
+    if len(sys.argv) > 2:
+        generator.to_parquet(sys.argv[2], n_jobs=os.cpu_count() or 1)
+    else:
+        df = generator.to_frame()
+        print(f"✅ Generated {len(df):,} titles")
+        print(df.head())
+        print(f"\n🎯 Missing values:\n{df.isnull().sum()[df.isnull().sum() > 0]}")